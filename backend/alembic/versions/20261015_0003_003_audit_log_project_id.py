@@ -0,0 +1,63 @@
+"""Denormalize project_id onto audit_log
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+Adds audit_log.project_id so a project's activity feed is a single index
+range scan instead of per-row probes into items and workstreams:
+- project_id column (nullable; entries outside any project leave it NULL)
+- (project_id, created_at DESC) index for the feed
+- backfill for existing project, item and workstream entries
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # No foreign key, like entity_id: audit history outlives what it describes
+    op.add_column(
+        "audit_log",
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+
+    # Backfill existing entries from the entities they reference
+    op.execute("""
+        UPDATE audit_log
+        SET project_id = entity_id
+        WHERE entity_type = 'project'
+    """)
+    op.execute("""
+        UPDATE audit_log a
+        SET project_id = i.project_id
+        FROM items i
+        WHERE a.entity_type = 'item' AND a.entity_id = i.id
+    """)
+    op.execute("""
+        UPDATE audit_log a
+        SET project_id = w.project_id
+        FROM workstreams w
+        WHERE a.entity_type = 'workstream' AND a.entity_id = w.id
+    """)
+
+    # Project activity feed: newest entries for one project
+    op.create_index(
+        "idx_audit_log_project_created",
+        "audit_log",
+        ["project_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_log_project_created", table_name="audit_log")
+    op.drop_column("audit_log", "project_id")
@@ -0,0 +1,47 @@
+"""Trigram-indexed search text on audit_log
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+Precomputes the searchable form of each audit entry so activity search is
+an index lookup instead of casting every row's JSONB to text:
+- pg_trgm extension
+- search_text generated column (action plus before/after state text)
+- GIN trigram index on search_text, which serves ILIKE '%term%'
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision identifiers
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Stored, so the text is built once at INSERT rather than per search
+    op.execute("""
+        ALTER TABLE audit_log
+        ADD COLUMN search_text TEXT GENERATED ALWAYS AS (
+            action
+            || ' ' || coalesce(before_state::text, '')
+            || ' ' || coalesce(after_state::text, '')
+        ) STORED
+    """)
+
+    op.execute("""
+        CREATE INDEX idx_audit_log_search_trgm
+        ON audit_log USING gin (search_text gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_log_search_trgm", table_name="audit_log")
+    op.drop_column("audit_log", "search_text")
+    # pg_trgm is left installed; other objects may have come to rely on it
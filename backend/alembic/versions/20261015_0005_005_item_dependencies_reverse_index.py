@@ -0,0 +1,34 @@
+"""Reverse index on item_dependencies
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+The (item_id, depends_on_id) primary key already serves lookups by
+dependent item, including the exact-pair exists() probe as an index-only
+scan. Lookups by prerequisite had no index:
+- (depends_on_id, item_id) for get_dependents and the depends_on_id branch
+  of remove_all_for_item
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision identifiers
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_item_dependencies_depends_on",
+        "item_dependencies",
+        ["depends_on_id", "item_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_item_dependencies_depends_on", table_name="item_dependencies")
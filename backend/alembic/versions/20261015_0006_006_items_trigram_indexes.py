@@ -0,0 +1,52 @@
+"""Trigram indexes for item substring filters
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+Item listing filters match with ILIKE '%term%', which a B-tree cannot
+serve. GIN trigram indexes can, so these filters stop scanning every
+item in the table:
+- assigned_to (assignee filter)
+- title and description (search filter; the OR of the two becomes a
+  BitmapOr over both indexes)
+
+All are partial on deleted_at IS NULL, matching every listing query.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision identifiers
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Already created by 004; repeated so this revision stands on its own
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute("""
+        CREATE INDEX idx_items_assigned_to_trgm
+        ON items USING gin (assigned_to gin_trgm_ops)
+        WHERE deleted_at IS NULL
+    """)
+    op.execute("""
+        CREATE INDEX idx_items_title_trgm
+        ON items USING gin (title gin_trgm_ops)
+        WHERE deleted_at IS NULL
+    """)
+    op.execute("""
+        CREATE INDEX idx_items_description_trgm
+        ON items USING gin (description gin_trgm_ops)
+        WHERE deleted_at IS NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_items_description_trgm", table_name="items")
+    op.drop_index("idx_items_title_trgm", table_name="items")
+    op.drop_index("idx_items_assigned_to_trgm", table_name="items")
@@ -0,0 +1,47 @@
+"""Full-text search vector on items
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+Multi-word item searches match on words rather than one literal
+substring, so they are served by full-text search:
+- search_tsv generated column (English tsvector of title and description)
+- GIN index on search_tsv, partial on deleted_at IS NULL
+
+Single-word searches keep using the trigram indexes from 006.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision identifiers
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored, so the vector is built once per write rather than per search
+    op.execute("""
+        ALTER TABLE items
+        ADD COLUMN search_tsv tsvector GENERATED ALWAYS AS (
+            to_tsvector(
+                'english',
+                coalesce(title, '') || ' ' || coalesce(description, '')
+            )
+        ) STORED
+    """)
+
+    op.execute("""
+        CREATE INDEX idx_items_search_tsv
+        ON items USING gin (search_tsv)
+        WHERE deleted_at IS NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_items_search_tsv", table_name="items")
+    op.drop_column("items", "search_tsv")
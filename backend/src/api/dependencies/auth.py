@@ -11,24 +11,124 @@ Usage:
         return {"user_id": str(user.id)}
 """
 
-from typing import Annotated, Optional
+import hashlib
+import time
+from functools import lru_cache
+from typing import Annotated, Awaitable, Callable, Collection, Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
+from src.api.dependencies.params import ProjectIdPath
 from src.domain.auth import CurrentUser, TokenPayload, OrgRole, ProjectRole
 from src.utils.jwt import decode_access_token
+from src.utils.cache import TTLCache
 from src.utils.exceptions import AuthenticationError
 from src.utils.logging import get_logger
 from src.repositories.user_project_role_repository import UserProjectRoleRepository
 from src.services import services
+from src.services.aurora_service import AuroraService
 
 logger = get_logger(__name__)
 
 # HTTP Bearer token scheme
 security = HTTPBearer(auto_error=False)
 
+# =============================================================================
+# SHARED REJECTIONS
+# =============================================================================
+# Rejections with fixed details are built once rather than per request.
+# Always raise them as `raise _EXC.with_traceback(None)`: re-raising the same
+# instance otherwise appends each new traceback (and the frames it pins) to
+# the one left by the previous raise.
+# =============================================================================
+
+_AUTH_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+_NOT_AUTHENTICATED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Not authenticated",
+    headers=_AUTH_HEADERS,
+)
+_NO_ORG_CONTEXT = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="No organization context",
+)
+_INSUFFICIENT_PERMISSIONS = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Insufficient permissions",
+)
+_NO_PROJECT_ACCESS = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="No access to this project",
+)
+_INSUFFICIENT_PROJECT_PERMISSIONS = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Insufficient project permissions",
+)
+
+
+# =============================================================================
+# TOKEN RESOLUTION
+# =============================================================================
+# Clients replay the same bearer token on every request, so the resolved
+# (frozen) CurrentUser is cached by SHA-256 of the raw token - cache hits
+# skip UUID/OrgRole construction entirely. Entries live at most
+# 30 seconds and never outlive the token's own expiry.
+# Failed validations are never cached. Cache misses verify the signature in
+# the threadpool so concurrent requests don't serialize on the event loop.
+# =============================================================================
+
+TOKEN_CACHE_TTL_SECONDS = 30
+
+_token_cache: TTLCache[str, CurrentUser] = TTLCache(
+    maxsize=10000,
+    ttl=TOKEN_CACHE_TTL_SECONDS,
+)
+
+
+async def _resolve_user(token: str) -> CurrentUser:
+    """
+    Resolve a bearer token to a CurrentUser, using the token cache.
+
+    Args:
+        token: Raw JWT string from the Authorization header
+
+    Returns:
+        CurrentUser built from the token claims
+
+    Raises:
+        HTTPException: 401 if token is invalid or expired
+    """
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    user = _token_cache.get(cache_key)
+    if user is not None:
+        return user
+
+    try:
+        # Decode and validate JWT
+        payload = await run_in_threadpool(decode_access_token, token)
+    except AuthenticationError as e:
+        logger.debug("authentication_failed", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers=_AUTH_HEADERS,
+        )
+
+    # Build CurrentUser from token claims
+    user = CurrentUser(
+        id=UUID(payload["sub"]),
+        email=payload["email"],
+        name=payload.get("name", ""),
+        org_id=UUID(payload["org_id"]) if payload.get("org_id") else None,
+        org_role=OrgRole(payload["org_role"]) if payload.get("org_role") else None,
+    )
+    _token_cache.set(cache_key, user, ttl=payload["exp"] - time.time())
+    return user
+
 
 async def get_current_user(
     credentials: Annotated[
@@ -56,39 +156,13 @@ async def get_current_user(
         HTTPException: 401 if not authenticated
     """
     if credentials is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    try:
-        # Decode and validate JWT
-        payload = decode_access_token(credentials.credentials)
-
-        # Build CurrentUser from token claims
-        return CurrentUser(
-            id=UUID(payload["sub"]),
-            email=payload["email"],
-            name=payload.get("name", ""),
-            org_id=UUID(payload["org_id"]) if payload.get("org_id") else None,
-            org_role=OrgRole(payload["org_role"]) if payload.get("org_role") else None,
-        )
+        raise _NOT_AUTHENTICATED.with_traceback(None)
 
-    except AuthenticationError as e:
-        logger.debug("authentication_failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    return await _resolve_user(credentials.credentials)
 
 
 async def get_optional_user(
-    credentials: Annotated[
-        Optional[HTTPAuthorizationCredentials],
-        Depends(security),
-    ],
+    authorization: Annotated[Optional[str], Header()] = None,
 ) -> Optional[CurrentUser]:
     """
     Extract current user if token is present, otherwise return None.
@@ -96,6 +170,10 @@ async def get_optional_user(
     Does not raise if token is missing - returns None instead.
     Still raises if token is present but invalid.
 
+    Reads the Authorization header directly rather than through the
+    HTTPBearer security dependency, so anonymous requests cost a single
+    header lookup.
+
     Usage:
         @router.get("/public")
         async def public_route(user: Optional[CurrentUser] = Depends(get_optional_user)):
@@ -104,7 +182,7 @@ async def get_optional_user(
             return {"greeting": "Hello guest"}
 
     Args:
-        credentials: Bearer token from Authorization header (optional)
+        authorization: Raw Authorization header value (optional)
 
     Returns:
         CurrentUser if authenticated, None otherwise
@@ -112,28 +190,16 @@ async def get_optional_user(
     Raises:
         HTTPException: 401 if token present but invalid
     """
-    if credentials is None:
+    if not authorization:
         return None
 
-    try:
-        payload = decode_access_token(credentials.credentials)
-
-        return CurrentUser(
-            id=UUID(payload["sub"]),
-            email=payload["email"],
-            name=payload.get("name", ""),
-            org_id=UUID(payload["org_id"]) if payload.get("org_id") else None,
-            org_role=OrgRole(payload["org_role"]) if payload.get("org_role") else None,
-        )
+    # Same parsing as HTTPBearer: anything but "Bearer <token>" is anonymous
+    scheme, _, token = authorization.partition(" ")
+    if not token or scheme.lower() != "bearer":
+        return None
 
-    except AuthenticationError as e:
-        # Token present but invalid - still raise
-        logger.debug("authentication_failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    # Token present but invalid - still raises
+    return await _resolve_user(token)
 
 
 # Type aliases for cleaner route signatures
@@ -144,6 +210,17 @@ OptionalAuth = Annotated[Optional[CurrentUser], Depends(get_optional_user)]
 # =============================================================================
 # ROLE-BASED DEPENDENCIES
 # =============================================================================
+# Checker factories are memoized by their role set. FastAPI caches resolved
+# dependencies per request by callable identity, so routes that build the
+# same checker inline share one callable (and one resolution) instead of
+# getting a fresh closure each time. Allowed roles are frozen once at
+# factory time so each request does an O(1) membership test.
+# =============================================================================
+
+_org_role_checkers: dict[frozenset[OrgRole], Callable[..., Awaitable[None]]] = {}
+_project_role_checkers: dict[
+    frozenset[ProjectRole], Callable[..., Awaitable[ProjectRole]]
+] = {}
 
 
 def require_org_role(allowed_roles: list[OrgRole]):
@@ -165,19 +242,18 @@ def require_org_role(allowed_roles: list[OrgRole]):
     Returns:
         Dependency function
     """
+    allowed = frozenset(allowed_roles)
+    cached = _org_role_checkers.get(allowed)
+    if cached is not None:
+        return cached
 
     async def check_role(user: RequireAuth) -> None:
         if user.org_role is None:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="No organization context",
-            )
-        if user.org_role not in allowed_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient permissions",
-            )
+            raise _NO_ORG_CONTEXT.with_traceback(None)
+        if user.org_role not in allowed:
+            raise _INSUFFICIENT_PERMISSIONS.with_traceback(None)
 
+    _org_role_checkers[allowed] = check_role
     return check_role
 
 
@@ -190,6 +266,142 @@ require_org_member = require_org_role([OrgRole.OWNER, OrgRole.ADMIN, OrgRole.MEM
 # =============================================================================
 # PROJECT-LEVEL DEPENDENCIES
 # =============================================================================
+# Every project check needs the same fact: the user's role on the project.
+# Path-based checkers all depend on _resolve_project_role, which FastAPI
+# resolves once per request, so stacking several checkers on one route costs
+# a single query. Allowed roles are then compared in Python.
+#
+# Lookups (including "no role") are also cached in-process for 15 seconds,
+# so bursts of project requests from one client skip the query entirely.
+# Role changes therefore take up to PROJECT_ROLE_CACHE_TTL_SECONDS to apply.
+#
+# High-volume list routes can skip the dependency and fetch the role inside
+# their own query instead: peek_project_role on entry, remember_project_role
+# with the role the query returned.
+# =============================================================================
+
+PROJECT_ROLE_CACHE_TTL_SECONDS = 15
+
+_project_role_cache: TTLCache[tuple[UUID, UUID], Optional[ProjectRole]] = TTLCache(
+    maxsize=50000,
+    ttl=PROJECT_ROLE_CACHE_TTL_SECONDS,
+)
+_MISSING = object()
+
+
+@lru_cache(maxsize=1)
+def _role_repo_for(aurora: AuroraService) -> UserProjectRoleRepository:
+    """Shared role repository, rebuilt only if the Aurora service changes."""
+    return UserProjectRoleRepository(aurora)
+
+
+async def _lookup_project_role(
+    user_id: UUID,
+    project_id: UUID,
+) -> Optional[ProjectRole]:
+    """
+    Fetch a user's role on a project, via the short-TTL role cache.
+
+    Args:
+        user_id: User UUID.
+        project_id: Project UUID.
+
+    Returns:
+        ProjectRole if user has a role on the project, None otherwise.
+    """
+    cache_key = (user_id, project_id)
+    role = _project_role_cache.get(cache_key, _MISSING)
+    if role is not _MISSING:
+        return role
+
+    repo = _role_repo_for(services.aurora)
+    role = await repo.get_user_role(user_id, project_id)
+    _project_role_cache.set(cache_key, role)
+    return role
+
+
+def peek_project_role(
+    user_id: UUID,
+    project_id: UUID,
+) -> tuple[bool, Optional[ProjectRole]]:
+    """
+    Read a user's role on a project from the role cache, without querying.
+
+    Args:
+        user_id: User UUID.
+        project_id: Project UUID.
+
+    Returns:
+        (True, role) on a cache hit - role is None if the user has no
+        access - or (False, None) on a miss.
+    """
+    role = _project_role_cache.get((user_id, project_id), _MISSING)
+    if role is _MISSING:
+        return False, None
+    return True, role
+
+
+def remember_project_role(
+    user_id: UUID,
+    project_id: UUID,
+    role: Optional[ProjectRole],
+) -> None:
+    """
+    Cache a role that a route fetched inline with its own query.
+
+    Args:
+        user_id: User UUID.
+        project_id: Project UUID.
+        role: Role returned by the query, or None for no access.
+    """
+    _project_role_cache.set((user_id, project_id), role)
+
+
+def check_project_role(
+    role: Optional[ProjectRole],
+    allowed_roles: Optional[Collection[ProjectRole]] = None,
+) -> ProjectRole:
+    """
+    Reject a project role the same way the project dependencies do.
+
+    For routes that fetch the role inline (see peek_project_role) rather
+    than through a dependency.
+
+    Args:
+        role: User's role on the project, or None for no access.
+        allowed_roles: Roles permitted; any role is accepted if omitted.
+
+    Returns:
+        The role, once accepted.
+
+    Raises:
+        HTTPException: 403 if user has no role, or a role not allowed.
+    """
+    if role is None:
+        raise _NO_PROJECT_ACCESS.with_traceback(None)
+    if allowed_roles is not None and role not in allowed_roles:
+        raise _INSUFFICIENT_PROJECT_PERMISSIONS.with_traceback(None)
+    return role
+
+
+async def _resolve_project_role(
+    project_id: ProjectIdPath,
+    user: RequireAuth,
+) -> Optional[ProjectRole]:
+    """
+    Per-request dependency resolving the user's role on the path project.
+
+    Args:
+        project_id: Project UUID from path parameter.
+        user: Authenticated user from RequireAuth.
+
+    Returns:
+        ProjectRole if user has a role on the project, None otherwise.
+    """
+    return await _lookup_project_role(user.id, project_id)
+
+
+ResolvedProjectRole = Annotated[Optional[ProjectRole], Depends(_resolve_project_role)]
 
 
 def require_project_access(project_id: UUID):
@@ -216,13 +428,9 @@ def require_project_access(project_id: UUID):
     """
 
     async def check_access(user: RequireAuth) -> None:
-        repo = UserProjectRoleRepository(services.aurora)
-        has_access = await repo.has_access(user.id, project_id)
-        if not has_access:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="No access to this project",
-            )
+        role = await _lookup_project_role(user.id, project_id)
+        if role is None:
+            raise _NO_PROJECT_ACCESS.with_traceback(None)
 
     return check_access
 
@@ -249,25 +457,20 @@ def require_project_role(allowed_roles: list[ProjectRole]):
         Factory function that takes project_id and returns a dependency.
     """
 
+    allowed = frozenset(allowed_roles)
+
     def role_factory(project_id: UUID):
         async def check_role(user: RequireAuth) -> None:
-            repo = UserProjectRoleRepository(services.aurora)
-            has_role = await repo.has_role(user.id, project_id, allowed_roles)
-            if not has_role:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Insufficient project permissions",
-                )
+            role = await _lookup_project_role(user.id, project_id)
+            if role not in allowed:
+                raise _INSUFFICIENT_PROJECT_PERMISSIONS.with_traceback(None)
 
         return check_role
 
     return role_factory
 
 
-async def get_project_access(
-    project_id: UUID,
-    user: RequireAuth,
-) -> ProjectRole:
+async def get_project_access(role: ResolvedProjectRole) -> ProjectRole:
     """
     Dependency that validates project access and returns user's role.
 
@@ -284,8 +487,7 @@ async def get_project_access(
             ...
 
     Args:
-        project_id: Project UUID from path parameter.
-        user: Authenticated user from RequireAuth.
+        role: User's role on the path project (resolved once per request).
 
     Returns:
         User's ProjectRole on the project.
@@ -293,14 +495,7 @@ async def get_project_access(
     Raises:
         HTTPException: 403 if user has no role on project.
     """
-    repo = UserProjectRoleRepository(services.aurora)
-    role = await repo.get_user_role(user.id, project_id)
-    if role is None:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="No access to this project",
-        )
-    return role
+    return check_project_role(role)
 
 
 def get_project_role_checker(allowed_roles: list[ProjectRole]):
@@ -323,25 +518,15 @@ def get_project_role_checker(allowed_roles: list[ProjectRole]):
     Returns:
         Dependency function.
     """
+    allowed = frozenset(allowed_roles)
+    cached = _project_role_checkers.get(allowed)
+    if cached is not None:
+        return cached
 
-    async def check_role(
-        project_id: UUID,
-        user: RequireAuth,
-    ) -> ProjectRole:
-        repo = UserProjectRoleRepository(services.aurora)
-        role = await repo.get_user_role(user.id, project_id)
-        if role is None:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="No access to this project",
-            )
-        if role not in allowed_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient project permissions",
-            )
-        return role
+    async def check_role(role: ResolvedProjectRole) -> ProjectRole:
+        return check_project_role(role, allowed)
 
+    _project_role_checkers[allowed] = check_role
     return check_role
 
 
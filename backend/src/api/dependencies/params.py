@@ -0,0 +1,76 @@
+"""
+Path parameter dependencies for FastAPI routes.
+
+UUID path parameters are taken as plain strings and parsed with the
+standard library's uuid.UUID, instead of going through a Pydantic UUID
+field per request. Because FastAPI caches dependency results within a
+request, a route and its auth dependencies share a single parse.
+
+Usage:
+    from src.api.dependencies.params import ProjectIdPath
+
+    @router.get("/projects/{project_id}")
+    async def get_project(project_id: ProjectIdPath):
+        ...
+"""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends, Path
+from fastapi.exceptions import RequestValidationError
+
+# Keep the uuid format in the OpenAPI schema although the raw value is a str
+_UUID_SCHEMA = {"format": "uuid"}
+
+
+def _parse_path_uuid(name: str, value: str) -> UUID:
+    """
+    Parse a UUID path parameter.
+
+    Args:
+        name: Path parameter name, for the error location.
+        value: Raw path segment.
+
+    Returns:
+        Parsed UUID.
+
+    Raises:
+        RequestValidationError: 422 in FastAPI's usual shape if the value
+            is not a UUID.
+    """
+    try:
+        return UUID(value)
+    except ValueError:
+        raise RequestValidationError([{
+            "type": "uuid_parsing",
+            "loc": ("path", name),
+            "msg": "Input should be a valid UUID",
+            "input": value,
+        }]) from None
+
+
+async def _project_id_path(
+    project_id: str = Path(..., json_schema_extra=_UUID_SCHEMA),
+) -> UUID:
+    """Project UUID from the path."""
+    return _parse_path_uuid("project_id", project_id)
+
+
+async def _item_id_path(
+    item_id: str = Path(..., json_schema_extra=_UUID_SCHEMA),
+) -> UUID:
+    """Item UUID from the path."""
+    return _parse_path_uuid("item_id", item_id)
+
+
+async def _workstream_id_path(
+    workstream_id: str = Path(..., json_schema_extra=_UUID_SCHEMA),
+) -> UUID:
+    """Workstream UUID from the path."""
+    return _parse_path_uuid("workstream_id", workstream_id)
+
+
+ProjectIdPath = Annotated[UUID, Depends(_project_id_path)]
+ItemIdPath = Annotated[UUID, Depends(_item_id_path)]
+WorkstreamIdPath = Annotated[UUID, Depends(_workstream_id_path)]
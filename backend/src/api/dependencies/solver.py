@@ -0,0 +1,73 @@
+"""
+Per-callable memoization for FastAPI's dependency solver.
+
+For every dependency on every request, FastAPI's solve_dependencies asks
+whether the callable is a generator, async generator or coroutine
+function. Those answers never change for a given callable, so they are
+cached here, keyed weakly on the callable itself.
+
+The predicates are private FastAPI helpers, so fastapi is pinned below
+0.116 in pyproject.toml. A predicate missing from the installed release
+is skipped and logged rather than breaking app import.
+
+Usage:
+    from src.api.dependencies.solver import install_callable_kind_cache
+
+    install_callable_kind_cache()  # once, before serving requests
+"""
+
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+import fastapi.dependencies.utils as fastapi_dependency_utils
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_PREDICATES = ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable")
+
+
+def _memoized(predicate: Callable[[Callable[..., Any]], bool]) -> Callable[[Callable[..., Any]], bool]:
+    """
+    Wrap a callable-kind predicate with a per-callable result cache.
+
+    Callables that cannot be weakly referenced or hashed are passed
+    straight through to the original predicate.
+
+    Args:
+        predicate: One of FastAPI's is_*_callable helpers.
+
+    Returns:
+        Drop-in replacement for the predicate.
+    """
+    results: WeakKeyDictionary = WeakKeyDictionary()
+
+    def cached(call: Callable[..., Any]) -> bool:
+        try:
+            return results[call]
+        except KeyError:
+            result = results[call] = predicate(call)
+            return result
+        except TypeError:
+            return predicate(call)
+
+    cached.__wrapped__ = predicate  # type: ignore[attr-defined]
+    return cached
+
+
+def install_callable_kind_cache() -> None:
+    """
+    Replace FastAPI's callable-kind predicates with memoized versions.
+
+    Safe to call more than once; already-wrapped predicates are left alone.
+    Predicates this FastAPI release does not define are skipped.
+    """
+    for name in _PREDICATES:
+        predicate = getattr(fastapi_dependency_utils, name, None)
+        if predicate is None:
+            logger.warning("callable_kind_cache_skipped", predicate=name)
+            continue
+        if hasattr(predicate, "__wrapped__"):
+            continue
+        setattr(fastapi_dependency_utils, name, _memoized(predicate))
@@ -14,11 +14,13 @@ from typing import AsyncGenerator
 
 import structlog
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import get_config
 from src.services import services
 from src.api.routes import health, auth, projects, items, workstreams, chat, activity
+from src.api.dependencies.solver import install_callable_kind_cache
 from src.api.middleware import (
     CorrelationIdMiddleware,
     RequestLoggingMiddleware,
@@ -38,6 +40,9 @@ setup_logging(
 
 logger = structlog.get_logger()
 
+# Dependency callables never change kind; skip re-inspecting them per request
+install_callable_kind_cache()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
@@ -57,6 +62,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             logger.error("service_health_check_failed", service=service_name, status=status)
             raise RuntimeError(f"Service {service_name} health check failed: {status}")
 
+    # Open the database pool before accepting traffic
+    await services.aurora.connect()
+
     logger.info("application_started", services=list(health_status.keys()))
     yield
 
@@ -67,11 +75,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
 
 # Create FastAPI application
+# Responses are encoded with orjson. Response models are still serialized
+# by Pydantic first, so Decimal fields keep their string form.
 app = FastAPI(
     title="braidMgr API",
     description="Multi-tenant RAID log management system",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # =============================================================================
@@ -10,6 +10,7 @@ Usage:
     app.add_middleware(RequestLoggingMiddleware)
 """
 
+import logging
 import time
 from typing import Set
 
@@ -18,6 +19,7 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.requests import Request
 from starlette.responses import Response
 
+from src.utils.logging import log_enabled
 
 logger = structlog.get_logger()
 
@@ -55,41 +57,41 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         if request.url.path in EXCLUDED_PATHS:
             return await call_next(request)
 
+        # Request logs are INFO or above; skip field extraction entirely
+        # when even errors are filtered out
+        if not log_enabled(logging.ERROR):
+            return await call_next(request)
+
         # Record start time for duration calculation
         start_time = time.perf_counter()
-
-        # Extract request info (safe fields only - no body, no auth headers)
         method = request.method
         path = request.url.path
-        query = str(request.query_params) if request.query_params else ""
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("User-Agent", "unknown")[:100]  # Truncate
-
-        # Log request start
-        logger.info(
-            "request_started",
-            method=method,
-            path=path,
-            query=query,
-            client_ip=client_ip,
-            user_agent=user_agent,
-        )
+
+        # Log request start (safe fields only - no body, no auth headers)
+        if log_enabled(logging.INFO):
+            logger.info(
+                "request_started",
+                method=method,
+                path=path,
+                query=str(request.query_params) if request.query_params else "",
+                client_ip=self._get_client_ip(request),
+                user_agent=request.headers.get("User-Agent", "unknown")[:100],
+            )
 
         # Process the request
         response = await call_next(request)
 
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Log request completion
+        # Log request completion at a level matching the status
         log_method = self._get_log_method(response.status_code)
-        log_method(
-            "request_completed",
-            method=method,
-            path=path,
-            status_code=response.status_code,
-            duration_ms=round(duration_ms, 2),
-        )
+        if log_method is not None:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            log_method(
+                "request_completed",
+                method=method,
+                path=path,
+                status_code=response.status_code,
+                duration_ms=round(duration_ms, 2),
+            )
 
         return response
 
@@ -107,14 +109,18 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
     def _get_log_method(self, status_code: int):
         """
-        Get appropriate log level based on response status code.
+        Get appropriate log method based on response status code.
 
         - 5xx: error (server errors - investigate)
         - 4xx: warning (client errors - may indicate issues)
         - 2xx/3xx: info (success)
+
+        Returns None if that level is filtered out.
         """
         if status_code >= 500:
-            return logger.error
+            level, method = logging.ERROR, logger.error
         elif status_code >= 400:
-            return logger.warning
-        return logger.info
+            level, method = logging.WARNING, logger.warning
+        else:
+            level, method = logging.INFO, logger.info
+        return method if log_enabled(level) else None
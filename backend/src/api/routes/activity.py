@@ -8,15 +8,24 @@ Endpoints:
     GET /projects/{project_id}/items/{item_id}/history - Get item change history
 """
 
-from typing import Optional
-from uuid import UUID
+from functools import lru_cache
+from typing import AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, Query
-
-from src.api.dependencies.auth import require_project_viewer
+from fastapi.responses import Response, StreamingResponse
+
+from src.api.dependencies.auth import (
+    RequireAuth,
+    check_project_role,
+    peek_project_role,
+    remember_project_role,
+    require_project_viewer,
+)
+from src.api.dependencies.params import ProjectIdPath, ItemIdPath
 from src.domain.auth import ProjectRole
-from src.repositories.audit_log_repository import AuditLogRepository
+from src.repositories.audit_log_repository import AuditEntry, AuditLogRepository
 from src.services import services
+from src.services.aurora_service import AuroraService
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -24,9 +33,15 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/projects/{project_id}", tags=["Activity"])
 
 
+@lru_cache(maxsize=1)
+def _audit_repo_for(aurora: AuroraService) -> AuditLogRepository:
+    """Shared audit log repository, rebuilt only if the Aurora service changes."""
+    return AuditLogRepository(aurora)
+
+
 def _get_audit_repo() -> AuditLogRepository:
-    """Get audit log repository instance."""
-    return AuditLogRepository(services.aurora)
+    """Get the shared audit log repository instance."""
+    return _audit_repo_for(services.aurora)
 
 
 # =============================================================================
@@ -40,13 +55,13 @@ def _get_audit_repo() -> AuditLogRepository:
     description="Get a chronological feed of all project activity (item changes, etc.)",
 )
 async def get_project_activity(
-    project_id: UUID,
+    project_id: ProjectIdPath,
+    user: RequireAuth,
     days: int = Query(30, ge=1, le=365, description="Number of days to look back"),
     limit: int = Query(100, ge=1, le=500, description="Max entries to return"),
     offset: int = Query(0, ge=0, description="Number of entries to skip"),
     entity_type: Optional[str] = Query(None, description="Filter by entity type (item, workstream, project)"),
     search: Optional[str] = Query(None, description="Search in activity details"),
-    role: ProjectRole = Depends(require_project_viewer),
     repo: AuditLogRepository = Depends(_get_audit_repo),
 ):
     """
@@ -54,11 +69,21 @@ async def get_project_activity(
 
     Returns audit log entries for items, workstreams, and the project itself,
     ordered by most recent first.
+
+    Requires any role on the project. The role is read from the role cache
+    or, on a miss, fetched by the feed's count query rather than a separate
+    access query. The page is fetched before the response starts; only
+    its encoding is streamed.
     """
+    cached, role = peek_project_role(user.id, project_id)
+    if cached:
+        check_project_role(role)
+
     entity_types = [entity_type] if entity_type else None
 
-    entries, total = await repo.get_project_activity(
+    total, caller_role, entries = await repo.get_project_activity_for_user(
         project_id=project_id,
+        user_id=user.id,
         limit=limit,
         offset=offset,
         days=days,
@@ -66,12 +91,44 @@ async def get_project_activity(
         search=search,
     )
 
-    return {
-        "activity": [entry.to_dict() for entry in entries],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    if not cached:
+        remember_project_role(user.id, project_id, caller_role)
+        check_project_role(caller_role)
+
+    return StreamingResponse(
+        _activity_json(entries, total, limit, offset),
+        media_type="application/json",
+    )
+
+
+async def _activity_json(
+    entries: list[AuditEntry],
+    total: int,
+    limit: int,
+    offset: int,
+) -> AsyncIterator[bytes]:
+    """
+    Encode the activity feed as JSON, one entry at a time.
+
+    Produces the same document as a buffered response:
+    {"activity": [...], "total": N, "limit": N, "offset": N}
+
+    Args:
+        entries: Page of entries, already fetched
+        total: Total matching entries
+        limit: Page size requested
+        offset: Page offset requested
+
+    Yields:
+        Chunks of the encoded JSON document
+    """
+    separator = b'{"activity":['
+    for entry in entries:
+        yield separator + entry.to_json_bytes()
+        separator = b","
+    if separator != b",":
+        yield separator
+    yield b'],"total":%d,"limit":%d,"offset":%d}' % (total, limit, offset)
 
 
 # =============================================================================
@@ -85,8 +142,8 @@ async def get_project_activity(
     description="Get the full change history for a specific item",
 )
 async def get_item_history(
-    project_id: UUID,
-    item_id: UUID,
+    project_id: ProjectIdPath,
+    item_id: ItemIdPath,
     limit: int = Query(50, ge=1, le=200, description="Max entries to return"),
     role: ProjectRole = Depends(require_project_viewer),
     repo: AuditLogRepository = Depends(_get_audit_repo),
@@ -98,7 +155,10 @@ async def get_item_history(
     """
     entries = await repo.get_item_history(item_id=item_id, limit=limit)
 
-    return {
-        "history": [entry.to_dict() for entry in entries],
-        "item_id": str(item_id),
-    }
+    # Entries encode themselves; only the envelope is assembled here
+    return Response(
+        b'{"history":['
+        + b",".join(entry.to_json_bytes() for entry in entries)
+        + b'],"item_id":"%s"}' % str(item_id).encode(),
+        media_type="application/json",
+    )
@@ -13,6 +13,8 @@ Endpoints:
     GET /auth/me - Get current user info
 """
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Request, Response, HTTPException, status
 
 from src.api.dependencies.auth import RequireAuth
@@ -30,6 +32,7 @@ from src.api.schemas.auth import (
 from src.config import get_config
 from src.services import services
 from src.services.auth_service import AuthService
+from src.services.aurora_service import AuroraService
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -37,9 +40,15 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+@lru_cache(maxsize=1)
+def _auth_service_for(aurora: AuroraService) -> AuthService:
+    """Shared auth service, rebuilt only if the Aurora service changes."""
+    return AuthService(aurora)
+
+
 def _get_auth_service() -> AuthService:
-    """Get auth service instance."""
-    return AuthService(services.aurora)
+    """Get the shared auth service instance."""
+    return _auth_service_for(services.aurora)
 
 
 def _get_client_info(request: Request) -> tuple[str | None, str | None]:
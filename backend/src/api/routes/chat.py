@@ -9,11 +9,13 @@ Endpoints:
     DELETE /chat/history - Clear conversation history
 """
 
-import json
-from typing import Optional
-from uuid import UUID
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Optional
+from uuid import UUID, uuid4
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.api.dependencies.auth import get_optional_user
@@ -23,7 +25,16 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/chat", tags=["Chat"])
+router = APIRouter(
+    prefix="/chat",
+    tags=["Chat"],
+    default_response_class=ORJSONResponse,
+)
+
+# Streamed tokens are coalesced into one frame per STREAM_FLUSH_CHARS of
+# text or STREAM_FLUSH_SECONDS of buffering, whichever comes first.
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_SECONDS = 0.02
 
 
 # =============================================================================
@@ -35,7 +46,7 @@ class ChatMessageRequest(BaseModel):
     """Request body for sending a chat message."""
 
     message: str
-    project_id: Optional[str] = None
+    project_id: Optional[UUID] = None
 
 
 class ChatMessageResponse(BaseModel):
@@ -75,21 +86,13 @@ async def send_message(
             detail="Message cannot be empty",
         )
 
-    # Parse project_id if provided
-    project_id = None
-    if body.project_id:
-        try:
-            project_id = UUID(body.project_id)
-        except ValueError:
-            pass
-
     # Get user ID if authenticated
     user_id = current_user.id if current_user else None
 
     # Send message and get response
     response = await chat_service.send_message(
         user_message=body.message,
-        project_id=project_id,
+        project_id=body.project_id,
         user_id=user_id,
     )
 
@@ -132,6 +135,82 @@ async def clear_history(
 # =============================================================================
 
 
+async def _coalesce_chunks(
+    chunks: AsyncIterator[str],
+    flush_chars: int = STREAM_FLUSH_CHARS,
+    flush_seconds: float = STREAM_FLUSH_SECONDS,
+) -> AsyncGenerator[str, None]:
+    """
+    Batch small streamed chunks into larger ones.
+
+    A batch is emitted once it holds flush_chars characters, or once its
+    first chunk has waited flush_seconds - even if the source stalls.
+
+    Args:
+        chunks: Source of text chunks (e.g. LLM token stream)
+        flush_chars: Size threshold that triggers a flush
+        flush_seconds: Max time a chunk may sit in the buffer
+
+    Yields:
+        Joined text batches, in order
+    """
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    buffer: list[str] = []
+    buffered = 0
+    deadline = 0.0
+    pending = asyncio.ensure_future(iterator.__anext__())
+
+    try:
+        while True:
+            timeout = max(deadline - loop.time(), 0) if buffer else None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+            if not done:
+                # Flush interval elapsed while waiting on the source
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+                continue
+
+            try:
+                chunk = pending.result()
+            except StopAsyncIteration:
+                break
+
+            if not buffer:
+                deadline = loop.time() + flush_seconds
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= flush_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+
+            pending = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        if not pending.done():
+            pending.cancel()
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def _stream_frame(content: str) -> str:
+    """Encode a stream frame without building an intermediate dict."""
+    return '{"type":"stream","content":' + orjson.dumps(content).decode() + "}"
+
+
+async def _send(websocket: WebSocket, payload: dict) -> None:
+    """
+    Send a JSON frame encoded with orjson.
+
+    Frames go out as text (not bytes) because the client JSON.parses
+    event.data, which only works for text frames.
+    """
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
 @router.websocket("/ws")
 async def chat_websocket(
     websocket: WebSocket,
@@ -157,16 +236,16 @@ async def chat_websocket(
             data = await websocket.receive_text()
 
             try:
-                message = json.loads(data)
-            except json.JSONDecodeError:
-                await websocket.send_json({
+                message = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                await _send(websocket, {
                     "type": "error",
                     "message": "Invalid JSON format",
                 })
                 continue
 
             if message.get("type") != "message":
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "error",
                     "message": "Unknown message type",
                 })
@@ -174,32 +253,31 @@ async def chat_websocket(
 
             user_message = message.get("content", "").strip()
             if not user_message:
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "error",
                     "message": "Message cannot be empty",
                 })
                 continue
 
-            # Stream the response
-            full_response = ""
+            # Stream the response, coalescing tokens into fewer frames
+            parts: list[str] = []
             try:
-                async for chunk in chat_service.stream_message(user_message):
-                    full_response += chunk
-                    await websocket.send_json({
-                        "type": "stream",
-                        "content": chunk,
-                    })
+                async for text in _coalesce_chunks(
+                    chat_service.stream_message(user_message)
+                ):
+                    parts.append(text)
+                    await websocket.send_text(_stream_frame(text))
 
                 # Send complete message signal
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "message",
-                    "id": f"msg-{hash(full_response) % 1000000}",
-                    "content": full_response,
+                    "id": f"msg-{uuid4().hex}",
+                    "content": "".join(parts),
                 })
 
             except Exception as e:
                 logger.error(f"Chat stream error: {e}")
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "error",
                     "message": str(e),
                 })
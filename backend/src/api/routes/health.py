@@ -3,6 +3,7 @@ Health check endpoints for braidMgr API.
 
 Provides:
 - /health: Basic health check with service status
+- /health/db-pool: Database connection pool usage
 - /: Root endpoint with API info
 
 Usage:
@@ -35,6 +36,17 @@ async def health_check() -> dict:
     }
 
 
+@router.get("/health/db-pool")
+async def db_pool_stats() -> dict:
+    """
+    Database connection pool usage.
+
+    Returns:
+        Configured pool bounds and current open/idle connection counts.
+    """
+    return services.aurora.pool_stats()
+
+
 @router.get("/")
 async def root() -> dict:
     """
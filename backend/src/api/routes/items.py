@@ -11,15 +11,18 @@ Endpoints:
     DELETE /projects/{project_id}/items/{item_id} - Soft delete item
 """
 
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 
 from src.api.dependencies.auth import (
     get_project_access,
     require_project_member,
 )
+from src.api.dependencies.params import ProjectIdPath, ItemIdPath
 from src.api.schemas.items import (
     ItemCreateRequest,
     ItemUpdateRequest,
@@ -27,8 +30,9 @@ from src.api.schemas.items import (
     ItemListResponse,
 )
 from src.domain.auth import ProjectRole
-from src.domain.core import ItemType, Indicator
+from src.domain.core import Item, ItemType, Indicator
 from src.services import services
+from src.services.aurora_service import AuroraService
 from src.services.item_service import ItemService
 from src.utils.logging import get_logger
 
@@ -37,9 +41,56 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/projects/{project_id}/items", tags=["Items"])
 
 
+@lru_cache(maxsize=1)
+def _item_service_for(aurora: AuroraService) -> ItemService:
+    """Shared item service, rebuilt only if the Aurora service changes."""
+    return ItemService(aurora)
+
+
 def _get_item_service() -> ItemService:
-    """Get item service instance."""
-    return ItemService(services.aurora)
+    """Get the shared item service instance."""
+    return _item_service_for(services.aurora)
+
+
+# Response fields, resolved once so per-item encoding is a plain getattr loop
+_ITEM_RESPONSE_FIELDS = tuple(ItemResponse.model_fields)
+
+
+def _item_fields(item: Item) -> dict:
+    """
+    Map a domain Item onto the ItemResponse fields.
+
+    Values are left native for orjson, except budget_amount: orjson has
+    no Decimal support, and the API has always sent it as a string.
+
+    Args:
+        item: Domain item from the service layer.
+
+    Returns:
+        Dict in the ItemResponse shape.
+    """
+    fields = {name: getattr(item, name) for name in _ITEM_RESPONSE_FIELDS}
+    if item.budget_amount is not None:
+        fields["budget_amount"] = str(item.budget_amount)
+    return fields
+
+
+def _item_response(item: Item, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """
+    Encode a single item straight to JSON.
+
+    Returning a Response skips FastAPI's jsonable_encoder and
+    response_model pass; the route's response_model still documents
+    the shape.
+
+    Args:
+        item: Domain item from the service layer.
+        status_code: HTTP status for the response.
+
+    Returns:
+        ORJSONResponse in the ItemResponse shape.
+    """
+    return ORJSONResponse(_item_fields(item), status_code=status_code)
 
 
 # =============================================================================
@@ -55,7 +106,7 @@ def _get_item_service() -> ItemService:
     description="Create a new item (Risk, Action, Issue, Decision, etc.) in the project.",
 )
 async def create_item(
-    project_id: UUID,
+    project_id: ProjectIdPath,
     body: ItemCreateRequest,
     role: ProjectRole = Depends(require_project_member),
 ):
@@ -91,15 +142,7 @@ async def create_item(
             detail=result.error,
         )
 
-    logger.info(
-        "item_created",
-        item_id=str(result.item.id),
-        project_id=str(project_id),
-        type=result.item.type.value,
-        item_num=result.item.item_num,
-    )
-
-    return ItemResponse.model_validate(result.item)
+    return _item_response(result.item, status.HTTP_201_CREATED)
 
 
 # =============================================================================
@@ -114,7 +157,7 @@ async def create_item(
     description="List items with optional filtering.",
 )
 async def list_items(
-    project_id: UUID,
+    project_id: ProjectIdPath,
     type: Optional[ItemType] = Query(None, description="Filter by item type"),
     workstream_id: Optional[UUID] = Query(None, description="Filter by workstream"),
     assigned_to: Optional[str] = Query(None, description="Filter by assignee (partial match)"),
@@ -130,9 +173,10 @@ async def list_items(
 
     Filters combine with AND logic.
     Results ordered by item_num descending (newest first).
+    total counts every match, not just the returned page.
     """
     item_service = _get_item_service()
-    items = await item_service.list_items(
+    items, total = await item_service.list_items_with_total(
         project_id=project_id,
         item_type=type,
         workstream_id=workstream_id,
@@ -144,10 +188,10 @@ async def list_items(
         offset=offset,
     )
 
-    return ItemListResponse(
-        items=[ItemResponse.model_validate(i) for i in items],
-        total=len(items),
-    )
+    return ORJSONResponse({
+        "items": [_item_fields(i) for i in items],
+        "total": total,
+    })
 
 
 # =============================================================================
@@ -162,8 +206,8 @@ async def list_items(
     description="Get item details by ID.",
 )
 async def get_item(
-    project_id: UUID,
-    item_id: UUID,
+    project_id: ProjectIdPath,
+    item_id: ItemIdPath,
     role: ProjectRole = Depends(get_project_access),
 ):
     """
@@ -187,7 +231,7 @@ async def get_item(
             detail="Item not found",
         )
 
-    return ItemResponse.model_validate(item)
+    return _item_response(item)
 
 
 # =============================================================================
@@ -202,8 +246,8 @@ async def get_item(
     description="Update item details.",
 )
 async def update_item(
-    project_id: UUID,
-    item_id: UUID,
+    project_id: ProjectIdPath,
+    item_id: ItemIdPath,
     body: ItemUpdateRequest,
     role: ProjectRole = Depends(require_project_member),
 ):
@@ -213,22 +257,9 @@ async def update_item(
     Requires team member or higher role.
     Only provided fields are updated.
     Indicator is recalculated after update.
+    Returns 404 if item not found or belongs to different project.
     """
     item_service = _get_item_service()
-
-    # First verify item exists and belongs to project
-    existing = await item_service.get_item(item_id)
-    if not existing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found",
-        )
-    if existing.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found",
-        )
-
     result = await item_service.update_item(
         item_id=item_id,
         title=body.title,
@@ -245,16 +276,21 @@ async def update_item(
         priority=body.priority,
         rpt_out=body.rpt_out,
         budget_amount=body.budget_amount,
+        project_id=project_id,
     )
 
     if not result.success:
+        if result.error == "Item not found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=result.error,
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=result.error,
         )
 
-    logger.info("item_updated", item_id=str(item_id), project_id=str(project_id))
-    return ItemResponse.model_validate(result.item)
+    return _item_response(result.item)
 
 
 # =============================================================================
@@ -269,8 +305,8 @@ async def update_item(
     description="Soft delete an item.",
 )
 async def delete_item(
-    project_id: UUID,
-    item_id: UUID,
+    project_id: ProjectIdPath,
+    item_id: ItemIdPath,
     role: ProjectRole = Depends(require_project_member),
 ):
     """
@@ -278,28 +314,18 @@ async def delete_item(
 
     Requires team member or higher role.
     Item is marked as deleted but data is retained.
+    Returns 404 if item not found or belongs to different project.
     """
     item_service = _get_item_service()
-
-    # First verify item exists and belongs to project
-    existing = await item_service.get_item(item_id)
-    if not existing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found",
-        )
-    if existing.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item not found",
-        )
-
-    result = await item_service.delete_item(item_id)
+    result = await item_service.delete_item(item_id, project_id=project_id)
 
     if not result.success:
+        if result.error == "Item not found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=result.error,
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=result.error,
         )
-
-    logger.info("item_deleted", item_id=str(item_id), project_id=str(project_id))
@@ -12,15 +12,21 @@ Endpoints:
     POST /projects/{project_id}/update-indicators - Batch recalculate indicators
 """
 
+from functools import lru_cache
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 
 from src.api.dependencies.auth import (
     RequireAuth,
+    check_project_role,
     get_project_access,
-    require_project_admin,
+    peek_project_role,
+    remember_project_role,
 )
+from src.api.dependencies.params import ProjectIdPath
 from src.api.schemas.projects import (
     ProjectCreateRequest,
     ProjectUpdateRequest,
@@ -28,18 +34,90 @@ from src.api.schemas.projects import (
     ProjectListResponse,
 )
 from src.domain.auth import ProjectRole
+from src.domain.core import Project
 from src.services import services
+from src.services.aurora_service import AuroraService
+from src.services.item_service import ItemService
 from src.services.project_service import ProjectService
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/projects", tags=["Projects"])
+# Log event names emitted by these routes
+EVT_PROJECT_CREATED = "project_created"
+EVT_PROJECT_UPDATED = "project_updated"
+EVT_PROJECT_DELETED = "project_deleted"
+EVT_INDICATORS_UPDATED = "indicators_updated"
+
+router = APIRouter(
+    prefix="/projects",
+    tags=["Projects"],
+    default_response_class=ORJSONResponse,
+)
+
+# Response fields, resolved once so per-project encoding is a plain getattr loop
+_PROJECT_RESPONSE_FIELDS = tuple(ProjectResponse.model_fields)
+
+# Roles allowed to delete a project
+_PROJECT_ADMIN = frozenset({ProjectRole.ADMIN})
+
+# Page size when a cursor is given without an explicit limit
+DEFAULT_PAGE_SIZE = 100
+
+
+def _project_fields(project: Project) -> dict:
+    """
+    Map a domain Project onto the ProjectResponse fields.
+
+    Args:
+        project: Domain project from the service layer.
+
+    Returns:
+        Dict in the ProjectResponse shape, values left native for orjson.
+    """
+    return {name: getattr(project, name) for name in _PROJECT_RESPONSE_FIELDS}
+
+
+def _project_response(
+    project: Project, status_code: int = status.HTTP_200_OK
+) -> ORJSONResponse:
+    """
+    Encode a single project straight to JSON.
+
+    Returning a Response skips FastAPI's response_model pass, which would
+    otherwise dump, re-validate and re-serialize the model. The route's
+    response_model still documents the shape.
+
+    Args:
+        project: Domain project from the service layer.
+        status_code: HTTP status for the response.
+
+    Returns:
+        ORJSONResponse in the ProjectResponse shape.
+    """
+    return ORJSONResponse(_project_fields(project), status_code=status_code)
+
+
+@lru_cache(maxsize=1)
+def _project_service_for(aurora: AuroraService) -> ProjectService:
+    """Shared project service, rebuilt only if the Aurora service changes."""
+    return ProjectService(aurora)
+
+
+@lru_cache(maxsize=1)
+def _item_service_for(aurora: AuroraService) -> ItemService:
+    """Shared item service, rebuilt only if the Aurora service changes."""
+    return ItemService(aurora)
 
 
 def _get_project_service() -> ProjectService:
-    """Get project service instance."""
-    return ProjectService(services.aurora)
+    """Get the shared project service instance."""
+    return _project_service_for(services.aurora)
+
+
+def _get_item_service() -> ItemService:
+    """Get the shared item service instance."""
+    return _item_service_for(services.aurora)
 
 
 # =============================================================================
@@ -77,7 +155,7 @@ async def create_project(
         client_name=body.client_name,
         project_start=body.project_start,
         project_end=body.project_end,
-        workstream_names=body.workstreams,
+        workstreams=body.workstreams,
         created_by=user.id,
     )
 
@@ -87,14 +165,18 @@ async def create_project(
             detail=result.error,
         )
 
+    # The creator is the project's admin; seed the role cache so the
+    # client's follow-up requests for the new project skip the role query
+    remember_project_role(user.id, result.project.id, ProjectRole.ADMIN)
+
     logger.info(
-        "project_created",
-        project_id=str(result.project.id),
+        EVT_PROJECT_CREATED,
+        project_id=result.project.id,
         name=result.project.name,
-        user_id=str(user.id),
+        user_id=user.id,
     )
 
-    return ProjectResponse.model_validate(result.project)
+    return _project_response(result.project, status.HTTP_201_CREATED)
 
 
 # =============================================================================
@@ -108,11 +190,17 @@ async def create_project(
     summary="List projects",
     description="List all projects the user has access to.",
 )
-async def list_projects(user: RequireAuth):
+async def list_projects(
+    user: RequireAuth,
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size; omit for all"),
+    cursor: Optional[UUID] = Query(None, description="next_cursor from the previous page"),
+):
     """
     List projects for the current user.
 
-    Returns only projects where user has a role.
+    Returns only projects where user has a role. Without limit the whole
+    list is returned; with limit, pages are fetched by keyset on
+    (name, id) and next_cursor points at the following page.
     """
     if not user.org_id:
         raise HTTPException(
@@ -121,15 +209,26 @@ async def list_projects(user: RequireAuth):
         )
 
     project_service = _get_project_service()
-    projects = await project_service.list_projects_for_user(
-        user_id=user.id,
-        org_id=user.org_id,
-    )
+    next_cursor = None
+    if limit is None and cursor is None:
+        projects = await project_service.list_projects_for_user(
+            user_id=user.id,
+            org_id=user.org_id,
+        )
+    else:
+        projects, next_cursor = await project_service.list_projects_page(
+            user_id=user.id,
+            org_id=user.org_id,
+            limit=limit or DEFAULT_PAGE_SIZE,
+            after=cursor,
+        )
 
-    return ProjectListResponse(
-        projects=[ProjectResponse.model_validate(p) for p in projects],
-        total=len(projects),
-    )
+    # Rows come typed from the repository; orjson encodes them directly
+    return ORJSONResponse({
+        "projects": [_project_fields(p) for p in projects],
+        "total": len(projects),
+        "next_cursor": next_cursor,
+    })
 
 
 # =============================================================================
@@ -144,16 +243,29 @@ async def list_projects(user: RequireAuth):
     description="Get project details by ID.",
 )
 async def get_project(
-    project_id: UUID,
-    role: ProjectRole = Depends(get_project_access),
+    project_id: ProjectIdPath,
+    user: RequireAuth,
 ):
     """
     Get a project by ID.
 
-    User must have access to the project.
+    User must have access to the project. With the role cached the project
+    comes from the service's project cache; otherwise the caller's role is
+    read in the same query as the project.
     """
+    cached, role = peek_project_role(user.id, project_id)
+    if cached:
+        check_project_role(role)
+
     project_service = _get_project_service()
-    project = await project_service.get_project(project_id)
+    if cached:
+        project = await project_service.get_project(project_id)
+    else:
+        project, role = await project_service.get_project_for_user(
+            project_id, user.id
+        )
+        remember_project_role(user.id, project_id, role)
+        check_project_role(role)
 
     if not project:
         raise HTTPException(
@@ -161,7 +273,7 @@ async def get_project(
             detail="Project not found",
         )
 
-    return ProjectResponse.model_validate(project)
+    return _project_response(project)
 
 
 # =============================================================================
@@ -176,7 +288,7 @@ async def get_project(
     description="Update project details.",
 )
 async def update_project(
-    project_id: UUID,
+    project_id: ProjectIdPath,
     body: ProjectUpdateRequest,
     role: ProjectRole = Depends(get_project_access),
 ):
@@ -206,8 +318,8 @@ async def update_project(
             detail=result.error,
         )
 
-    logger.info("project_updated", project_id=str(project_id))
-    return ProjectResponse.model_validate(result.project)
+    logger.info(EVT_PROJECT_UPDATED, project_id=project_id)
+    return _project_response(result.project)
 
 
 # =============================================================================
@@ -222,30 +334,37 @@ async def update_project(
     description="Soft delete a project (requires admin role).",
 )
 async def delete_project(
-    project_id: UUID,
-    role: ProjectRole = Depends(require_project_admin),
+    project_id: ProjectIdPath,
+    user: RequireAuth,
 ):
     """
     Soft delete a project.
 
     Requires project admin role.
-    Project is marked as deleted but data is retained.
+    Project is marked as deleted but data is retained. With the role not
+    cached, the role check and the delete run as a single statement.
     """
+    cached, role = peek_project_role(user.id, project_id)
+    if cached:
+        check_project_role(role, _PROJECT_ADMIN)
+
     project_service = _get_project_service()
-    result = await project_service.delete_project(project_id)
+    if cached:
+        deleted = (await project_service.delete_project(project_id)).success
+    else:
+        role, deleted = await project_service.delete_project_for_user(
+            project_id, user.id
+        )
+        remember_project_role(user.id, project_id, role)
+        check_project_role(role, _PROJECT_ADMIN)
 
-    if not result.success:
-        if result.error == "Project not found":
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=result.error,
-            )
+    if not deleted:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=result.error,
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
         )
 
-    logger.info("project_deleted", project_id=str(project_id))
+    logger.info(EVT_PROJECT_DELETED, project_id=project_id)
 
 
 # =============================================================================
@@ -260,13 +379,15 @@ async def delete_project(
     description="Batch recalculate all item indicators for the project.",
 )
 async def update_indicators(
-    project_id: UUID,
+    project_id: ProjectIdPath,
     role: ProjectRole = Depends(get_project_access),
 ):
     """
     Recalculate all item indicators for a project.
 
-    Updates the indicators_updated timestamp on the project.
+    Runs to completion before responding, so clients can refetch items as
+    soon as the 204 arrives. Updates the indicators_updated timestamp on
+    the project.
     """
     project_service = _get_project_service()
 
@@ -278,5 +399,5 @@ async def update_indicators(
             detail="Project not found",
         )
 
-    await project_service.update_all_indicators(project_id)
-    logger.info("indicators_updated", project_id=str(project_id))
+    count = await _get_item_service().update_all_indicators(project_id)
+    logger.info(EVT_INDICATORS_UPDATED, project_id=project_id, updated_count=count)
@@ -11,14 +11,18 @@ Endpoints:
     PUT /projects/{project_id}/workstreams/reorder - Reorder workstreams
 """
 
+from functools import lru_cache
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 
 from src.api.dependencies.auth import (
     get_project_access,
     require_project_manager,
 )
+from src.api.dependencies.params import ProjectIdPath, WorkstreamIdPath
 from src.api.schemas.workstreams import (
     WorkstreamCreateRequest,
     WorkstreamUpdateRequest,
@@ -27,18 +31,99 @@ from src.api.schemas.workstreams import (
     WorkstreamListResponse,
 )
 from src.domain.auth import ProjectRole
+from src.domain.core import Workstream
 from src.services import services
+from src.services.aurora_service import AuroraService
 from src.services.workstream_service import WorkstreamService
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/projects/{project_id}/workstreams", tags=["Workstreams"])
+# Log event names emitted by these routes
+EVT_WORKSTREAM_CREATED = "workstream_created"
+EVT_WORKSTREAM_UPDATED = "workstream_updated"
+EVT_WORKSTREAM_DELETED = "workstream_deleted"
+EVT_WORKSTREAMS_REORDERED = "workstreams_reordered"
+
+router = APIRouter(
+    prefix="/projects/{project_id}/workstreams",
+    tags=["Workstreams"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@lru_cache(maxsize=1)
+def _workstream_service_for(aurora: AuroraService) -> WorkstreamService:
+    """Shared workstream service, rebuilt only if the Aurora service changes."""
+    return WorkstreamService(aurora)
 
 
 def _get_workstream_service() -> WorkstreamService:
-    """Get workstream service instance."""
-    return WorkstreamService(services.aurora)
+    """Get the shared workstream service instance."""
+    return _workstream_service_for(services.aurora)
+
+
+# Response fields, resolved once so encoding a workstream is a plain getattr loop
+_WORKSTREAM_RESPONSE_FIELDS = tuple(WorkstreamResponse.model_fields)
+
+
+# Page size when a cursor is given without an explicit limit
+DEFAULT_PAGE_SIZE = 100
+
+
+def _workstream_fields(workstream: Workstream) -> dict:
+    """
+    Map a domain Workstream onto the WorkstreamResponse fields.
+
+    Args:
+        workstream: Domain workstream from the service layer.
+
+    Returns:
+        Dict in the WorkstreamResponse shape, values left native for orjson.
+    """
+    return {name: getattr(workstream, name) for name in _WORKSTREAM_RESPONSE_FIELDS}
+
+
+def _workstream_response(
+    workstream: Workstream, status_code: int = status.HTTP_200_OK
+) -> ORJSONResponse:
+    """
+    Encode a single workstream straight to JSON.
+
+    Returning a Response skips FastAPI's response_model pass; the route's
+    response_model still documents the shape.
+
+    Args:
+        workstream: Domain workstream from the service layer.
+        status_code: HTTP status for the response.
+
+    Returns:
+        ORJSONResponse in the WorkstreamResponse shape.
+    """
+    return ORJSONResponse(_workstream_fields(workstream), status_code=status_code)
+
+
+def _workstream_list_response(
+    workstreams: list[Workstream],
+    next_cursor: Optional[UUID] = None,
+) -> ORJSONResponse:
+    """
+    Encode a workstream list straight to JSON.
+
+    Workstreams come typed from the repository, so they are written out
+    with orjson without a Pydantic validation or serialization pass.
+
+    Args:
+        workstreams: Domain workstreams from the service layer.
+        next_cursor: Cursor for the following page, if any.
+
+    Returns:
+        ORJSONResponse in the WorkstreamListResponse shape.
+    """
+    return ORJSONResponse({
+        "workstreams": [_workstream_fields(w) for w in workstreams],
+        "next_cursor": next_cursor,
+    })
 
 
 # =============================================================================
@@ -54,7 +139,7 @@ def _get_workstream_service() -> WorkstreamService:
     description="Create a new workstream in the project.",
 )
 async def create_workstream(
-    project_id: UUID,
+    project_id: ProjectIdPath,
     body: WorkstreamCreateRequest,
     role: ProjectRole = Depends(require_project_manager),
 ):
@@ -82,13 +167,13 @@ async def create_workstream(
         )
 
     logger.info(
-        "workstream_created",
-        workstream_id=str(result.workstream.id),
-        project_id=str(project_id),
+        EVT_WORKSTREAM_CREATED,
+        workstream_id=result.workstream.id,
+        project_id=project_id,
         name=result.workstream.name,
     )
 
-    return WorkstreamResponse.model_validate(result.workstream)
+    return _workstream_response(result.workstream, status.HTTP_201_CREATED)
 
 
 # =============================================================================
@@ -103,21 +188,29 @@ async def create_workstream(
     description="List all workstreams in the project.",
 )
 async def list_workstreams(
-    project_id: UUID,
+    project_id: ProjectIdPath,
     role: ProjectRole = Depends(get_project_access),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Page size; omit for all"),
+    cursor: Optional[UUID] = Query(None, description="next_cursor from the previous page"),
 ):
     """
     List all workstreams for a project.
 
-    Returns workstreams ordered by sort_order.
+    Returns workstreams ordered by sort_order. With limit, pages are
+    fetched by keyset on (sort_order, name, id) and next_cursor points
+    at the following page.
     """
     workstream_service = _get_workstream_service()
-    workstreams = await workstream_service.list_workstreams(project_id)
-
-    return WorkstreamListResponse(
-        workstreams=[WorkstreamResponse.model_validate(w) for w in workstreams],
-        total=len(workstreams),
+    if limit is None and cursor is None:
+        workstreams = await workstream_service.list_workstreams(project_id)
+        return _workstream_list_response(workstreams)
+
+    workstreams, next_cursor = await workstream_service.list_workstreams_page(
+        project_id,
+        limit=limit or DEFAULT_PAGE_SIZE,
+        after=cursor,
     )
+    return _workstream_list_response(workstreams, next_cursor)
 
 
 # =============================================================================
@@ -132,8 +225,8 @@ async def list_workstreams(
     description="Update workstream details.",
 )
 async def update_workstream(
-    project_id: UUID,
-    workstream_id: UUID,
+    project_id: ProjectIdPath,
+    workstream_id: WorkstreamIdPath,
     body: WorkstreamUpdateRequest,
     role: ProjectRole = Depends(require_project_manager),
 ):
@@ -142,30 +235,28 @@ async def update_workstream(
 
     Requires project manager or higher role.
     Workstream name must remain unique within the project.
+    Returns 404 if workstream not found or belongs to different project.
     """
     workstream_service = _get_workstream_service()
-
-    # Verify workstream belongs to project
-    existing = await workstream_service.get_workstream(workstream_id)
-    if not existing or existing.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Workstream not found",
-        )
-
     result = await workstream_service.update_workstream(
         workstream_id=workstream_id,
         name=body.name,
+        project_id=project_id,
     )
 
     if not result.success:
+        if result.error == "Workstream not found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=result.error,
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=result.error,
         )
 
-    logger.info("workstream_updated", workstream_id=str(workstream_id))
-    return WorkstreamResponse.model_validate(result.workstream)
+    logger.info(EVT_WORKSTREAM_UPDATED, workstream_id=workstream_id)
+    return _workstream_response(result.workstream)
 
 
 # =============================================================================
@@ -180,8 +271,8 @@ async def update_workstream(
     description="Delete a workstream. Items using it will have workstream_id set to NULL.",
 )
 async def delete_workstream(
-    project_id: UUID,
-    workstream_id: UUID,
+    project_id: ProjectIdPath,
+    workstream_id: WorkstreamIdPath,
     role: ProjectRole = Depends(require_project_manager),
 ):
     """
@@ -189,26 +280,25 @@ async def delete_workstream(
 
     Requires project manager or higher role.
     Items using this workstream will have workstream_id set to NULL.
+    Returns 404 if workstream not found or belongs to different project.
     """
     workstream_service = _get_workstream_service()
-
-    # Verify workstream belongs to project
-    existing = await workstream_service.get_workstream(workstream_id)
-    if not existing or existing.project_id != project_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Workstream not found",
-        )
-
-    result = await workstream_service.delete_workstream(workstream_id)
+    result = await workstream_service.delete_workstream(
+        workstream_id, project_id=project_id
+    )
 
     if not result.success:
+        if result.error == "Workstream not found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=result.error,
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=result.error,
         )
 
-    logger.info("workstream_deleted", workstream_id=str(workstream_id))
+    logger.info(EVT_WORKSTREAM_DELETED, workstream_id=workstream_id)
 
 
 # =============================================================================
@@ -223,7 +313,7 @@ async def delete_workstream(
     description="Reorder workstreams by providing the new order of IDs.",
 )
 async def reorder_workstreams(
-    project_id: UUID,
+    project_id: ProjectIdPath,
     body: WorkstreamReorderRequest,
     role: ProjectRole = Depends(require_project_manager),
 ):
@@ -240,12 +330,9 @@ async def reorder_workstreams(
     )
 
     logger.info(
-        "workstreams_reordered",
-        project_id=str(project_id),
+        EVT_WORKSTREAMS_REORDERED,
+        project_id=project_id,
         count=len(workstreams),
     )
 
-    return WorkstreamListResponse(
-        workstreams=[WorkstreamResponse.model_validate(w) for w in workstreams],
-        total=len(workstreams),
-    )
+    return _workstream_list_response(workstreams)
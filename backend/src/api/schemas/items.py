@@ -322,5 +322,5 @@ class ItemListResponse(BaseModel):
     )
     total: int = Field(
         ...,
-        description="Total number of matching items",
+        description="Total number of items matching the filters, ignoring limit and offset",
     )
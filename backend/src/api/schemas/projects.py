@@ -141,5 +141,9 @@ class ProjectListResponse(BaseModel):
     )
     total: int = Field(
         ...,
-        description="Total number of projects",
+        description="Number of projects in this response",
+    )
+    next_cursor: Optional[UUID] = Field(
+        None,
+        description="Cursor for the next page; null on the last page or when unpaged",
     )
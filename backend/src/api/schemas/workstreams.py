@@ -87,3 +87,7 @@ class WorkstreamListResponse(BaseModel):
         ...,
         description="List of workstreams",
     )
+    next_cursor: Optional[UUID] = Field(
+        None,
+        description="Cursor for the next page; null on the last page or when unpaged",
+    )
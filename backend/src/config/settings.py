@@ -37,11 +37,17 @@ class DatabasePoolConfig:
         min_connections: Minimum connections to keep open in pool
         max_connections: Maximum connections allowed in pool
         connection_timeout: Query timeout in seconds
+        max_inactive_connection_lifetime: Seconds an idle connection above
+            min_connections is kept before being closed
+        statement_cache_size: Prepared statements kept per connection
+            (0 disables, e.g. behind a transaction-mode pooler)
     """
 
-    min_connections: int = 2
-    max_connections: int = 10
+    min_connections: int = 10
+    max_connections: int = 25
     connection_timeout: int = 30
+    max_inactive_connection_lifetime: float = 300.0
+    statement_cache_size: int = 256
 
 
 @dataclass
@@ -55,6 +61,8 @@ class DatabaseConfig:
         name: Database name
         user: Database username
         password: Database password
+        reader_host: Read-replica hostname for read-only queries (empty
+            sends all queries to host)
         pool: Connection pool settings
     """
 
@@ -63,6 +71,7 @@ class DatabaseConfig:
     name: str = "braidmgr_dev"
     user: str = "postgres"
     password: str = "postgres"
+    reader_host: str = ""
     pool: DatabasePoolConfig = field(default_factory=DatabasePoolConfig)
 
 
@@ -24,8 +24,13 @@ from src.domain.core import (
     Workstream,
     ItemNote,
     ItemDependency,
+    ItemColumnBatch,
     ItemType,
     Indicator,
+    ITEM_TYPE_BY_VALUE,
+    INDICATOR_BY_VALUE,
+    ITEM_TYPE_VALUES,
+    INDICATOR_VALUES,
     ProjectResult,
     ItemResult,
     WorkstreamResult,
@@ -53,9 +58,14 @@ __all__ = [
     "Workstream",
     "ItemNote",
     "ItemDependency",
+    "ItemColumnBatch",
     # Core enums
     "ItemType",
     "Indicator",
+    "ITEM_TYPE_BY_VALUE",
+    "INDICATOR_BY_VALUE",
+    "ITEM_TYPE_VALUES",
+    "INDICATOR_VALUES",
     # Core results
     "ProjectResult",
     "ItemResult",
@@ -297,13 +297,14 @@ class AuthResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class CurrentUser:
     """
     Authenticated user context for request handling.
 
     Populated from JWT token by auth dependency.
     Available in route handlers via Depends(get_current_user).
+    Immutable so a cached instance can be shared across requests.
 
     Attributes:
         id: User UUID
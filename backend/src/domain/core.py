@@ -7,12 +7,18 @@ Contains dataclasses representing core project management entities:
 - Workstream: Project-specific grouping of items
 - ItemNote: Dated comment on an item
 - ItemDependency: Predecessor/successor link between items
+- ItemColumnBatch: Column-wise view of a project's items for batch passes
+
+Entities are slotted dataclasses: list queries build one per row, and
+slots drop the per-instance __dict__. They are treated as immutable once
+loaded, so derived flags (is_active, has_dates, ...) are computed in
+__post_init__ and read as plain slots.
 
 Usage:
     from src.domain.core import Project, Item, Workstream, ItemType, Indicator
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -65,12 +71,22 @@ class Indicator(str, Enum):
     COMPLETED = "Completed"
 
 
+# Database value -> member, for row mapping. A plain dict lookup skips
+# Enum.__call__, which is measurable when mapping thousands of item rows.
+ITEM_TYPE_BY_VALUE: dict[str, ItemType] = {m.value: m for m in ItemType}
+INDICATOR_BY_VALUE: dict[str, Indicator] = {m.value: m for m in Indicator}
+
+# Valid database values, for membership checks on raw strings
+ITEM_TYPE_VALUES: frozenset[str] = frozenset(ITEM_TYPE_BY_VALUE)
+INDICATOR_VALUES: frozenset[str] = frozenset(INDICATOR_BY_VALUE)
+
+
 # =============================================================================
 # PROJECT ENTITY
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """
     Project entity - container for items and workstreams.
@@ -90,6 +106,8 @@ class Project:
         created_at: Creation timestamp
         updated_at: Last update timestamp
         deleted_at: Soft delete timestamp (None if active)
+        is_active: Project is active (not soft-deleted); derived
+        has_dates: Project has start and end dates defined; derived
     """
 
     id: UUID
@@ -103,16 +121,12 @@ class Project:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
+    is_active: bool = field(init=False, repr=False, compare=False)
+    has_dates: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_active(self) -> bool:
-        """Project is active (not soft-deleted)."""
-        return self.deleted_at is None
-
-    @property
-    def has_dates(self) -> bool:
-        """Project has start and end dates defined."""
-        return self.project_start is not None and self.project_end is not None
+    def __post_init__(self) -> None:
+        self.is_active = self.deleted_at is None
+        self.has_dates = self.project_start is not None and self.project_end is not None
 
 
 # =============================================================================
@@ -120,7 +134,7 @@ class Project:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Workstream:
     """
     Workstream entity - project-specific grouping.
@@ -146,7 +160,7 @@ class Workstream:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """
     Item entity - RAID log entry.
@@ -177,6 +191,11 @@ class Item:
         created_at: Creation timestamp
         updated_at: Last update timestamp
         deleted_at: Soft delete timestamp (None if active)
+        is_active: Item is active (not soft-deleted); derived
+        is_draft: Item is in draft mode; derived
+        is_complete: Item is 100% complete; derived
+        has_dates: Item has start and finish dates defined; derived
+        has_deadline: Item has a deadline defined; derived
     """
 
     id: UUID
@@ -201,31 +220,18 @@ class Item:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
+    is_active: bool = field(init=False, repr=False, compare=False)
+    is_draft: bool = field(init=False, repr=False, compare=False)
+    is_complete: bool = field(init=False, repr=False, compare=False)
+    has_dates: bool = field(init=False, repr=False, compare=False)
+    has_deadline: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_active(self) -> bool:
-        """Item is active (not soft-deleted)."""
-        return self.deleted_at is None
-
-    @property
-    def is_draft(self) -> bool:
-        """Item is in draft mode."""
-        return self.draft
-
-    @property
-    def is_complete(self) -> bool:
-        """Item is 100% complete."""
-        return self.percent_complete >= 100
-
-    @property
-    def has_dates(self) -> bool:
-        """Item has start and finish dates defined."""
-        return self.start_date is not None and self.finish_date is not None
-
-    @property
-    def has_deadline(self) -> bool:
-        """Item has a deadline defined."""
-        return self.deadline is not None
+    def __post_init__(self) -> None:
+        self.is_active = self.deleted_at is None
+        self.is_draft = self.draft
+        self.is_complete = self.percent_complete >= 100
+        self.has_dates = self.start_date is not None and self.finish_date is not None
+        self.has_deadline = self.deadline is not None
 
 
 # =============================================================================
@@ -233,7 +239,7 @@ class Item:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemNote:
     """
     Item note entity - dated comment on an item.
@@ -263,7 +269,7 @@ class ItemNote:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemDependency:
     """
     Item dependency - predecessor/successor link.
@@ -280,6 +286,44 @@ class ItemDependency:
     depends_on_id: UUID
 
 
+# =============================================================================
+# ITEM COLUMN BATCH
+# =============================================================================
+
+
+@dataclass(slots=True)
+class ItemColumnBatch:
+    """
+    Column-wise view of a project's items.
+
+    Whole-project passes such as indicator recalculation read a handful of
+    fields from every item; one tuple per column skips building an Item
+    (and its unused fields) per row. Columns share the same row order.
+
+    Attributes:
+        ids: Item identifiers
+        draft: Draft flags
+        percent_complete: Completion percentages
+        start_date: Planned start dates
+        finish_date: Planned finish dates
+        deadline: Hard deadlines
+        updated_at: Last update timestamps
+        indicator: Currently stored indicators
+    """
+
+    ids: tuple[UUID, ...] = ()
+    draft: tuple[bool, ...] = ()
+    percent_complete: tuple[int, ...] = ()
+    start_date: tuple[Optional[date], ...] = ()
+    finish_date: tuple[Optional[date], ...] = ()
+    deadline: tuple[Optional[date], ...] = ()
+    updated_at: tuple[Optional[datetime], ...] = ()
+    indicator: tuple[Optional[Indicator], ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
 # =============================================================================
 # RESULT DATACLASSES
 # =============================================================================
@@ -287,7 +331,7 @@ class ItemDependency:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectResult:
     """
     Result of a project operation.
@@ -305,7 +349,7 @@ class ProjectResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemResult:
     """
     Result of an item operation.
@@ -323,7 +367,7 @@ class ItemResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkstreamResult:
     """
     Result of a workstream operation.
@@ -341,7 +385,7 @@ class WorkstreamResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemNoteResult:
     """
     Result of an item note operation.
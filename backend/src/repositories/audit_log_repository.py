@@ -9,10 +9,17 @@ The audit_log table stores:
 - Timestamps for chronological ordering
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Any
+from functools import lru_cache
+from operator import itemgetter
+from sys import intern
+from typing import Any, Optional
 from uuid import UUID
 
+import orjson
+
+from src.domain.auth import ProjectRole
 from src.services.aurora_service import AuroraService
 from src.utils.logging import get_logger
 
@@ -24,52 +31,207 @@ logger = get_logger(__name__)
 # =============================================================================
 
 
+@dataclass(slots=True)
 class AuditEntry:
-    """Represents a single audit log entry."""
-
-    def __init__(
-        self,
-        id: UUID,
-        user_id: Optional[UUID],
-        action: str,
-        entity_type: str,
-        entity_id: Optional[UUID],
-        before_state: Optional[dict],
-        after_state: Optional[dict],
-        correlation_id: Optional[str],
-        created_at: datetime,
-        # Joined fields
-        user_name: Optional[str] = None,
-        user_email: Optional[str] = None,
-    ):
-        self.id = id
-        self.user_id = user_id
-        self.action = action
-        self.entity_type = entity_type
-        self.entity_id = entity_id
-        self.before_state = before_state
-        self.after_state = after_state
-        self.correlation_id = correlation_id
-        self.created_at = created_at
-        self.user_name = user_name
-        self.user_email = user_email
+    """
+    Represents a single audit log entry.
+
+    before_state and after_state hold the raw JSON bytes read from jsonb;
+    use the *_parsed properties to inspect them.
+    """
+
+    id: UUID
+    user_id: Optional[UUID]
+    action: str
+    entity_type: str
+    entity_id: Optional[UUID]
+    before_state: Optional[bytes]
+    after_state: Optional[bytes]
+    correlation_id: Optional[str]
+    created_at: datetime
+    # Joined fields
+    user_name: Optional[str] = None
+    user_email: Optional[str] = None
+
+    @property
+    def before_state_parsed(self) -> Optional[dict]:
+        """Entity state before the change, decoded."""
+        return orjson.loads(self.before_state) if self.before_state else None
+
+    @property
+    def after_state_parsed(self) -> Optional[dict]:
+        """Entity state after the change, decoded."""
+        return orjson.loads(self.after_state) if self.after_state else None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for API response."""
+        """
+        Convert to dictionary for API response.
+
+        UUIDs and timestamps are left native; orjson encodes them directly.
+        """
         return {
-            "id": str(self.id),
-            "user_id": str(self.user_id) if self.user_id else None,
+            "id": self.id,
+            "user_id": self.user_id,
             "user_name": self.user_name,
             "user_email": self.user_email,
             "action": self.action,
             "entity_type": self.entity_type,
-            "entity_id": str(self.entity_id) if self.entity_id else None,
-            "before_state": self.before_state,
-            "after_state": self.after_state,
+            "entity_id": self.entity_id,
+            "before_state": self.before_state_parsed,
+            "after_state": self.after_state_parsed,
             "correlation_id": self.correlation_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Encode straight to JSON, without building the to_dict mapping.
+
+        The state blobs are already JSON, so they are spliced in as-is
+        rather than decoded and re-encoded. The document has the same keys
+        and values as to_dict.
+        """
+        head = orjson.dumps({
+            "id": self.id,
+            "user_id": self.user_id,
+            "user_name": self.user_name,
+            "user_email": self.user_email,
+            "action": self.action,
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "correlation_id": self.correlation_id,
+            "created_at": self.created_at,
+        })
+        return b"".join((
+            head[:-1],
+            b',"before_state":',
+            self.before_state or b"null",
+            b',"after_state":',
+            self.after_state or b"null",
+            b"}",
+        ))
+
+
+# Row columns in AuditEntry field order after action and entity_type, so
+# entries are built positionally instead of through eleven keyword arguments
+# per row
+_AUDIT_TAIL_FIELDS = itemgetter(
+    "entity_id",
+    "before_state",
+    "after_state",
+    "correlation_id",
+    "created_at",
+    "user_name",
+    "user_email",
+)
+
+
+# Select list and join shared by every query that returns AuditEntry rows;
+# the columns match _row_to_entry
+_AUDIT_SELECT = """
+            SELECT
+                a.id,
+                a.user_id,
+                a.action,
+                a.entity_type,
+                a.entity_id,
+                a.before_state,
+                a.after_state,
+                a.correlation_id,
+                a.created_at,
+                u.name as user_name,
+                u.email as user_email"""
+_AUDIT_FROM = """
+            FROM audit_log a
+            LEFT JOIN users u ON u.id = a.user_id"""
+
+_ITEM_HISTORY_QUERY = f"""{_AUDIT_SELECT}{_AUDIT_FROM}
+            WHERE a.entity_type = 'item' AND a.entity_id = $1
+            ORDER BY a.created_at DESC
+            LIMIT $2
+        """
+
+
+# =============================================================================
+# Project Activity SQL
+# =============================================================================
+# The feed's SQL text depends only on which optional filters are present, so
+# each shape is built once. Identical text also lets asyncpg reuse the
+# statement it prepared on the connection for the previous request.
+# =============================================================================
+
+# Entries carry their project (migration 003), so the feed is one range
+# scan on idx_audit_log_project_created
+_PROJECT_ACTIVITY_SCOPE = """
+              AND a.project_id = $2"""
+
+
+def _activity_filters(first_idx: int, has_types: bool, has_search: bool) -> str:
+    """
+    Entity type and search filters, with placeholders numbered from first_idx.
+
+    Entity types are bound as a single text[] parameter.
+    """
+    sql = ""
+    idx = first_idx
+    if has_types:
+        sql += f"""
+              AND a.entity_type = ANY(${idx}::text[])"""
+        idx += 1
+    if has_search:
+        # search_text is action plus before/after state, trigram-indexed
+        # (migration 004)
+        sql += f"""
+              AND a.search_text ILIKE ${idx}"""
+    return sql
+
+
+@lru_cache(maxsize=16)
+def _project_activity_queries(
+    has_types: bool, has_search: bool, with_role: bool, with_total: bool = False
+) -> tuple[str, str]:
+    """
+    Build the project activity page and count SQL for one filter shape.
+
+    Args:
+        has_types: Whether an entity type filter is bound.
+        has_search: Whether a search pattern is bound.
+        with_role: Whether the count also returns and requires the
+            caller's role ($3 is then the user id).
+        with_total: Whether page rows carry the unpaginated match count
+            as a total column.
+
+    Returns:
+        Tuple of (page query, count query)
+    """
+    total_select = ",\n                COUNT(*) OVER () as total" if with_total else ""
+    query = f"""{_AUDIT_SELECT}{total_select}{_AUDIT_FROM}
+            WHERE a.created_at >= $1{_PROJECT_ACTIVITY_SCOPE}{_activity_filters(5, has_types, has_search)}
+            ORDER BY a.created_at DESC
+            LIMIT $3 OFFSET $4
+        """
+
+    role_select = ""
+    role_filter = ""
+    if with_role:
+        role_select = """,
+                (SELECT role FROM user_project_roles
+                 WHERE user_id = $3 AND project_id = $2) as caller_role"""
+        role_filter = """
+              AND EXISTS (
+                  SELECT 1 FROM user_project_roles
+                  WHERE user_id = $3 AND project_id = $2
+              )"""
+    count_filters = _activity_filters(4 if with_role else 3, has_types, has_search)
+
+    count_query = f"""
+            SELECT COUNT(*) as total{role_select}
+            FROM audit_log a
+            WHERE a.created_at >= $1{_PROJECT_ACTIVITY_SCOPE}{role_filter}{count_filters}
+        """
+
+    return query, count_query
+
 
 # =============================================================================
 # Repository
@@ -91,6 +253,7 @@ class AuditLogRepository:
         before_state: Optional[dict] = None,
         after_state: Optional[dict] = None,
         correlation_id: Optional[str] = None,
+        project_id: Optional[UUID] = None,
     ) -> UUID:
         """
         Create a new audit log entry.
@@ -103,16 +266,29 @@ class AuditLogRepository:
             before_state: Entity state before the change (for updates)
             after_state: Entity state after the change
             correlation_id: Request correlation ID for tracing
+            project_id: Project the entity belongs to. When omitted it is
+                resolved in the insert: the entity itself for projects, the
+                owning project for items and workstreams. Other entries
+                without one stay out of project feeds.
 
         Returns:
             UUID of the created entry
         """
+        # The feed filters on audit_log.project_id alone, so entries for
+        # project-scoped entities must never be written without one
         query = """
             INSERT INTO audit_log (
                 user_id, action, entity_type, entity_id,
-                before_state, after_state, correlation_id
+                before_state, after_state, correlation_id, project_id
+            )
+            VALUES (
+                $1, $2, $3::text, $4::uuid, $5, $6, $7,
+                COALESCE($8::uuid, CASE $3::text
+                    WHEN 'project' THEN $4::uuid
+                    WHEN 'item' THEN (SELECT project_id FROM items WHERE id = $4)
+                    WHEN 'workstream' THEN (SELECT project_id FROM workstreams WHERE id = $4)
+                END)
             )
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
             RETURNING id
         """
 
@@ -125,6 +301,7 @@ class AuditLogRepository:
             before_state,
             after_state,
             correlation_id,
+            project_id,
         )
 
         return result["id"]
@@ -154,115 +331,108 @@ class AuditLogRepository:
         Returns:
             Tuple of (entries list, total count)
         """
-        since_date = datetime.utcnow() - timedelta(days=days)
+        query, params, count_query, count_params = self._project_activity_sql(
+            project_id, limit, offset, days, entity_types, search, with_total=True
+        )
 
-        # Build entity type filter
-        type_filter = ""
-        if entity_types:
-            placeholders = ", ".join([f"${i+5}" for i in range(len(entity_types))])
-            type_filter = f"AND a.entity_type IN ({placeholders})"
+        # The window count rides along on each page row, so one query
+        # returns both; only a page past the end needs the count query
+        rows = await self.aurora.fetch_all(query, *params)
+        entries = list(map(self._row_to_entry, rows))
 
-        # Build search filter
-        search_filter = ""
-        search_idx = 5 + len(entity_types or [])
-        if search:
-            search_filter = f"""
-                AND (
-                    a.action ILIKE ${search_idx}
-                    OR a.after_state::text ILIKE ${search_idx}
-                    OR a.before_state::text ILIKE ${search_idx}
-                )
-            """
-
-        # Query for entries related to the project
-        query = f"""
-            SELECT
-                a.id,
-                a.user_id,
-                a.action,
-                a.entity_type,
-                a.entity_id,
-                a.before_state,
-                a.after_state,
-                a.correlation_id,
-                a.created_at,
-                u.name as user_name,
-                u.email as user_email
-            FROM audit_log a
-            LEFT JOIN users u ON u.id = a.user_id
-            WHERE a.created_at >= $1
-              AND (
-                  -- Direct project reference
-                  (a.entity_type = 'project' AND a.entity_id = $2)
-                  -- Items belonging to the project
-                  OR (a.entity_type = 'item' AND EXISTS (
-                      SELECT 1 FROM items i WHERE i.id = a.entity_id AND i.project_id = $2
-                  ))
-                  -- Workstreams belonging to the project
-                  OR (a.entity_type = 'workstream' AND EXISTS (
-                      SELECT 1 FROM workstreams w WHERE w.id = a.entity_id AND w.project_id = $2
-                  ))
-              )
-              {type_filter}
-              {search_filter}
-            ORDER BY a.created_at DESC
-            LIMIT $3 OFFSET $4
+        if rows:
+            total = rows[0]["total"]
+        elif offset:
+            count_row = await self.aurora.fetch_one(count_query, *count_params)
+            total = count_row["total"] if count_row else 0
+        else:
+            total = 0
+
+        return entries, total
+
+    async def get_project_activity_for_user(
+        self,
+        project_id: UUID,
+        user_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        days: int = 30,
+        entity_types: Optional[list[str]] = None,
+        search: Optional[str] = None,
+    ) -> tuple[int, Optional[ProjectRole], list[AuditEntry]]:
         """
+        Get activity feed for a project along with the caller's role.
 
-        # Build parameters
-        params: list[Any] = [since_date, project_id, limit, offset]
-        if entity_types:
-            params.extend(entity_types)
-        if search:
-            params.append(f"%{search}%")
+        Same results as get_project_activity. The caller's project role is
+        fetched in the same statement as the count, and the count is gated
+        on it, so the route needs no separate access query. The page (at
+        most one request's limit) is only read when the caller has a role,
+        and is read in full here so query errors surface before a response
+        is started.
+
+        Args:
+            project_id: Project UUID
+            user_id: User requesting the feed
+            limit: Max entries to return
+            offset: Number of entries to skip
+            days: Only include entries from the last N days
+            entity_types: Filter by entity types (item, workstream, project)
+            search: Search in action or entity details
+
+        Returns:
+            Tuple of (total count, caller's role or None, entries list)
+        """
+        query, params, count_query, count_params = self._project_activity_sql(
+            project_id, limit, offset, days, entity_types, search, user_id=user_id
+        )
+
+        count_row = await self.aurora.fetch_one(count_query, *count_params)
+        role = count_row["caller_role"] if count_row else None
+        if not role:
+            return 0, None, []
 
         rows = await self.aurora.fetch_all(query, *params)
+        return count_row["total"], ProjectRole(role), list(map(self._row_to_entry, rows))
 
-        entries = [
-            AuditEntry(
-                id=row["id"],
-                user_id=row["user_id"],
-                action=row["action"],
-                entity_type=row["entity_type"],
-                entity_id=row["entity_id"],
-                before_state=row["before_state"],
-                after_state=row["after_state"],
-                correlation_id=row["correlation_id"],
-                created_at=row["created_at"],
-                user_name=row["user_name"],
-                user_email=row["user_email"],
-            )
-            for row in rows
-        ]
+    def _project_activity_sql(
+        self,
+        project_id: UUID,
+        limit: int,
+        offset: int,
+        days: int,
+        entity_types: Optional[list[str]],
+        search: Optional[str],
+        user_id: Optional[UUID] = None,
+        with_total: bool = False,
+    ) -> tuple[str, list[Any], str, list[Any]]:
+        """
+        Build the project activity page and count queries.
 
-        # Get total count
-        count_query = f"""
-            SELECT COUNT(*) as total
-            FROM audit_log a
-            WHERE a.created_at >= $1
-              AND (
-                  (a.entity_type = 'project' AND a.entity_id = $2)
-                  OR (a.entity_type = 'item' AND EXISTS (
-                      SELECT 1 FROM items i WHERE i.id = a.entity_id AND i.project_id = $2
-                  ))
-                  OR (a.entity_type = 'workstream' AND EXISTS (
-                      SELECT 1 FROM workstreams w WHERE w.id = a.entity_id AND w.project_id = $2
-                  ))
-              )
-              {type_filter}
-              {search_filter}
+        When user_id is given, the count query also returns the user's
+        role on the project as caller_role and only counts if one exists.
+        With with_total, page rows also carry the full match count.
+
+        Returns:
+            Tuple of (query, params, count_query, count_params)
         """
+        since_date = datetime.utcnow() - timedelta(days=days)
+        query, count_query = _project_activity_queries(
+            bool(entity_types), bool(search), user_id is not None, with_total
+        )
 
-        count_params: list[Any] = [since_date, project_id]
+        filter_params: list[Any] = []
         if entity_types:
-            count_params.extend(entity_types)
+            filter_params.append(entity_types)
         if search:
-            count_params.append(f"%{search}%")
+            filter_params.append(f"%{search}%")
 
-        count_row = await self.aurora.fetch_one(count_query, *count_params)
-        total = count_row["total"] if count_row else 0
+        params: list[Any] = [since_date, project_id, limit, offset, *filter_params]
+        count_params: list[Any] = [since_date, project_id]
+        if user_id is not None:
+            count_params.append(user_id)
+        count_params.extend(filter_params)
 
-        return entries, total
+        return query, params, count_query, count_params
 
     async def get_item_history(
         self,
@@ -279,41 +449,22 @@ class AuditLogRepository:
         Returns:
             List of audit entries for the item
         """
-        query = """
-            SELECT
-                a.id,
-                a.user_id,
-                a.action,
-                a.entity_type,
-                a.entity_id,
-                a.before_state,
-                a.after_state,
-                a.correlation_id,
-                a.created_at,
-                u.name as user_name,
-                u.email as user_email
-            FROM audit_log a
-            LEFT JOIN users u ON u.id = a.user_id
-            WHERE a.entity_type = 'item' AND a.entity_id = $1
-            ORDER BY a.created_at DESC
-            LIMIT $2
+        rows = await self.aurora.fetch_all(_ITEM_HISTORY_QUERY, item_id, limit)
+
+        return list(map(self._row_to_entry, rows))
+
+    @staticmethod
+    def _row_to_entry(row: dict) -> AuditEntry:
         """
+        Convert a joined audit_log row to an AuditEntry.
 
-        rows = await self.aurora.fetch_all(query, item_id, limit)
-
-        return [
-            AuditEntry(
-                id=row["id"],
-                user_id=row["user_id"],
-                action=row["action"],
-                entity_type=row["entity_type"],
-                entity_id=row["entity_id"],
-                before_state=row["before_state"],
-                after_state=row["after_state"],
-                correlation_id=row["correlation_id"],
-                created_at=row["created_at"],
-                user_name=row["user_name"],
-                user_email=row["user_email"],
-            )
-            for row in rows
-        ]
+        action and entity_type take a handful of distinct values, so they are
+        interned: a page shares one string per value instead of one per row.
+        """
+        return AuditEntry(
+            row["id"],
+            row["user_id"],
+            intern(row["action"]),
+            intern(row["entity_type"]),
+            *_AUDIT_TAIL_FIELDS(row),
+        )
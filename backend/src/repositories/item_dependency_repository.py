@@ -12,15 +12,30 @@ Usage:
     deps = await repo.get_dependencies(item_id)
 """
 
+from operator import itemgetter
 from typing import Optional
 from uuid import UUID
 
 from src.domain.core import ItemDependency
 from src.services.aurora_service import AuroraService
+from src.utils.cache import TTLCache
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Longest dependency chain followed by the cycle checks. Chains are walked
+# with UNION ALL (no per-row dedup), so the bound also stops the walk should
+# a cycle ever have reached the table.
+MAX_CHAIN_DEPTH = 64
+
+# Row columns in ItemDependency field order, for positional construction
+_DEPENDENCY_FIELDS = itemgetter("item_id", "depends_on_id")
+
+# Prefetched dependency closures. Writes through this repository clear the
+# cache; the short TTL bounds staleness from other processes.
+CLOSURE_CACHE_MAX_ENTRIES = 10_000
+CLOSURE_CACHE_TTL_SECONDS = 5
+
 
 class ItemDependencyRepository:
     """
@@ -37,6 +52,9 @@ class ItemDependencyRepository:
             aurora: Aurora database service for query execution.
         """
         self._aurora = aurora
+        self._closure_cache: TTLCache[UUID, frozenset[UUID]] = TTLCache(
+            maxsize=CLOSURE_CACHE_MAX_ENTRIES, ttl=CLOSURE_CACHE_TTL_SECONDS
+        )
 
     # =========================================================================
     # READ OPERATIONS
@@ -52,40 +70,78 @@ class ItemDependencyRepository:
         Returns:
             List of dependencies where this item is the dependent.
         """
-        rows = await self._aurora.fetch_all(
+        return (await self.get_dependencies_bulk([item_id]))[item_id]
+
+    async def get_dependents(self, item_id: UUID) -> list[ItemDependency]:
+        """
+        Get all items that depend on this item (successors).
+
+        Args:
+            item_id: Item UUID.
+
+        Returns:
+            List of dependencies where this item is the prerequisite.
+        """
+        return (await self.get_dependents_bulk([item_id]))[item_id]
+
+    async def get_dependencies_bulk(
+        self, item_ids: list[UUID]
+    ) -> dict[UUID, list[ItemDependency]]:
+        """
+        Get the predecessors of several items in one query.
+
+        Reads from the replica, so links added or removed moments ago may
+        not show yet. Don't use the result to guard a write.
+
+        Args:
+            item_ids: Item UUIDs.
+
+        Returns:
+            Dict mapping each given item ID to its dependencies ([] if none).
+        """
+        rows = await self._aurora.fetch_all_ro(
             """
             SELECT item_id, depends_on_id
             FROM item_dependencies
-            WHERE item_id = $1
+            WHERE item_id = ANY($1::uuid[])
             """,
-            item_id,
+            item_ids,
         )
-        return [self._row_to_dependency(row) for row in rows]
+        return self._group_by(rows, "item_id", item_ids)
 
-    async def get_dependents(self, item_id: UUID) -> list[ItemDependency]:
+    async def get_dependents_bulk(
+        self, item_ids: list[UUID]
+    ) -> dict[UUID, list[ItemDependency]]:
         """
-        Get all items that depend on this item (successors).
+        Get the successors of several items in one query.
+
+        Reads from the replica, so links added or removed moments ago may
+        not show yet. Don't use the result to guard a write.
 
         Args:
-            item_id: Item UUID.
+            item_ids: Item UUIDs.
 
         Returns:
-            List of dependencies where this item is the prerequisite.
+            Dict mapping each given item ID to the dependencies on it ([] if
+            none).
         """
-        rows = await self._aurora.fetch_all(
+        rows = await self._aurora.fetch_all_ro(
             """
             SELECT item_id, depends_on_id
             FROM item_dependencies
-            WHERE depends_on_id = $1
+            WHERE depends_on_id = ANY($1::uuid[])
             """,
-            item_id,
+            item_ids,
         )
-        return [self._row_to_dependency(row) for row in rows]
+        return self._group_by(rows, "depends_on_id", item_ids)
 
     async def exists(self, item_id: UUID, depends_on_id: UUID) -> bool:
         """
         Check if a dependency exists.
 
+        Runs on the writer, like would_create_cycle: callers use it to
+        guard writes, and replica lag could hide a link just added.
+
         Args:
             item_id: Dependent item UUID.
             depends_on_id: Prerequisite item UUID.
@@ -93,15 +149,16 @@ class ItemDependencyRepository:
         Returns:
             True if dependency exists.
         """
-        row = await self._aurora.fetch_one(
+        # Index-only probe on the (item_id, depends_on_id) primary key
+        return await self._aurora.fetch_val(
             """
-            SELECT 1 FROM item_dependencies
+            SELECT true FROM item_dependencies
             WHERE item_id = $1 AND depends_on_id = $2
+            LIMIT 1
             """,
             item_id,
             depends_on_id,
-        )
-        return row is not None
+        ) is not None
 
     async def would_create_cycle(
         self, item_id: UUID, depends_on_id: UUID
@@ -110,7 +167,8 @@ class ItemDependencyRepository:
         Check if adding this dependency would create a cycle.
 
         Uses recursive CTE to detect if depends_on_id eventually
-        depends on item_id.
+        depends on item_id. Answered from memory when depends_on_id's
+        closure was recently prefetched.
 
         Args:
             item_id: Item that would become dependent.
@@ -119,30 +177,72 @@ class ItemDependencyRepository:
         Returns:
             True if adding this would create a cycle.
         """
+        closure = self._closure_cache.get(depends_on_id)
+        if closure is not None:
+            return item_id in closure
+
         # If item_id depends on depends_on_id, and depends_on_id (transitively)
         # depends on item_id, we have a cycle.
         row = await self._aurora.fetch_one(
             """
             WITH RECURSIVE dep_chain AS (
                 -- Base: direct dependencies of depends_on_id
-                SELECT item_id, depends_on_id
+                SELECT item_id, depends_on_id, 1 AS depth
                 FROM item_dependencies
                 WHERE item_id = $1
 
-                UNION
+                UNION ALL
 
                 -- Recursive: follow the chain
-                SELECT d.item_id, d.depends_on_id
+                SELECT d.item_id, d.depends_on_id, c.depth + 1
                 FROM item_dependencies d
                 INNER JOIN dep_chain c ON d.item_id = c.depends_on_id
+                WHERE c.depth < $3
             )
-            SELECT 1 FROM dep_chain WHERE depends_on_id = $2
+            SELECT 1 FROM dep_chain WHERE depends_on_id = $2 LIMIT 1
             """,
             depends_on_id,
             item_id,
+            MAX_CHAIN_DEPTH,
         )
         return row is not None
 
+    async def prefetch_closure(self, item_id: UUID) -> frozenset[UUID]:
+        """
+        Load everything an item (transitively) depends on, and cache it.
+
+        Call ahead of repeated cycle checks from the same prerequisite;
+        would_create_cycle then answers from memory for a few seconds.
+
+        Args:
+            item_id: Item whose prerequisites to load.
+
+        Returns:
+            IDs of all items reachable through its dependencies.
+        """
+        rows = await self._aurora.fetch_all(
+            """
+            WITH RECURSIVE dep_chain AS (
+                SELECT depends_on_id, 1 AS depth
+                FROM item_dependencies
+                WHERE item_id = $1
+
+                UNION ALL
+
+                SELECT d.depends_on_id, c.depth + 1
+                FROM item_dependencies d
+                INNER JOIN dep_chain c ON d.item_id = c.depends_on_id
+                WHERE c.depth < $2
+            )
+            SELECT DISTINCT depends_on_id FROM dep_chain
+            """,
+            item_id,
+            MAX_CHAIN_DEPTH,
+        )
+        closure = frozenset(row["depends_on_id"] for row in rows)
+        self._closure_cache.set(item_id, closure)
+        return closure
+
     # =========================================================================
     # WRITE OPERATIONS
     # =========================================================================
@@ -151,6 +251,9 @@ class ItemDependencyRepository:
         """
         Add a dependency between items.
 
+        The duplicate and cycle checks run in the same statement as the
+        insert. An item depending on itself counts as a cycle.
+
         Args:
             item_id: Dependent item UUID.
             depends_on_id: Prerequisite item UUID.
@@ -161,30 +264,138 @@ class ItemDependencyRepository:
         Raises:
             ValueError: If dependency already exists or would create cycle.
         """
-        # Check for existing
-        if await self.exists(item_id, depends_on_id):
-            raise ValueError("Dependency already exists")
+        # Duplicate check, cycle check and insert in one round trip; the
+        # INSERT only runs when both checks pass
+        row = await self._aurora.fetch_one(
+            """
+            WITH RECURSIVE dep_chain AS (
+                -- Base: direct dependencies of depends_on_id
+                SELECT depends_on_id, 1 AS depth
+                FROM item_dependencies
+                WHERE item_id = $2
 
-        # Check for cycle
-        if await self.would_create_cycle(item_id, depends_on_id):
-            raise ValueError("Adding this dependency would create a cycle")
+                UNION ALL
 
-        await self._aurora.execute(
-            """
-            INSERT INTO item_dependencies (item_id, depends_on_id)
-            VALUES ($1, $2)
+                -- Recursive: follow the chain
+                SELECT d.depends_on_id, c.depth + 1
+                FROM item_dependencies d
+                INNER JOIN dep_chain c ON d.item_id = c.depends_on_id
+                WHERE c.depth < $3
+            ),
+            checks AS (
+                SELECT
+                    EXISTS (
+                        SELECT 1 FROM item_dependencies
+                        WHERE item_id = $1 AND depends_on_id = $2
+                    ) AS already_exists,
+                    (
+                        $1::uuid = $2::uuid
+                        OR EXISTS (SELECT 1 FROM dep_chain WHERE depends_on_id = $1)
+                    ) AS creates_cycle
+            ),
+            inserted AS (
+                INSERT INTO item_dependencies (item_id, depends_on_id)
+                SELECT $1, $2 FROM checks
+                WHERE NOT already_exists AND NOT creates_cycle
+                RETURNING 1
+            )
+            SELECT already_exists, creates_cycle FROM checks
             """,
             item_id,
             depends_on_id,
+            MAX_CHAIN_DEPTH,
         )
 
+        if row["already_exists"]:
+            raise ValueError("Dependency already exists")
+        if row["creates_cycle"]:
+            raise ValueError("Adding this dependency would create a cycle")
+
+        # A new link extends the closure of every item upstream of it
+        self._closure_cache.clear()
         logger.info(
             "item_dependency_added",
-            item_id=str(item_id),
-            depends_on_id=str(depends_on_id),
+            item_id=item_id,
+            depends_on_id=depends_on_id,
         )
         return ItemDependency(item_id=item_id, depends_on_id=depends_on_id)
 
+    async def add_many(self, pairs: list[tuple[UUID, UUID]]) -> int:
+        """
+        Add several dependencies in one statement.
+
+        The whole batch is checked for cycles first, counting both the
+        existing links and the other new ones. If any new link would close a
+        cycle, nothing is inserted. Links that already exist are skipped.
+
+        Args:
+            pairs: (item_id, depends_on_id) tuples.
+
+        Returns:
+            Number of dependencies inserted.
+
+        Raises:
+            ValueError: If any of the new dependencies would create a cycle.
+        """
+        if not pairs:
+            return 0
+
+        item_ids, depends_on_ids = (list(column) for column in zip(*pairs))
+        row = await self._aurora.fetch_one(
+            """
+            WITH RECURSIVE candidates AS (
+                SELECT *
+                FROM UNNEST($1::uuid[], $2::uuid[]) AS c(item_id, depends_on_id)
+            ),
+            -- Everything each distinct prerequisite (transitively) depends
+            -- on, walked once however many candidates share it
+            reach AS (
+                SELECT DISTINCT depends_on_id AS src, depends_on_id AS node
+                FROM candidates
+
+                UNION
+
+                -- Existing links are joined in place so each step can use
+                -- the item_id index instead of materializing the table
+                SELECT r.src, e.depends_on_id
+                FROM reach r
+                INNER JOIN (
+                    SELECT item_id, depends_on_id FROM item_dependencies
+                    UNION ALL
+                    SELECT item_id, depends_on_id FROM candidates
+                ) e ON e.item_id = r.node
+            ),
+            -- Candidates whose prerequisite leads back to the dependent item
+            cycles AS (
+                SELECT DISTINCT c.item_id, c.depends_on_id
+                FROM candidates c
+                INNER JOIN reach r
+                    ON r.src = c.depends_on_id AND r.node = c.item_id
+            ),
+            inserted AS (
+                INSERT INTO item_dependencies (item_id, depends_on_id)
+                SELECT item_id, depends_on_id FROM candidates
+                WHERE NOT EXISTS (SELECT 1 FROM cycles)
+                ON CONFLICT DO NOTHING
+                RETURNING 1
+            )
+            SELECT
+                (SELECT COUNT(*) FROM inserted) AS inserted,
+                (SELECT COUNT(*) FROM cycles) AS cycles
+            """,
+            item_ids,
+            depends_on_ids,
+        )
+
+        if row["cycles"]:
+            raise ValueError("Adding these dependencies would create a cycle")
+
+        count = row["inserted"]
+        if count:
+            self._closure_cache.clear()
+        logger.info("item_dependencies_added", requested=len(pairs), count=count)
+        return count
+
     async def remove(self, item_id: UUID, depends_on_id: UUID) -> bool:
         """
         Remove a dependency between items.
@@ -196,20 +407,21 @@ class ItemDependencyRepository:
         Returns:
             True if dependency was removed, False if not found.
         """
-        result = await self._aurora.execute(
+        deleted = await self._aurora.fetch_val(
             """
             DELETE FROM item_dependencies
             WHERE item_id = $1 AND depends_on_id = $2
+            RETURNING true
             """,
             item_id,
             depends_on_id,
-        )
-        deleted = result == "DELETE 1"
+        ) is not None
         if deleted:
+            self._closure_cache.clear()
             logger.info(
                 "item_dependency_removed",
-                item_id=str(item_id),
-                depends_on_id=str(depends_on_id),
+                item_id=item_id,
+                depends_on_id=depends_on_id,
             )
         return deleted
 
@@ -225,19 +437,30 @@ class ItemDependencyRepository:
         Returns:
             Number of dependencies removed.
         """
-        result = await self._aurora.execute(
+        count = await self._aurora.fetch_val(
             """
-            DELETE FROM item_dependencies
-            WHERE item_id = $1 OR depends_on_id = $1
+            -- One index scan per direction (primary key and
+            -- idx_item_dependencies_depends_on) instead of an OR predicate
+            WITH victims AS (
+                SELECT ctid FROM item_dependencies WHERE item_id = $1
+                UNION ALL
+                SELECT ctid FROM item_dependencies WHERE depends_on_id = $1
+            ),
+            deleted AS (
+                DELETE FROM item_dependencies d
+                USING victims v
+                WHERE d.ctid = v.ctid
+                RETURNING 1
+            )
+            SELECT COUNT(*) FROM deleted
             """,
             item_id,
         )
-        # Parse count from result like "DELETE 5"
-        count = int(result.split()[1]) if result else 0
         if count > 0:
+            self._closure_cache.clear()
             logger.info(
                 "item_dependencies_cleared",
-                item_id=str(item_id),
+                item_id=item_id,
                 count=count,
             )
         return count
@@ -246,6 +469,26 @@ class ItemDependencyRepository:
     # HELPERS
     # =========================================================================
 
+    @classmethod
+    def _group_by(
+        cls, rows: list[dict], key: str, item_ids: list[UUID]
+    ) -> dict[UUID, list[ItemDependency]]:
+        """
+        Partition dependency rows by one of their columns.
+
+        Args:
+            rows: Database row dicts.
+            key: Column to group on (item_id or depends_on_id).
+            item_ids: IDs that must appear in the result, even without rows.
+
+        Returns:
+            Dict mapping each ID to its dependencies, in row order.
+        """
+        grouped: dict[UUID, list[ItemDependency]] = {i: [] for i in item_ids}
+        for row in rows:
+            grouped[row[key]].append(cls._row_to_dependency(row))
+        return grouped
+
     @staticmethod
     def _row_to_dependency(row) -> Optional[ItemDependency]:
         """
@@ -260,7 +503,4 @@ class ItemDependencyRepository:
         if row is None:
             return None
 
-        return ItemDependency(
-            item_id=row["item_id"],
-            depends_on_id=row["depends_on_id"],
-        )
+        return ItemDependency(*_DEPENDENCY_FIELDS(row))
@@ -13,7 +13,9 @@ Usage:
 """
 
 from datetime import date, datetime
-from typing import Optional
+from itertools import starmap
+from operator import itemgetter
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
 from src.domain.core import ItemNote
@@ -22,6 +24,24 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Row columns in ItemNote field order, for positional construction
+_NOTE_FIELDS = itemgetter(
+    "id", "item_id", "note_date", "content", "created_by", "created_at"
+)
+
+# Columns a projection may select; names are interpolated into SQL, so
+# nothing outside this set is ever accepted
+NOTE_COLUMNS = frozenset(
+    {"id", "item_id", "note_date", "content", "created_by", "created_at"}
+)
+
+_NOTES_BY_ITEM_QUERY = """
+            SELECT id, item_id, note_date, content, created_by, created_at
+            FROM item_notes
+            WHERE item_id = $1
+            ORDER BY note_date DESC, created_at DESC
+            """
+
 
 class ItemNoteRepository:
     """
@@ -53,7 +73,7 @@ class ItemNoteRepository:
         Returns:
             ItemNote if found, None otherwise.
         """
-        row = await self._aurora.fetch_one(
+        row = await self._aurora.fetch_one_ro(
             """
             SELECT id, item_id, note_date, content, created_by, created_at
             FROM item_notes
@@ -73,16 +93,64 @@ class ItemNoteRepository:
         Returns:
             List of notes ordered by date descending.
         """
-        rows = await self._aurora.fetch_all(
-            """
-            SELECT id, item_id, note_date, content, created_by, created_at
+        rows = await self._aurora.fetch_all_ro(_NOTES_BY_ITEM_QUERY, item_id)
+        return list(starmap(ItemNote, map(_NOTE_FIELDS, rows)))
+
+    async def get_by_item_id_projection(
+        self, item_id: UUID, fields: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        """
+        Get selected columns of an item's notes without building ItemNotes.
+
+        For listings that only render a couple of fields: rows come back
+        as plain dicts holding just those columns, in get_by_item_id order.
+
+        Args:
+            item_id: Item UUID.
+            fields: Column names to select, each one of NOTE_COLUMNS.
+
+        Returns:
+            One dict per note, ordered by date descending.
+
+        Raises:
+            ValueError: If fields is empty or names an unknown column.
+        """
+        if not fields:
+            raise ValueError("At least one field is required")
+        unknown = set(fields) - NOTE_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown note fields: {sorted(unknown)}")
+
+        return await self._aurora.fetch_all_ro(
+            f"""
+            SELECT {", ".join(fields)}
             FROM item_notes
             WHERE item_id = $1
             ORDER BY note_date DESC, created_at DESC
             """,
             item_id,
         )
-        return [self._row_to_note(row) for row in rows]
+
+    async def stream_by_item_id(
+        self, item_id: UUID, *, prefetch: int = 256
+    ) -> AsyncIterator[ItemNote]:
+        """
+        Stream an item's notes from a server-side cursor.
+
+        Same notes and order as get_by_item_id, but only one batch is held
+        in memory at a time, for items with very long note histories.
+
+        Args:
+            item_id: Item UUID.
+            prefetch: Rows fetched per round trip.
+
+        Yields:
+            Notes ordered by date descending.
+        """
+        async for row in self._aurora.stream(
+            _NOTES_BY_ITEM_QUERY, item_id, prefetch=prefetch
+        ):
+            yield self._row_to_note(row)
 
     # =========================================================================
     # WRITE OPERATIONS
@@ -121,8 +189,8 @@ class ItemNoteRepository:
         note = self._row_to_note(row)
         logger.info(
             "item_note_created",
-            note_id=str(note.id),
-            item_id=str(item_id),
+            note_id=note.id,
+            item_id=item_id,
         )
         return note
 
@@ -144,36 +212,30 @@ class ItemNoteRepository:
 
         Returns:
             Updated note, or None if not found.
-        """
-        updates = []
-        params = []
-        param_num = 1
-
-        if content is not None:
-            updates.append(f"content = ${param_num}")
-            params.append(content)
-            param_num += 1
-
-        if note_date is not None:
-            updates.append(f"note_date = ${param_num}")
-            params.append(note_date)
-            param_num += 1
 
-        if not updates:
-            return await self.get_by_id(note_id)
-
-        params.append(note_id)
+        Raises:
+            ValueError: If neither field is provided; callers with nothing
+                to patch should skip the call rather than pay a round-trip.
+        """
+        if content is None and note_date is None:
+            raise ValueError("No fields to update")
 
-        query = f"""
+        # One statement text for every combination of fields, so it is
+        # prepared once per connection; NULL keeps the current value
+        row = await self._aurora.fetch_one(
+            """
             UPDATE item_notes
-            SET {", ".join(updates)}
-            WHERE id = ${param_num}
+            SET content = COALESCE($1, content),
+                note_date = COALESCE($2, note_date)
+            WHERE id = $3
             RETURNING id, item_id, note_date, content, created_by, created_at
-        """
-
-        row = await self._aurora.fetch_one(query, *params)
+            """,
+            content,
+            note_date,
+            note_id,
+        )
         if row:
-            logger.info("item_note_updated", note_id=str(note_id))
+            logger.info("item_note_updated", note_id=note_id)
         return self._row_to_note(row)
 
     async def delete(self, note_id: UUID) -> bool:
@@ -186,15 +248,14 @@ class ItemNoteRepository:
         Returns:
             True if note was deleted, False if not found.
         """
-        result = await self._aurora.execute(
+        deleted = await self._aurora.fetch_val(
             """
-            DELETE FROM item_notes WHERE id = $1
+            DELETE FROM item_notes WHERE id = $1 RETURNING true
             """,
             note_id,
-        )
-        deleted = result == "DELETE 1"
+        ) is not None
         if deleted:
-            logger.info("item_note_deleted", note_id=str(note_id))
+            logger.info("item_note_deleted", note_id=note_id)
         return deleted
 
     # =========================================================================
@@ -215,11 +276,4 @@ class ItemNoteRepository:
         if row is None:
             return None
 
-        return ItemNote(
-            id=row["id"],
-            item_id=row["item_id"],
-            note_date=row["note_date"],
-            content=row["content"],
-            created_by=row["created_by"],
-            created_at=row["created_at"],
-        )
+        return ItemNote(*_NOTE_FIELDS(row))
@@ -151,7 +151,7 @@ class OAuthAccountRepository:
         account = self._row_to_account(row)
         logger.info(
             "oauth_account_linked",
-            user_id=str(user_id),
+            user_id=user_id,
             provider=provider.value,
         )
         return account
@@ -175,7 +175,7 @@ class OAuthAccountRepository:
         )
         deleted = result == "DELETE 1"
         if deleted:
-            logger.info("oauth_account_unlinked", account_id=str(account_id))
+            logger.info("oauth_account_unlinked", account_id=account_id)
         return deleted
 
     async def delete_for_user(self, user_id: UUID, provider: OAuthProvider) -> bool:
@@ -201,7 +201,7 @@ class OAuthAccountRepository:
         if deleted:
             logger.info(
                 "oauth_account_unlinked",
-                user_id=str(user_id),
+                user_id=user_id,
                 provider=provider.value,
             )
         return deleted
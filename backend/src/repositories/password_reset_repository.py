@@ -121,7 +121,7 @@ class PasswordResetRepository:
         )
 
         token = self._row_to_token(row)
-        logger.info("password_reset_token_created", user_id=str(user_id))
+        logger.info("password_reset_token_created", user_id=user_id)
         return token
 
     async def mark_used(self, token_id: UUID) -> bool:
@@ -145,7 +145,7 @@ class PasswordResetRepository:
         )
         marked = result == "UPDATE 1"
         if marked:
-            logger.info("password_reset_token_used", token_id=str(token_id))
+            logger.info("password_reset_token_used", token_id=token_id)
         return marked
 
     async def invalidate_all_for_user(self, user_id: UUID) -> int:
@@ -173,7 +173,7 @@ class PasswordResetRepository:
         if count > 0:
             logger.debug(
                 "password_reset_tokens_invalidated",
-                user_id=str(user_id),
+                user_id=user_id,
                 count=count,
             )
         return count
@@ -16,6 +16,9 @@ from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
+from asyncpg import Connection
+
+from src.domain.auth import ProjectRole
 from src.domain.core import Project
 from src.services.aurora_service import AuroraService
 from src.utils.logging import get_logger
@@ -65,6 +68,42 @@ class ProjectRepository:
         )
         return self._row_to_project(row)
 
+    async def get_with_user_role(
+        self, project_id: UUID, user_id: UUID
+    ) -> tuple[Optional[Project], Optional[ProjectRole]]:
+        """
+        Get a project and a user's role on it in one query.
+
+        Both lookups are outer-joined onto a single row, so a missing
+        project and a missing role are reported independently.
+
+        Args:
+            project_id: Project UUID.
+            user_id: User UUID.
+
+        Returns:
+            (project, role) - project is None if not found or deleted,
+            role is None if the user has no role on the project.
+        """
+        row = await self._aurora.fetch_one(
+            """
+            SELECT p.id, p.organization_id, p.name, p.client_name, p.project_start,
+                   p.project_end, p.next_item_num, p.indicators_updated,
+                   p.created_at, p.updated_at, p.deleted_at,
+                   r.role AS caller_role
+            FROM (SELECT 1) AS one
+            LEFT JOIN projects p ON p.id = $1 AND p.deleted_at IS NULL
+            LEFT JOIN user_project_roles r ON r.project_id = $1 AND r.user_id = $2
+            """,
+            project_id,
+            user_id,
+        )
+        if row is None:
+            return None, None
+        project = self._row_to_project(row) if row["id"] is not None else None
+        role = ProjectRole(row["caller_role"]) if row["caller_role"] else None
+        return project, role
+
     async def get_by_org_id(self, org_id: UUID) -> list[Project]:
         """
         Get all projects for an organization.
@@ -88,19 +127,43 @@ class ProjectRepository:
         )
         return [self._row_to_project(row) for row in rows]
 
-    async def list_for_user(self, user_id: UUID, org_id: UUID) -> list[Project]:
+    async def list_for_user(
+        self,
+        user_id: UUID,
+        org_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[UUID] = None,
+    ) -> list[Project]:
         """
-        Get all projects a user has access to in an organization.
+        Get projects a user has access to in an organization.
+
+        Results are ordered by (name, id). Pass limit/after for keyset
+        pagination: after is the id of the last project already returned.
 
         Args:
             user_id: User UUID.
             org_id: Organization UUID.
+            limit: Maximum results (optional, all if omitted).
+            after: Return only projects sorting after this one (optional).
 
         Returns:
             List of projects the user has a role on.
         """
+        params: list = [user_id, org_id]
+        keyset = ""
+        if after is not None:
+            params.append(after)
+            keyset = f"""
+              AND (p.name, p.id) > (
+                  SELECT c.name, c.id FROM projects c WHERE c.id = ${len(params)}
+              )"""
+        page = ""
+        if limit is not None:
+            params.append(limit)
+            page = f"LIMIT ${len(params)}"
+
         rows = await self._aurora.fetch_all(
-            """
+            f"""
             SELECT p.id, p.organization_id, p.name, p.client_name, p.project_start,
                    p.project_end, p.next_item_num, p.indicators_updated,
                    p.created_at, p.updated_at, p.deleted_at
@@ -108,11 +171,11 @@ class ProjectRepository:
             INNER JOIN user_project_roles upr ON upr.project_id = p.id
             WHERE upr.user_id = $1
               AND p.organization_id = $2
-              AND p.deleted_at IS NULL
-            ORDER BY p.name ASC
+              AND p.deleted_at IS NULL{keyset}
+            ORDER BY p.name ASC, p.id ASC
+            {page}
             """,
-            user_id,
-            org_id,
+            *params,
         )
         return [self._row_to_project(row) for row in rows]
 
@@ -145,6 +208,8 @@ class ProjectRepository:
         client_name: Optional[str] = None,
         project_start: Optional[date] = None,
         project_end: Optional[date] = None,
+        *,
+        tx: Optional[Connection] = None,
     ) -> Project:
         """
         Create a new project.
@@ -155,6 +220,7 @@ class ProjectRepository:
             client_name: Client/customer name (optional).
             project_start: Project start date (optional).
             project_end: Project end date (optional).
+            tx: Optional connection to run in an open transaction.
 
         Returns:
             Created project.
@@ -172,9 +238,10 @@ class ProjectRepository:
             client_name,
             project_start,
             project_end,
+            tx=tx,
         )
         project = self._row_to_project(row)
-        logger.info("project_created", project_id=str(project.id), name=name)
+        logger.info("project_created", project_id=project.id, name=name)
         return project
 
     async def update(
@@ -242,7 +309,7 @@ class ProjectRepository:
 
         row = await self._aurora.fetch_one(query, *params)
         if row:
-            logger.info("project_updated", project_id=str(project_id))
+            logger.info("project_updated", project_id=project_id)
         return self._row_to_project(row)
 
     async def soft_delete(self, project_id: UUID) -> bool:
@@ -267,14 +334,60 @@ class ProjectRepository:
         )
         deleted = result == "UPDATE 1"
         if deleted:
-            logger.info("project_deleted", project_id=str(project_id))
+            logger.info("project_deleted", project_id=project_id)
         return deleted
 
+    async def soft_delete_with_role(
+        self,
+        project_id: UUID,
+        user_id: UUID,
+        required_role: ProjectRole,
+    ) -> tuple[Optional[ProjectRole], bool]:
+        """
+        Soft delete a project if the user holds the required role on it.
+
+        The role lookup and the delete run as one statement, so the
+        caller's permission and the write cost a single round trip.
+
+        Args:
+            project_id: Project UUID.
+            user_id: User UUID.
+            required_role: Role the user must hold to delete.
+
+        Returns:
+            (role, deleted) - role is the user's role (None if no access),
+            deleted is True if the project was deleted by this call.
+        """
+        row = await self._aurora.fetch_one(
+            """
+            WITH caller AS (
+                SELECT role FROM user_project_roles
+                WHERE project_id = $1 AND user_id = $2
+            ), deleted AS (
+                UPDATE projects
+                SET deleted_at = now(), updated_at = now()
+                WHERE id = $1 AND deleted_at IS NULL
+                  AND (SELECT role FROM caller) = $3
+                RETURNING id
+            )
+            SELECT (SELECT role FROM caller) AS caller_role,
+                   EXISTS (SELECT 1 FROM deleted) AS deleted
+            """,
+            project_id,
+            user_id,
+            required_role.value,
+        )
+        role = ProjectRole(row["caller_role"]) if row["caller_role"] else None
+        if row["deleted"]:
+            logger.info("project_deleted", project_id=project_id)
+        return role, row["deleted"]
+
     async def increment_item_num(self, project_id: UUID) -> int:
         """
         Atomically increment and return the next item number.
 
-        This is used when creating new items to ensure unique item numbers.
+        Deprecated: ItemRepository.create now takes the number from the
+        counter in its own insert statement. Kept for existing callers.
 
         Args:
             project_id: Project UUID.
@@ -302,7 +415,9 @@ class ProjectRepository:
         """
         Update the indicators_updated timestamp.
 
-        Called after batch indicator recalculation.
+        Indicator recalculation stamps the project through
+        ItemRepository.batch_update_indicators instead; this is for
+        callers that set it on its own.
 
         Args:
             project_id: Project UUID.
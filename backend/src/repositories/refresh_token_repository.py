@@ -128,7 +128,7 @@ class RefreshTokenRepository:
         )
 
         token = self._row_to_token(row)
-        logger.debug("refresh_token_created", user_id=str(user_id))
+        logger.debug("refresh_token_created", user_id=user_id)
         return token
 
     async def revoke(self, token_id: UUID) -> bool:
@@ -152,7 +152,7 @@ class RefreshTokenRepository:
         )
         revoked = result == "UPDATE 1"
         if revoked:
-            logger.debug("refresh_token_revoked", token_id=str(token_id))
+            logger.debug("refresh_token_revoked", token_id=token_id)
         return revoked
 
     async def revoke_all_for_user(self, user_id: UUID) -> int:
@@ -181,7 +181,7 @@ class RefreshTokenRepository:
         if count > 0:
             logger.info(
                 "refresh_tokens_revoked_all",
-                user_id=str(user_id),
+                user_id=user_id,
                 count=count,
             )
         return count
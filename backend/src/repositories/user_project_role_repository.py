@@ -15,6 +15,8 @@ Usage:
 from typing import Optional
 from uuid import UUID
 
+from asyncpg import Connection
+
 from src.domain.auth import ProjectRole
 from src.services.aurora_service import AuroraService
 from src.utils.logging import get_logger
@@ -128,6 +130,8 @@ class UserProjectRoleRepository:
         user_id: UUID,
         project_id: UUID,
         role: ProjectRole,
+        *,
+        tx: Optional[Connection] = None,
     ) -> None:
         """
         Assign a role to a user on a project.
@@ -138,6 +142,7 @@ class UserProjectRoleRepository:
             user_id: User UUID.
             project_id: Project UUID.
             role: Role to assign.
+            tx: Optional connection to run in an open transaction.
         """
         await self._aurora.execute(
             """
@@ -148,11 +153,12 @@ class UserProjectRoleRepository:
             user_id,
             project_id,
             role.value,
+            tx=tx,
         )
         logger.info(
             "project_role_assigned",
-            user_id=str(user_id),
-            project_id=str(project_id),
+            user_id=user_id,
+            project_id=project_id,
             role=role.value,
         )
 
@@ -179,7 +185,7 @@ class UserProjectRoleRepository:
         if removed:
             logger.info(
                 "project_role_removed",
-                user_id=str(user_id),
-                project_id=str(project_id),
+                user_id=user_id,
+                project_id=project_id,
             )
         return removed
@@ -143,7 +143,7 @@ class UserRepository:
         )
 
         user = self._row_to_user(row)
-        logger.info("user_created", user_id=str(user.id), email=email)
+        logger.info("user_created", user_id=user.id, email=email)
         return user
 
     async def update_password(self, user_id: UUID, password_hash: str) -> bool:
@@ -169,7 +169,7 @@ class UserRepository:
         )
         updated = result == "UPDATE 1"
         if updated:
-            logger.info("password_updated", user_id=str(user_id))
+            logger.info("password_updated", user_id=user_id)
         return updated
 
     async def verify_email(self, user_id: UUID) -> bool:
@@ -193,7 +193,7 @@ class UserRepository:
         )
         updated = result == "UPDATE 1"
         if updated:
-            logger.info("email_verified", user_id=str(user_id))
+            logger.info("email_verified", user_id=user_id)
         return updated
 
     async def update_profile(
@@ -249,7 +249,7 @@ class UserRepository:
         )
 
         if row:
-            logger.info("user_profile_updated", user_id=str(user_id))
+            logger.info("user_profile_updated", user_id=user_id)
         return self._row_to_user(row) if row else None
 
     async def soft_delete(self, user_id: UUID) -> bool:
@@ -273,7 +273,7 @@ class UserRepository:
         )
         deleted = result == "UPDATE 1"
         if deleted:
-            logger.info("user_deleted", user_id=str(user_id))
+            logger.info("user_deleted", user_id=user_id)
         return deleted
 
     # =========================================================================
@@ -15,6 +15,8 @@ Usage:
 from typing import Optional
 from uuid import UUID
 
+from asyncpg import Connection
+
 from src.domain.core import Workstream
 from src.services.aurora_service import AuroraService
 from src.utils.logging import get_logger
@@ -62,24 +64,50 @@ class WorkstreamRepository:
         )
         return self._row_to_workstream(row)
 
-    async def get_by_project_id(self, project_id: UUID) -> list[Workstream]:
+    async def get_by_project_id(
+        self,
+        project_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[UUID] = None,
+    ) -> list[Workstream]:
         """
-        Get all workstreams for a project.
+        Get workstreams for a project.
+
+        Results are ordered by (sort_order, name, id). Pass limit/after for
+        keyset pagination: after is the id of the last workstream already
+        returned.
 
         Args:
             project_id: Project UUID.
+            limit: Maximum results (optional, all if omitted).
+            after: Return only workstreams sorting after this one (optional).
 
         Returns:
             List of workstreams ordered by sort_order.
         """
+        params: list = [project_id]
+        keyset = ""
+        if after is not None:
+            params.append(after)
+            keyset = f"""
+              AND (sort_order, name, id) > (
+                  SELECT c.sort_order, c.name, c.id FROM workstreams c
+                  WHERE c.id = ${len(params)}
+              )"""
+        page = ""
+        if limit is not None:
+            params.append(limit)
+            page = f"LIMIT ${len(params)}"
+
         rows = await self._aurora.fetch_all(
-            """
+            f"""
             SELECT id, project_id, name, sort_order
             FROM workstreams
-            WHERE project_id = $1
-            ORDER BY sort_order ASC, name ASC
+            WHERE project_id = $1{keyset}
+            ORDER BY sort_order ASC, name ASC, id ASC
+            {page}
             """,
-            project_id,
+            *params,
         )
         return [self._row_to_workstream(row) for row in rows]
 
@@ -150,17 +178,64 @@ class WorkstreamRepository:
         workstream = self._row_to_workstream(row)
         logger.info(
             "workstream_created",
-            workstream_id=str(workstream.id),
-            project_id=str(project_id),
+            workstream_id=workstream.id,
+            project_id=project_id,
             name=name,
         )
         return workstream
 
+    async def create_many(
+        self,
+        project_id: UUID,
+        names: list[str],
+        *,
+        tx: Optional[Connection] = None,
+    ) -> list[Workstream]:
+        """
+        Create several workstreams in one INSERT.
+
+        Workstreams get sort orders 0..N-1 in the order given, so this is
+        meant for seeding a new project.
+
+        Args:
+            project_id: Project UUID.
+            names: Workstream names, in display order.
+            tx: Optional connection to run in an open transaction.
+
+        Returns:
+            Created workstreams, ordered by sort_order.
+        """
+        if not names:
+            return []
+
+        rows = await self._aurora.fetch_all(
+            """
+            INSERT INTO workstreams (project_id, name, sort_order)
+            SELECT $1, t.name, t.ord - 1
+            FROM unnest($2::text[]) WITH ORDINALITY AS t(name, ord)
+            RETURNING id, project_id, name, sort_order
+            """,
+            project_id,
+            names,
+            tx=tx,
+        )
+        workstreams = sorted(
+            (self._row_to_workstream(row) for row in rows),
+            key=lambda w: w.sort_order,
+        )
+        logger.info(
+            "workstreams_created",
+            project_id=project_id,
+            count=len(workstreams),
+        )
+        return workstreams
+
     async def update(
         self,
         workstream_id: UUID,
         name: Optional[str] = None,
         sort_order: Optional[int] = None,
+        project_id: Optional[UUID] = None,
     ) -> Optional[Workstream]:
         """
         Update a workstream.
@@ -171,6 +246,8 @@ class WorkstreamRepository:
             workstream_id: Workstream UUID.
             name: New name (optional).
             sort_order: New sort order (optional).
+            project_id: Expected parent project (optional). When given,
+                        workstreams in other projects are not updated.
 
         Returns:
             Updated workstream, or None if not found.
@@ -190,51 +267,124 @@ class WorkstreamRepository:
             param_num += 1
 
         if not updates:
-            return await self.get_by_id(workstream_id)
+            workstream = await self.get_by_id(workstream_id)
+            if workstream and project_id is not None and workstream.project_id != project_id:
+                return None
+            return workstream
 
         params.append(workstream_id)
+        where = f"id = ${param_num}"
+        if project_id is not None:
+            params.append(project_id)
+            where += f" AND project_id = ${param_num + 1}"
 
         query = f"""
             UPDATE workstreams
             SET {", ".join(updates)}
-            WHERE id = ${param_num}
+            WHERE {where}
             RETURNING id, project_id, name, sort_order
         """
 
         row = await self._aurora.fetch_one(query, *params)
         if row:
-            logger.info("workstream_updated", workstream_id=str(workstream_id))
+            logger.info("workstream_updated", workstream_id=workstream_id)
         return self._row_to_workstream(row)
 
-    async def delete(self, workstream_id: UUID) -> bool:
+    async def rename_in_project(
+        self,
+        workstream_id: UUID,
+        project_id: UUID,
+        name: str,
+    ) -> tuple[bool, Optional[Workstream]]:
         """
-        Delete a workstream.
+        Rename a workstream unless another one in the project has the name.
 
-        Note: Items referencing this workstream will have their
-        workstream_id set to NULL (ON DELETE SET NULL).
+        The duplicate-name check, the ownership check and the UPDATE run
+        as one statement.
 
         Args:
             workstream_id: Workstream UUID.
+            project_id: Expected parent project.
+            name: New name.
 
         Returns:
-            True if workstream was deleted, False if not found.
+            (name_taken, workstream) - workstream is None if the name was
+            taken or the workstream was not found in the project.
         """
-        result = await self._aurora.execute(
+        row = await self._aurora.fetch_one(
             """
-            DELETE FROM workstreams WHERE id = $1
+            WITH taken AS (
+                SELECT EXISTS (
+                    SELECT 1 FROM workstreams
+                    WHERE project_id = $2 AND name = $3 AND id <> $1
+                ) AS name_taken
+            ),
+            renamed AS (
+                UPDATE workstreams
+                SET name = $3
+                WHERE id = $1 AND project_id = $2
+                  AND NOT (SELECT name_taken FROM taken)
+                RETURNING id, project_id, name, sort_order
+            )
+            SELECT taken.name_taken, renamed.id, renamed.project_id,
+                   renamed.name, renamed.sort_order
+            FROM taken LEFT JOIN renamed ON TRUE
             """,
             workstream_id,
+            project_id,
+            name,
         )
+        if row is None or row["name_taken"]:
+            return True, None
+        if row["id"] is None:
+            return False, None
+
+        logger.info("workstream_updated", workstream_id=workstream_id)
+        return False, self._row_to_workstream(row)
+
+    async def delete(
+        self, workstream_id: UUID, project_id: Optional[UUID] = None
+    ) -> bool:
+        """
+        Delete a workstream.
+
+        Note: Items referencing this workstream will have their
+        workstream_id set to NULL (ON DELETE SET NULL).
+
+        Args:
+            workstream_id: Workstream UUID.
+            project_id: Expected parent project (optional). When given, the
+                        ownership check is part of the DELETE itself.
+
+        Returns:
+            True if workstream was deleted, False if not found.
+        """
+        if project_id is None:
+            result = await self._aurora.execute(
+                """
+                DELETE FROM workstreams WHERE id = $1
+                """,
+                workstream_id,
+            )
+        else:
+            result = await self._aurora.execute(
+                """
+                DELETE FROM workstreams WHERE id = $1 AND project_id = $2
+                """,
+                workstream_id,
+                project_id,
+            )
         deleted = result == "DELETE 1"
         if deleted:
-            logger.info("workstream_deleted", workstream_id=str(workstream_id))
+            logger.info("workstream_deleted", workstream_id=workstream_id)
         return deleted
 
     async def reorder(self, project_id: UUID, workstream_ids: list[UUID]) -> bool:
         """
         Reorder workstreams in a project.
 
-        Sets sort_order based on position in the provided list.
+        Sets sort_order based on position in the provided list, in a
+        single UPDATE joined against the ordered ID array.
 
         Args:
             project_id: Project UUID.
@@ -243,21 +393,20 @@ class WorkstreamRepository:
         Returns:
             True if all updates succeeded.
         """
-        for index, ws_id in enumerate(workstream_ids):
-            await self._aurora.execute(
-                """
-                UPDATE workstreams
-                SET sort_order = $1
-                WHERE id = $2 AND project_id = $3
-                """,
-                index,
-                ws_id,
-                project_id,
-            )
+        await self._aurora.execute(
+            """
+            UPDATE workstreams AS w
+            SET sort_order = v.ord - 1
+            FROM unnest($2::uuid[]) WITH ORDINALITY AS v(id, ord)
+            WHERE w.id = v.id AND w.project_id = $1
+            """,
+            project_id,
+            workstream_ids,
+        )
 
         logger.info(
             "workstreams_reordered",
-            project_id=str(project_id),
+            project_id=project_id,
             count=len(workstream_ids),
         )
         return True
@@ -76,6 +76,11 @@ class ServiceRegistry:
             min_connections=config.database.pool.min_connections,
             max_connections=config.database.pool.max_connections,
             connection_timeout=config.database.pool.connection_timeout,
+            max_inactive_connection_lifetime=(
+                config.database.pool.max_inactive_connection_lifetime
+            ),
+            statement_cache_size=config.database.pool.statement_cache_size,
+            reader_host=config.database.reader_host,
         )
         self._aurora = AuroraService(aurora_config)
 
@@ -47,6 +47,7 @@ from typing import Any, Dict, List, Optional, AsyncGenerator
 
 import asyncpg
 from asyncpg import Pool, Connection
+import orjson
 import structlog
 
 from src.services.base_service import BaseService
@@ -74,6 +75,11 @@ class AuroraConfig:
         min_connections: Minimum pool connections
         max_connections: Maximum pool connections
         connection_timeout: Query timeout in seconds
+        max_inactive_connection_lifetime: Idle seconds before surplus
+            connections are closed
+        statement_cache_size: Prepared statements kept per connection
+        reader_host: Read-replica endpoint for read-only queries; empty
+            sends them to host
     """
 
     host: str = "localhost"
@@ -81,9 +87,47 @@ class AuroraConfig:
     name: str = "braidmgr_dev"
     user: str = "postgres"
     password: str = "postgres"
-    min_connections: int = 2
-    max_connections: int = 10
+    min_connections: int = 10
+    max_connections: int = 25
     connection_timeout: int = 30
+    max_inactive_connection_lifetime: float = 300.0
+    statement_cache_size: int = 256
+    reader_host: str = ""
+
+
+# =============================================================================
+# JSONB Codec
+# =============================================================================
+# jsonb values are written from Python objects and read back as raw JSON
+# bytes. Readers decode only what they inspect, and raw bytes can be spliced
+# into a response without a parse/re-encode round trip.
+# =============================================================================
+
+# Version byte prefixing jsonb's binary wire format
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a Python value (or raw JSON bytes) as binary jsonb."""
+    if isinstance(value, (bytes, bytearray)):
+        return _JSONB_VERSION + value
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> bytes:
+    """Decode binary jsonb to its raw JSON text, as bytes."""
+    return data[1:]
+
+
+async def _init_connection(conn: Connection) -> None:
+    """Per-connection setup run by the pool for each new connection."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
 
 
 class AuroraService(BaseService[AuroraConfig]):
@@ -97,6 +141,7 @@ class AuroraService(BaseService[AuroraConfig]):
     """
 
     _pool: Optional[Pool] = None
+    _reader_pool: Optional[Pool] = None
 
     def _initialize(self) -> None:
         """
@@ -109,44 +154,107 @@ class AuroraService(BaseService[AuroraConfig]):
             f"postgresql://{self._config.user}:{self._config.password}"
             f"@{self._config.host}:{self._config.port}/{self._config.name}"
         )
+        self._reader_dsn: Optional[str] = None
+        if self._config.reader_host:
+            self._reader_dsn = (
+                f"postgresql://{self._config.user}:{self._config.password}"
+                f"@{self._config.reader_host}:{self._config.port}/{self._config.name}"
+            )
         self._log.debug(
             "service_configured",
             host=self._config.host,
+            reader_host=self._config.reader_host or None,
             port=self._config.port,
             database=self._config.name,
         )
 
     async def _ensure_pool(self) -> Pool:
-        """Create connection pool on first use."""
+        """Create the writer connection pool on first use."""
         if self._pool is None:
-            try:
-                self._pool = await asyncpg.create_pool(
-                    dsn=self._dsn,
-                    min_size=self._config.min_connections,
-                    max_size=self._config.max_connections,
-                    command_timeout=self._config.connection_timeout,
-                )
-                self._log.info(
-                    "pool_created",
-                    min_size=self._config.min_connections,
-                    max_size=self._config.max_connections,
-                )
-            except asyncpg.PostgresConnectionError as e:
-                self._log.critical(
-                    "pool_creation_failed",
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                )
-                raise ServiceUnavailableError("Database temporarily unavailable")
-            except Exception as e:
-                self._log.critical(
-                    "pool_creation_failed",
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                )
-                raise
+            self._pool = await self._create_pool(self._dsn, role="writer")
         return self._pool
 
+    async def _ensure_reader_pool(self) -> Pool:
+        """
+        Create the read-replica connection pool on first use.
+
+        Falls back to the writer pool when no reader_host is configured.
+        """
+        if self._reader_dsn is None:
+            return await self._ensure_pool()
+        if self._reader_pool is None:
+            self._reader_pool = await self._create_pool(
+                self._reader_dsn, role="reader"
+            )
+        return self._reader_pool
+
+    async def _create_pool(self, dsn: str, role: str) -> Pool:
+        """Open a connection pool against dsn with the configured settings."""
+        try:
+            pool = await asyncpg.create_pool(
+                dsn=dsn,
+                min_size=self._config.min_connections,
+                max_size=self._config.max_connections,
+                command_timeout=self._config.connection_timeout,
+                max_inactive_connection_lifetime=(
+                    self._config.max_inactive_connection_lifetime
+                ),
+                # Queries use fixed SQL text with $n parameters, so
+                # each connection prepares (parses and plans) it once
+                statement_cache_size=self._config.statement_cache_size,
+                init=_init_connection,
+            )
+            self._log.info(
+                "pool_created",
+                role=role,
+                min_size=self._config.min_connections,
+                max_size=self._config.max_connections,
+            )
+        except asyncpg.PostgresConnectionError as e:
+            self._log.critical(
+                "pool_creation_failed",
+                role=role,
+                error_type=type(e).__name__,
+                error_message=str(e),
+            )
+            raise ServiceUnavailableError("Database temporarily unavailable")
+        except Exception as e:
+            self._log.critical(
+                "pool_creation_failed",
+                role=role,
+                error_type=type(e).__name__,
+                error_message=str(e),
+            )
+            raise
+        return pool
+
+    async def connect(self) -> None:
+        """
+        Open the connection pool now rather than on the first query.
+
+        Call during application startup so min_connections are
+        established before traffic arrives, on the reader as well when one
+        is configured.
+        """
+        await self._ensure_pool()
+        await self._ensure_reader_pool()
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Report connection pool usage.
+
+        Returns:
+            Dict with configured min/max sizes and current open and idle
+            connection counts (zero before the pool is created).
+        """
+        pool = self._pool
+        return {
+            "min_size": self._config.min_connections,
+            "max_size": self._config.max_connections,
+            "size": pool.get_size() if pool is not None else 0,
+            "idle": pool.get_idle_size() if pool is not None else 0,
+        }
+
     def health_check(self) -> bool:
         """
         Synchronous health check for startup validation.
@@ -234,6 +342,7 @@ class AuroraService(BaseService[AuroraConfig]):
         self,
         query: str,
         *args: Any,
+        readonly: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Execute a SELECT query and return results as list of dicts.
@@ -241,6 +350,7 @@ class AuroraService(BaseService[AuroraConfig]):
         Args:
             query: SQL query with $1, $2, etc. placeholders.
             *args: Parameter values (prevents SQL injection).
+            readonly: Run on the read replica, if one is configured.
 
         Returns:
             List of dictionaries, one per row.
@@ -249,7 +359,9 @@ class AuroraService(BaseService[AuroraConfig]):
             DatabaseError: If query execution fails.
             ServiceUnavailableError: If database is unreachable.
         """
-        pool = await self._ensure_pool()
+        pool = await (
+            self._ensure_reader_pool() if readonly else self._ensure_pool()
+        )
         log = self._log.bind(operation="execute_query")
         log.debug("query_started", query=query[:100])
 
@@ -268,6 +380,7 @@ class AuroraService(BaseService[AuroraConfig]):
         self,
         query: str,
         *args: Any,
+        readonly: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """
         Execute a query expecting a single row result.
@@ -275,6 +388,7 @@ class AuroraService(BaseService[AuroraConfig]):
         Args:
             query: SQL query with $1, $2, etc. placeholders.
             *args: Parameter values.
+            readonly: Run on the read replica, if one is configured.
 
         Returns:
             Single row as dictionary, or None if no results.
@@ -283,7 +397,9 @@ class AuroraService(BaseService[AuroraConfig]):
             DatabaseError: If query execution fails.
             ServiceUnavailableError: If database is unreachable.
         """
-        pool = await self._ensure_pool()
+        pool = await (
+            self._ensure_reader_pool() if readonly else self._ensure_pool()
+        )
         log = self._log.bind(operation="execute_one")
         log.debug("query_started", query=query[:100])
 
@@ -343,6 +459,58 @@ class AuroraService(BaseService[AuroraConfig]):
             log.error("write_failed", error_type=type(e).__name__, error_message=str(e))
             raise DatabaseError("Write operation failed", operation="execute_write")
 
+    async def execute_value(
+        self,
+        query: str,
+        *args: Any,
+        readonly: bool = False,
+    ) -> Any:
+        """
+        Execute a query and return the first column of its first row.
+
+        Suits writes with RETURNING as well as reads: asyncpg returns the
+        value without building a row dict.
+
+        Args:
+            query: SQL query with $1, $2, etc. placeholders.
+            *args: Parameter values.
+            readonly: Run on the read replica, if one is configured.
+
+        Returns:
+            First column of the first row, or None if no rows.
+
+        Raises:
+            ConflictError: If unique constraint violated.
+            ValidationError: If foreign key or check constraint violated.
+            DatabaseError: If query execution fails.
+            ServiceUnavailableError: If database is unreachable.
+        """
+        pool = await (
+            self._ensure_reader_pool() if readonly else self._ensure_pool()
+        )
+        log = self._log.bind(operation="execute_value")
+        log.debug("query_started", query=query[:100])
+
+        try:
+            value = await pool.fetchval(query, *args)
+            log.debug("query_completed", found=value is not None)
+            return value
+        except asyncpg.UniqueViolationError as e:
+            log.warning("query_conflict", constraint=e.constraint_name)
+            raise ConflictError("Resource already exists", field=e.constraint_name)
+        except asyncpg.ForeignKeyViolationError as e:
+            log.warning("query_validation_failed", constraint=e.constraint_name)
+            raise ValidationError("Referenced resource not found", field=e.constraint_name)
+        except asyncpg.CheckViolationError as e:
+            log.warning("query_validation_failed", constraint=e.constraint_name)
+            raise ValidationError("Value out of allowed range", field=e.constraint_name)
+        except asyncpg.PostgresConnectionError as e:
+            log.error("query_failed", error_type=type(e).__name__, error_message=str(e))
+            raise ServiceUnavailableError("Database temporarily unavailable")
+        except asyncpg.PostgresError as e:
+            log.error("query_failed", error_type=type(e).__name__, error_message=str(e))
+            raise DatabaseError("Query execution failed", operation="execute_value")
+
     async def execute_returning(
         self,
         query: str,
@@ -376,7 +544,7 @@ class AuroraService(BaseService[AuroraConfig]):
                     "INSERT RETURNING did not return a row",
                     operation="execute_returning",
                 )
-            log.debug("insert_completed", id=str(row.get("id", "unknown")))
+            log.debug("insert_completed", id=row.get("id", "unknown"))
             return dict(row)
         except asyncpg.UniqueViolationError as e:
             log.warning("insert_conflict", constraint=e.constraint_name)
@@ -438,6 +606,9 @@ class AuroraService(BaseService[AuroraConfig]):
     # =========================================================================
     # REPOSITORY CONVENIENCE METHODS
     # These methods provide transaction-aware query execution for repositories.
+    # Without tx, each call acquires its own pooled connection, so independent
+    # calls may run concurrently (e.g. asyncio.gather). Calls passing the same
+    # tx share one connection and must be awaited one at a time.
     # =========================================================================
 
     async def fetch_one(
@@ -463,6 +634,28 @@ class AuroraService(BaseService[AuroraConfig]):
         else:
             return await self.execute_one(query, *args)
 
+    async def fetch_val(
+        self,
+        query: str,
+        *args: Any,
+        tx: Optional[Connection] = None,
+    ) -> Any:
+        """
+        Execute a query expecting a single value, with optional transaction.
+
+        Args:
+            query: SQL query with $1, $2, etc. placeholders.
+            *args: Parameter values.
+            tx: Optional asyncpg Connection for transaction context.
+
+        Returns:
+            First column of the first row, or None if no rows.
+        """
+        if tx is not None:
+            return await tx.fetchval(query, *args)
+        else:
+            return await self.execute_value(query, *args)
+
     async def fetch_all(
         self,
         query: str,
@@ -486,13 +679,127 @@ class AuroraService(BaseService[AuroraConfig]):
         else:
             return await self.execute_query(query, *args)
 
+    # Read-only variants route to the read replica when reader_host is set.
+    # Replicas lag the writer slightly, so anything that must see a write
+    # just made (or guards one about to be made) should use the writer.
+
+    async def fetch_one_ro(self, query: str, *args: Any) -> Optional[Dict[str, Any]]:
+        """
+        Execute a read-only query expecting a single row, on the reader.
+
+        Args:
+            query: SQL query with $1, $2, etc. placeholders.
+            *args: Parameter values.
+
+        Returns:
+            Single row as dictionary, or None if no results.
+        """
+        return await self.execute_one(query, *args, readonly=True)
+
+    async def fetch_val_ro(self, query: str, *args: Any) -> Any:
+        """
+        Execute a read-only query expecting a single value, on the reader.
+
+        Args:
+            query: SQL query with $1, $2, etc. placeholders.
+            *args: Parameter values.
+
+        Returns:
+            First column of the first row, or None if no rows.
+        """
+        return await self.execute_value(query, *args, readonly=True)
+
+    async def fetch_all_ro(self, query: str, *args: Any) -> List[Dict[str, Any]]:
+        """
+        Execute a read-only query returning multiple rows, on the reader.
+
+        Args:
+            query: SQL query with $1, $2, etc. placeholders.
+            *args: Parameter values.
+
+        Returns:
+            List of dictionaries, one per row.
+        """
+        return await self.execute_query(query, *args, readonly=True)
+
+    async def execute(
+        self,
+        query: str,
+        *args: Any,
+        tx: Optional[Connection] = None,
+    ) -> str:
+        """
+        Execute INSERT/UPDATE/DELETE, with optional transaction.
+
+        Args:
+            query: SQL modification query.
+            *args: Parameter values.
+            tx: Optional asyncpg Connection for transaction context.
+
+        Returns:
+            Status string (e.g., "UPDATE 1").
+        """
+        if tx is not None:
+            return await tx.execute(query, *args)
+        else:
+            return await self.execute_write(query, *args)
+
+    async def stream(
+        self,
+        query: str,
+        *args: Any,
+        prefetch: int = 100,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Execute a query and yield rows one at a time from a server-side cursor.
+
+        Rows are fetched from PostgreSQL in batches of `prefetch`, so memory
+        stays flat regardless of result size. Cursors require a transaction,
+        so a pooled connection is held until the generator is exhausted or
+        closed - consume it promptly.
+
+            async for row in services.aurora.stream("SELECT ...", project_id):
+                ...
+
+        Args:
+            query: SQL query with $1, $2, etc. placeholders.
+            *args: Parameter values.
+            prefetch: Number of rows fetched per round trip.
+
+        Yields:
+            One dictionary per row.
+
+        Raises:
+            DatabaseError: If query execution fails.
+            ServiceUnavailableError: If database is unreachable.
+        """
+        pool = await self._ensure_pool()
+        log = self._log.bind(operation="stream")
+        log.debug("query_started", query=query[:100])
+
+        try:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    async for row in conn.cursor(query, *args, prefetch=prefetch):
+                        yield dict(row)
+        except asyncpg.PostgresConnectionError as e:
+            log.error("query_failed", error_type=type(e).__name__, error_message=str(e))
+            raise ServiceUnavailableError("Database temporarily unavailable")
+        except asyncpg.PostgresError as e:
+            log.error("query_failed", error_type=type(e).__name__, error_message=str(e))
+            raise DatabaseError("Query execution failed", operation="stream")
+
     async def close(self) -> None:
         """
         Close all connections in the pool.
 
         Call during application shutdown.
         """
+        if self._reader_pool is not None:
+            await self._reader_pool.close()
+            self._reader_pool = None
+            self._log.info("pool_closed", role="reader")
         if self._pool is not None:
             await self._pool.close()
             self._pool = None
-            self._log.info("pool_closed")
+            self._log.info("pool_closed", role="writer")
@@ -142,7 +142,7 @@ class AuthService:
             user_agent=user_agent,
         )
 
-        logger.info("user_registered", user_id=str(user.id), email=email, org_id=org_id)
+        logger.info("user_registered", user_id=user.id, email=email, org_id=org_id)
 
         return AuthResult(
             success=True,
@@ -242,7 +242,7 @@ class AuthService:
             user_agent=user_agent,
         )
 
-        logger.info("user_logged_in", user_id=str(user.id))
+        logger.info("user_logged_in", user_id=user.id)
 
         return AuthResult(
             success=True,
@@ -324,7 +324,7 @@ class AuthService:
 
         # Revoke all tokens for user
         count = await self._refresh_tokens.revoke_all_for_user(user_id)
-        logger.info("user_logged_out", user_id=str(user_id), tokens_revoked=count)
+        logger.info("user_logged_out", user_id=user_id, tokens_revoked=count)
         return True
 
     # =========================================================================
@@ -370,7 +370,7 @@ class AuthService:
         # For MVP, just log and return token for testing
         logger.info(
             "password_reset_token_created",
-            user_id=str(user.id),
+            user_id=user.id,
             email=email,
             # In production, never log the actual token!
             token_for_testing=token,
@@ -427,7 +427,7 @@ class AuthService:
         # Revoke all refresh tokens (force re-login everywhere)
         await self._refresh_tokens.revoke_all_for_user(user.id)
 
-        logger.info("password_reset_completed", user_id=str(user.id))
+        logger.info("password_reset_completed", user_id=user.id)
 
         return AuthResult(
             success=True,
@@ -476,7 +476,7 @@ class AuthService:
             if user is None:
                 logger.error(
                     "oauth_user_not_found",
-                    oauth_account_id=str(oauth_account.id),
+                    oauth_account_id=oauth_account.id,
                 )
                 return AuthResult(success=False, error="Account error")
         else:
@@ -493,7 +493,7 @@ class AuthService:
                 )
                 logger.info(
                     "oauth_account_linked_existing",
-                    user_id=str(user.id),
+                    user_id=user.id,
                     provider=provider.value,
                 )
             else:
@@ -515,7 +515,7 @@ class AuthService:
 
                 logger.info(
                     "oauth_user_created",
-                    user_id=str(user.id),
+                    user_id=user.id,
                     provider=provider.value,
                 )
 
@@ -590,8 +590,8 @@ class AuthService:
 
         logger.info(
             "personal_workspace_created",
-            user_id=str(user_id),
-            org_id=str(org_id),
+            user_id=user_id,
+            org_id=org_id,
             slug=unique_slug,
         )
 
@@ -10,10 +10,10 @@ Usage:
     indicator = calculate_indicator(item, today=date.today())
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional
 
-from src.domain.core import Item, Indicator
+from src.domain.core import Indicator, Item, ItemColumnBatch
 
 
 # =============================================================================
@@ -63,19 +63,45 @@ def calculate_indicator(item: Item, today: Optional[date] = None) -> Optional[In
     if today is None:
         today = date.today()
 
+    return _indicator_for(
+        item.draft,
+        item.percent_complete,
+        item.start_date,
+        item.finish_date,
+        item.deadline,
+        item.updated_at,
+        today,
+    )
+
+
+def _indicator_for(
+    draft: bool,
+    percent_complete: int,
+    start_date: Optional[date],
+    finish_date: Optional[date],
+    deadline: Optional[date],
+    updated_at: Optional[datetime],
+    today: date,
+) -> Optional[Indicator]:
+    """
+    Apply the indicator rules to an item's individual field values.
+
+    See calculate_indicator for the precedence. calculate_indicators_columns
+    mirrors these rules for batches; keep the two in step.
+    """
     # ==========================================================================
     # RULE 1: Draft items have no indicator
     # ==========================================================================
-    if item.draft:
+    if draft:
         return None
 
     # ==========================================================================
     # RULE 2: Completed items
     # ==========================================================================
-    if item.percent_complete >= 100:
+    if percent_complete >= 100:
         # Check if completed recently (within threshold days)
-        if item.updated_at is not None:
-            completion_date = item.updated_at.date()
+        if updated_at is not None:
+            completion_date = updated_at.date()
             days_since_completion = (today - completion_date).days
             if days_since_completion <= COMPLETED_RECENTLY_DAYS:
                 return Indicator.COMPLETED_RECENTLY
@@ -84,64 +110,69 @@ def calculate_indicator(item: Item, today: Optional[date] = None) -> Optional[In
     # ==========================================================================
     # RULE 3: Beyond deadline (overrides all other active states)
     # ==========================================================================
-    if item.deadline is not None and item.deadline < today:
+    if deadline is not None and deadline < today:
         return Indicator.BEYOND_DEADLINE
 
     # ==========================================================================
     # RULE 4: Late finish (finish date passed, not complete)
     # ==========================================================================
-    if item.finish_date is not None and item.finish_date < today:
+    if finish_date is not None and finish_date < today:
         return Indicator.LATE_FINISH
 
     # ==========================================================================
     # RULE 5: Late start (start date passed, still at 0%)
     # ==========================================================================
     if (
-        item.start_date is not None
-        and item.start_date < today
-        and item.percent_complete == 0
+        start_date is not None
+        and start_date < today
+        and percent_complete == 0
     ):
         return Indicator.LATE_START
 
     # ==========================================================================
     # RULE 6: Trending late (remaining work exceeds remaining time)
     # ==========================================================================
-    if _is_trending_late(item, today):
+    if _is_trending_late(start_date, finish_date, percent_complete, today):
         return Indicator.TRENDING_LATE
 
     # ==========================================================================
     # RULE 7: Finishing soon (finish date within threshold)
     # ==========================================================================
-    if item.finish_date is not None:
-        days_until_finish = (item.finish_date - today).days
+    if finish_date is not None:
+        days_until_finish = (finish_date - today).days
         if 0 <= days_until_finish <= SOON_THRESHOLD_DAYS:
             return Indicator.FINISHING_SOON
 
     # ==========================================================================
     # RULE 8: Starting soon (start date within threshold, still at 0%)
     # ==========================================================================
-    if item.start_date is not None and item.percent_complete == 0:
-        days_until_start = (item.start_date - today).days
+    if start_date is not None and percent_complete == 0:
+        days_until_start = (start_date - today).days
         if 0 <= days_until_start <= SOON_THRESHOLD_DAYS:
             return Indicator.STARTING_SOON
 
     # ==========================================================================
     # RULE 9: In progress (1-99% complete)
     # ==========================================================================
-    if 0 < item.percent_complete < 100:
+    if 0 < percent_complete < 100:
         return Indicator.IN_PROGRESS
 
     # ==========================================================================
     # RULE 10: Not started (has dates, 0% complete)
     # ==========================================================================
-    if item.has_dates and item.percent_complete == 0:
+    if start_date is not None and finish_date is not None and percent_complete == 0:
         return Indicator.NOT_STARTED
 
     # No indicator if no dates and 0% complete
     return None
 
 
-def _is_trending_late(item: Item, today: date) -> bool:
+def _is_trending_late(
+    start_date: Optional[date],
+    finish_date: Optional[date],
+    percent_complete: int,
+    today: date,
+) -> bool:
     """
     Check if item is trending late based on remaining work vs remaining time.
 
@@ -152,31 +183,33 @@ def _is_trending_late(item: Item, today: date) -> bool:
     - Remaining work percentage > remaining time percentage
 
     Args:
-        item: The item to check
+        start_date: Item start date
+        finish_date: Item finish date
+        percent_complete: Item completion percentage
         today: Reference date
 
     Returns:
         True if item is trending late
     """
     # Must have both dates to calculate
-    if item.start_date is None or item.finish_date is None:
+    if start_date is None or finish_date is None:
         return False
 
     # Must have started
-    if item.start_date > today:
+    if start_date > today:
         return False
 
     # Must not be complete
-    if item.percent_complete >= 100:
+    if percent_complete >= 100:
         return False
 
     # Calculate total duration
-    total_days = (item.finish_date - item.start_date).days
+    total_days = (finish_date - start_date).days
     if total_days <= 0:
         return False
 
     # Calculate elapsed time
-    elapsed_days = (today - item.start_date).days
+    elapsed_days = (today - start_date).days
     if elapsed_days < 0:
         elapsed_days = 0
 
@@ -185,7 +218,7 @@ def _is_trending_late(item: Item, today: date) -> bool:
 
     # Item is trending late if actual progress is behind expected
     # Use a small buffer (5%) to avoid false positives
-    return item.percent_complete < (expected_progress - 5)
+    return percent_complete < (expected_progress - 5)
 
 
 # =============================================================================
@@ -212,6 +245,74 @@ def calculate_indicators_batch(
     return [(item, calculate_indicator(item, today)) for item in items]
 
 
+def calculate_indicators_columns(
+    batch: ItemColumnBatch, today: Optional[date] = None
+) -> list[Optional[Indicator]]:
+    """
+    Calculate indicators for a column-wise batch of items.
+
+    Same rules and precedence as calculate_indicator, specialised for a
+    whole-project pass: the "soon" and "recently" windows become cutoff
+    dates computed once, so each item is a chain of date comparisons with
+    no per-item timedelta arithmetic or function calls.
+
+    Args:
+        batch: Item columns, e.g. from ItemRepository.fetch_project_columns
+        today: Reference date for calculation (defaults to today)
+
+    Returns:
+        Indicators in the batch's row order
+    """
+    if today is None:
+        today = date.today()
+
+    soon = today + timedelta(days=SOON_THRESHOLD_DAYS)
+    recent = today - timedelta(days=COMPLETED_RECENTLY_DAYS)
+
+    results: list[Optional[Indicator]] = []
+    append = results.append
+    for draft, pct, start, finish, deadline, updated in zip(
+        batch.draft,
+        batch.percent_complete,
+        batch.start_date,
+        batch.finish_date,
+        batch.deadline,
+        batch.updated_at,
+    ):
+        if draft:
+            append(None)
+        elif pct >= 100:
+            if updated is not None and updated.date() >= recent:
+                append(Indicator.COMPLETED_RECENTLY)
+            else:
+                append(Indicator.COMPLETED)
+        elif deadline is not None and deadline < today:
+            append(Indicator.BEYOND_DEADLINE)
+        elif finish is not None and finish < today:
+            append(Indicator.LATE_FINISH)
+        elif start is not None and start < today and pct == 0:
+            append(Indicator.LATE_START)
+        elif (
+            start is not None
+            and finish is not None
+            and start <= today
+            and finish > start
+            and pct < (today - start).days / (finish - start).days * 100 - 5
+        ):
+            append(Indicator.TRENDING_LATE)
+        elif finish is not None and today <= finish <= soon:
+            append(Indicator.FINISHING_SOON)
+        elif start is not None and pct == 0 and today <= start <= soon:
+            append(Indicator.STARTING_SOON)
+        elif pct > 0:
+            append(Indicator.IN_PROGRESS)
+        elif start is not None and finish is not None:
+            append(Indicator.NOT_STARTED)
+        else:
+            append(None)
+    return results
+
+
 def get_indicator_severity(indicator: Optional[Indicator]) -> int:
     """
     Get the severity level of an indicator for sorting.
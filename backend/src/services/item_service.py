@@ -23,7 +23,10 @@ from src.repositories.item_repository import ItemRepository
 from src.repositories.item_note_repository import ItemNoteRepository
 from src.repositories.item_dependency_repository import ItemDependencyRepository
 from src.services.aurora_service import AuroraService
-from src.services.indicator_service import calculate_indicator
+from src.services.indicator_service import (
+    calculate_indicator,
+    calculate_indicators_columns,
+)
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -116,14 +119,12 @@ class ItemService:
                 error="Percent complete must be between 0 and 100",
             )
 
-        # Get next item number atomically
-        item_num = await self._project_repo.increment_item_num(project_id)
-
-        # Create temporary item to calculate indicator
+        # Create temporary item to calculate indicator; the real item
+        # number is assigned by the insert
         temp_item = Item(
             id=UUID("00000000-0000-0000-0000-000000000000"),
             project_id=project_id,
-            item_num=item_num,
+            item_num=0,
             type=item_type,
             title=title,
             description=description,
@@ -145,7 +146,6 @@ class ItemService:
         # Create item
         item = await self._item_repo.create(
             project_id=project_id,
-            item_num=item_num,
             item_type=item_type,
             title=title,
             description=description,
@@ -166,9 +166,9 @@ class ItemService:
 
         logger.info(
             "item_created",
-            item_id=str(item.id),
-            project_id=str(project_id),
-            item_num=item_num,
+            item_id=item.id,
+            project_id=project_id,
+            item_num=item.item_num,
             type=item_type.value,
         )
 
@@ -242,6 +242,38 @@ class ItemService:
             offset=offset,
         )
 
+    async def list_items_with_total(
+        self,
+        project_id: UUID,
+        item_type: Optional[ItemType] = None,
+        workstream_id: Optional[UUID] = None,
+        assigned_to: Optional[str] = None,
+        indicator: Optional[Indicator] = None,
+        draft: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[Item], int]:
+        """
+        List a page of items and count every match.
+
+        Same filters as list_items; the total ignores limit and offset.
+
+        Returns:
+            Tuple of (items, total count).
+        """
+        return await self._item_repo.list_with_filters_and_total(
+            project_id=project_id,
+            item_type=item_type,
+            workstream_id=workstream_id,
+            assigned_to=assigned_to,
+            indicator=indicator,
+            draft=draft,
+            search=search,
+            limit=limit,
+            offset=offset,
+        )
+
     async def update_item(
         self,
         item_id: UUID,
@@ -259,6 +291,7 @@ class ItemService:
         priority: Optional[str] = None,
         rpt_out: Optional[list[str]] = None,
         budget_amount: Optional[Decimal] = None,
+        project_id: Optional[UUID] = None,
     ) -> ItemResult:
         """
         Update an item with automatic indicator recalculation.
@@ -279,6 +312,8 @@ class ItemService:
             priority: New priority (optional).
             rpt_out: New report codes (optional).
             budget_amount: New budget amount (optional).
+            project_id: Expected parent project (optional). Items in any
+                        other project are reported as not found.
 
         Returns:
             ItemResult with updated item or error.
@@ -287,6 +322,8 @@ class ItemService:
         existing = await self._item_repo.get_by_id(item_id)
         if not existing:
             return ItemResult(success=False, error="Item not found")
+        if project_id is not None and existing.project_id != project_id:
+            return ItemResult(success=False, error="Item not found")
 
         # Validate dates
         start = start_date if start_date is not None else existing.start_date
@@ -333,24 +370,32 @@ class ItemService:
             await self._item_repo.update_indicator(item_id, new_indicator)
             item = await self._item_repo.get_by_id(item_id)
 
-        logger.info("item_updated", item_id=str(item_id))
+        logger.info(
+            "item_updated",
+            item_id=item_id,
+            project_id=item.project_id,
+        )
         return ItemResult(success=True, item=item)
 
-    async def delete_item(self, item_id: UUID) -> ItemResult:
+    async def delete_item(
+        self, item_id: UUID, project_id: Optional[UUID] = None
+    ) -> ItemResult:
         """
         Soft delete an item.
 
         Args:
             item_id: Item UUID.
+            project_id: Expected parent project (optional). Items in any
+                        other project are reported as not found.
 
         Returns:
             ItemResult with success status.
         """
-        deleted = await self._item_repo.soft_delete(item_id)
+        deleted = await self._item_repo.soft_delete(item_id, project_id)
         if not deleted:
             return ItemResult(success=False, error="Item not found")
 
-        logger.info("item_deleted", item_id=str(item_id))
+        logger.info("item_deleted", item_id=item_id)
         return ItemResult(success=True)
 
     # =========================================================================
@@ -367,27 +412,26 @@ class ItemService:
         Returns:
             Number of items updated.
         """
-        # Get all non-draft items
-        items = await self._item_repo.get_by_project_id(project_id, include_drafts=True)
+        # Only the columns the calculation reads, drafts included
+        batch = await self._item_repo.fetch_project_columns(project_id)
 
         # Calculate new indicators
-        updates = []
-        today = date.today()
-        for item in items:
-            new_indicator = calculate_indicator(item, today)
-            if new_indicator != item.indicator:
-                updates.append((item.id, new_indicator))
-
-        # Batch update
-        count = await self._item_repo.batch_update_indicators(updates)
-
-        # Update project timestamp
-        await self._project_repo.update_indicators_timestamp(project_id)
+        new_indicators = calculate_indicators_columns(batch, date.today())
+        updates = [
+            (item_id, new)
+            for item_id, old, new in zip(batch.ids, batch.indicator, new_indicators)
+            if new != old
+        ]
+
+        # Batch update, stamping the project in the same statement
+        count = await self._item_repo.batch_update_indicators(
+            updates, project_id=project_id
+        )
 
         logger.info(
             "indicators_updated",
-            project_id=str(project_id),
-            total_items=len(items),
+            project_id=project_id,
+            total_items=len(batch),
             updated_count=count,
         )
 
@@ -16,15 +16,24 @@ from datetime import date
 from typing import Optional
 from uuid import UUID
 
+from src.domain.auth import ProjectRole
 from src.domain.core import Project, ProjectResult, Workstream
 from src.repositories.project_repository import ProjectRepository
 from src.repositories.workstream_repository import WorkstreamRepository
 from src.repositories.item_repository import ItemRepository
+from src.repositories.user_project_role_repository import UserProjectRoleRepository
 from src.services.aurora_service import AuroraService
+from src.utils.cache import TTLCache
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Project reads are served from a short-lived per-process cache. Writes made
+# through this service invalidate it; anything else (item numbering,
+# indicator timestamps, other workers) is visible within the TTL.
+PROJECT_CACHE_TTL_SECONDS = 15
+PROJECT_CACHE_MAX_ENTRIES = 1000
+
 
 class ProjectService:
     """
@@ -44,6 +53,13 @@ class ProjectService:
         self._project_repo = ProjectRepository(aurora)
         self._workstream_repo = WorkstreamRepository(aurora)
         self._item_repo = ItemRepository(aurora)
+        self._role_repo = UserProjectRoleRepository(aurora)
+        self._project_cache: TTLCache[UUID, Project] = TTLCache(
+            maxsize=PROJECT_CACHE_MAX_ENTRIES, ttl=PROJECT_CACHE_TTL_SECONDS
+        )
+        self._user_projects_cache: TTLCache[tuple[UUID, UUID], list[Project]] = TTLCache(
+            maxsize=PROJECT_CACHE_MAX_ENTRIES, ttl=PROJECT_CACHE_TTL_SECONDS
+        )
 
     # =========================================================================
     # PROJECT CRUD
@@ -57,6 +73,7 @@ class ProjectService:
         project_start: Optional[date] = None,
         project_end: Optional[date] = None,
         workstreams: Optional[list[str]] = None,
+        created_by: Optional[UUID] = None,
     ) -> ProjectResult:
         """
         Create a new project with optional initial workstreams.
@@ -68,6 +85,7 @@ class ProjectService:
             project_start: Project start date (optional).
             project_end: Project end date (optional).
             workstreams: List of workstream names to create (optional).
+            created_by: User to make project admin (optional).
 
         Returns:
             ProjectResult with created project or error.
@@ -79,28 +97,36 @@ class ProjectService:
                 error="Project end date must be after start date",
             )
 
-        # Create project
-        project = await self._project_repo.create(
-            org_id=org_id,
-            name=name,
-            client_name=client_name,
-            project_start=project_start,
-            project_end=project_end,
-        )
+        # Project, workstreams and creator role land together or not at all,
+        # so a failed role insert never leaves a project nobody can open
+        async with self._aurora.transaction() as conn:
+            project = await self._project_repo.create(
+                org_id=org_id,
+                name=name,
+                client_name=client_name,
+                project_start=project_start,
+                project_end=project_end,
+                tx=conn,
+            )
+
+            # Create initial workstreams if provided
+            if workstreams:
+                await self._workstream_repo.create_many(
+                    project.id, workstreams, tx=conn
+                )
 
-        # Create initial workstreams if provided
-        if workstreams:
-            for index, ws_name in enumerate(workstreams):
-                await self._workstream_repo.create(
-                    project_id=project.id,
-                    name=ws_name,
-                    sort_order=index,
+            # Creator administers the project
+            if created_by:
+                await self._role_repo.assign_role(
+                    created_by, project.id, ProjectRole.ADMIN, tx=conn
                 )
 
+        self._user_projects_cache.clear()
+
         logger.info(
             "project_created",
-            project_id=str(project.id),
-            org_id=str(org_id),
+            project_id=project.id,
+            org_id=org_id,
             name=name,
             workstream_count=len(workstreams) if workstreams else 0,
         )
@@ -117,7 +143,30 @@ class ProjectService:
         Returns:
             Project if found, None otherwise.
         """
-        return await self._project_repo.get_by_id(project_id)
+        project = self._project_cache.get(project_id)
+        if project is None:
+            project = await self._project_repo.get_by_id(project_id)
+            if project:
+                self._project_cache.set(project_id, project)
+        return project
+
+    async def get_project_for_user(
+        self, project_id: UUID, user_id: UUID
+    ) -> tuple[Optional[Project], Optional[ProjectRole]]:
+        """
+        Get a project together with a user's role on it.
+
+        Args:
+            project_id: Project UUID.
+            user_id: User UUID.
+
+        Returns:
+            (project, role) - either may be None.
+        """
+        project, role = await self._project_repo.get_with_user_role(project_id, user_id)
+        if project:
+            self._project_cache.set(project_id, project)
+        return project, role
 
     async def list_projects_for_user(
         self, user_id: UUID, org_id: UUID
@@ -132,7 +181,41 @@ class ProjectService:
         Returns:
             List of projects the user has a role on.
         """
-        return await self._project_repo.list_for_user(user_id, org_id)
+        cache_key = (user_id, org_id)
+        projects = self._user_projects_cache.get(cache_key)
+        if projects is None:
+            projects = await self._project_repo.list_for_user(user_id, org_id)
+            self._user_projects_cache.set(cache_key, projects)
+        return projects
+
+    async def list_projects_page(
+        self,
+        user_id: UUID,
+        org_id: UUID,
+        limit: int,
+        after: Optional[UUID] = None,
+    ) -> tuple[list[Project], Optional[UUID]]:
+        """
+        Get one keyset page of the projects a user has access to.
+
+        Pages are not cached; only the full list is.
+
+        Args:
+            user_id: User UUID.
+            org_id: Organization UUID.
+            limit: Page size.
+            after: Cursor returned with the previous page (optional).
+
+        Returns:
+            (projects, next_cursor) - next_cursor is None on the last page.
+        """
+        projects = await self._project_repo.list_for_user(
+            user_id, org_id, limit=limit + 1, after=after
+        )
+        if len(projects) > limit:
+            projects = projects[:limit]
+            return projects, projects[-1].id
+        return projects, None
 
     async def list_projects_for_org(self, org_id: UUID) -> list[Project]:
         """
@@ -193,7 +276,10 @@ class ProjectService:
         if not project:
             return ProjectResult(success=False, error="Project not found")
 
-        logger.info("project_updated", project_id=str(project_id))
+        self._project_cache.set(project_id, project)
+        self._user_projects_cache.clear()
+
+        logger.info("project_updated", project_id=project_id)
         return ProjectResult(success=True, project=project)
 
     async def delete_project(self, project_id: UUID) -> ProjectResult:
@@ -207,12 +293,38 @@ class ProjectService:
             ProjectResult with success status.
         """
         deleted = await self._project_repo.soft_delete(project_id)
+        self._project_cache.pop(project_id)
+        self._user_projects_cache.clear()
         if not deleted:
             return ProjectResult(success=False, error="Project not found")
 
-        logger.info("project_deleted", project_id=str(project_id))
+        logger.info("project_deleted", project_id=project_id)
         return ProjectResult(success=True)
 
+    async def delete_project_for_user(
+        self, project_id: UUID, user_id: UUID
+    ) -> tuple[Optional[ProjectRole], bool]:
+        """
+        Soft delete a project if the user is its admin.
+
+        The user's role is checked by the delete statement itself.
+
+        Args:
+            project_id: Project UUID.
+            user_id: User UUID.
+
+        Returns:
+            (role, deleted) - role is the user's role on the project (None
+            if no access), deleted is True if the project was deleted.
+        """
+        role, deleted = await self._project_repo.soft_delete_with_role(
+            project_id, user_id, ProjectRole.ADMIN
+        )
+        if deleted:
+            self._project_cache.pop(project_id)
+            self._user_projects_cache.clear()
+        return role, deleted
+
     # =========================================================================
     # PROJECT STATISTICS
     # =========================================================================
@@ -19,10 +19,16 @@ from src.domain.core import Workstream, WorkstreamResult
 from src.repositories.project_repository import ProjectRepository
 from src.repositories.workstream_repository import WorkstreamRepository
 from src.services.aurora_service import AuroraService
+from src.utils.cache import TTLCache
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Per-project workstream lists are cached briefly; writes made through this
+# service invalidate the affected project.
+WORKSTREAM_CACHE_TTL_SECONDS = 15
+WORKSTREAM_CACHE_MAX_ENTRIES = 1000
+
 
 class WorkstreamService:
     """
@@ -41,6 +47,9 @@ class WorkstreamService:
         self._aurora = aurora
         self._project_repo = ProjectRepository(aurora)
         self._workstream_repo = WorkstreamRepository(aurora)
+        self._list_cache: TTLCache[UUID, list[Workstream]] = TTLCache(
+            maxsize=WORKSTREAM_CACHE_MAX_ENTRIES, ttl=WORKSTREAM_CACHE_TTL_SECONDS
+        )
 
     # =========================================================================
     # WORKSTREAM CRUD
@@ -78,11 +87,12 @@ class WorkstreamService:
             project_id=project_id,
             name=name,
         )
+        self._list_cache.pop(project_id)
 
         logger.info(
             "workstream_created",
-            workstream_id=str(workstream.id),
-            project_id=str(project_id),
+            workstream_id=workstream.id,
+            project_id=project_id,
             name=name,
         )
 
@@ -110,12 +120,44 @@ class WorkstreamService:
         Returns:
             List of workstreams ordered by sort_order.
         """
-        return await self._workstream_repo.get_by_project_id(project_id)
+        workstreams = self._list_cache.get(project_id)
+        if workstreams is None:
+            workstreams = await self._workstream_repo.get_by_project_id(project_id)
+            self._list_cache.set(project_id, workstreams)
+        return workstreams
+
+    async def list_workstreams_page(
+        self,
+        project_id: UUID,
+        limit: int,
+        after: Optional[UUID] = None,
+    ) -> tuple[list[Workstream], Optional[UUID]]:
+        """
+        Get one keyset page of a project's workstreams.
+
+        Pages are not cached; only the full list is.
+
+        Args:
+            project_id: Project UUID.
+            limit: Page size.
+            after: Cursor returned with the previous page (optional).
+
+        Returns:
+            (workstreams, next_cursor) - next_cursor is None on the last page.
+        """
+        workstreams = await self._workstream_repo.get_by_project_id(
+            project_id, limit=limit + 1, after=after
+        )
+        if len(workstreams) > limit:
+            workstreams = workstreams[:limit]
+            return workstreams, workstreams[-1].id
+        return workstreams, None
 
     async def update_workstream(
         self,
         workstream_id: UUID,
         name: Optional[str] = None,
+        project_id: Optional[UUID] = None,
     ) -> WorkstreamResult:
         """
         Update a workstream.
@@ -123,10 +165,15 @@ class WorkstreamService:
         Args:
             workstream_id: Workstream UUID.
             name: New name (optional).
+            project_id: Expected parent project (optional). Workstreams in
+                        any other project are reported as not found.
 
         Returns:
             WorkstreamResult with updated workstream or error.
         """
+        if project_id is not None:
+            return await self._update_in_project(workstream_id, project_id, name)
+
         # Get existing workstream
         existing = await self._workstream_repo.get_by_id(workstream_id)
         if not existing:
@@ -145,14 +192,51 @@ class WorkstreamService:
             workstream_id=workstream_id,
             name=name,
         )
+        self._list_cache.pop(existing.project_id)
+
+        if not workstream:
+            return WorkstreamResult(success=False, error="Workstream not found")
+
+        logger.info("workstream_updated", workstream_id=workstream_id)
+        return WorkstreamResult(success=True, workstream=workstream)
+
+    async def _update_in_project(
+        self,
+        workstream_id: UUID,
+        project_id: UUID,
+        name: Optional[str],
+    ) -> WorkstreamResult:
+        """
+        Update a workstream known to belong to project_id.
 
+        The parent project is known up front, so a rename is a single
+        statement covering the duplicate-name check, the ownership check
+        and the UPDATE.
+        """
+        if name:
+            name_taken, workstream = await self._workstream_repo.rename_in_project(
+                workstream_id, project_id, name
+            )
+            if name_taken:
+                return WorkstreamResult(
+                    success=False,
+                    error=f"Workstream '{name}' already exists in this project",
+                )
+        else:
+            workstream = await self._workstream_repo.update(
+                workstream_id=workstream_id,
+                project_id=project_id,
+            )
+        self._list_cache.pop(project_id)
         if not workstream:
             return WorkstreamResult(success=False, error="Workstream not found")
 
-        logger.info("workstream_updated", workstream_id=str(workstream_id))
+        logger.info("workstream_updated", workstream_id=workstream_id)
         return WorkstreamResult(success=True, workstream=workstream)
 
-    async def delete_workstream(self, workstream_id: UUID) -> WorkstreamResult:
+    async def delete_workstream(
+        self, workstream_id: UUID, project_id: Optional[UUID] = None
+    ) -> WorkstreamResult:
         """
         Delete a workstream.
 
@@ -161,15 +245,21 @@ class WorkstreamService:
 
         Args:
             workstream_id: Workstream UUID.
+            project_id: Expected parent project (optional). Workstreams in
+                        any other project are reported as not found.
 
         Returns:
             WorkstreamResult with success status.
         """
-        deleted = await self._workstream_repo.delete(workstream_id)
+        deleted = await self._workstream_repo.delete(workstream_id, project_id)
+        if project_id is not None:
+            self._list_cache.pop(project_id)
+        else:
+            self._list_cache.clear()
         if not deleted:
             return WorkstreamResult(success=False, error="Workstream not found")
 
-        logger.info("workstream_deleted", workstream_id=str(workstream_id))
+        logger.info("workstream_deleted", workstream_id=workstream_id)
         return WorkstreamResult(success=True)
 
     async def reorder_workstreams(
@@ -188,11 +278,12 @@ class WorkstreamService:
             Reordered list of workstreams.
         """
         await self._workstream_repo.reorder(project_id, workstream_ids)
+        self._list_cache.pop(project_id)
 
         logger.info(
             "workstreams_reordered",
-            project_id=str(project_id),
+            project_id=project_id,
             count=len(workstream_ids),
         )
 
-        return await self._workstream_repo.get_by_project_id(project_id)
+        return await self.list_workstreams(project_id)
@@ -0,0 +1,125 @@
+"""
+In-process caching utilities for braidMgr.
+
+Provides a small bounded TTL cache for hot-path lookups that are safe
+to serve slightly stale (decoded tokens, role lookups).
+
+Entries are evicted when they expire or, once the cache is full, in
+insertion order (oldest first). Intended for use from the event loop
+thread only - no locking is performed.
+
+Usage:
+    from src.utils.cache import TTLCache
+
+    _cache: TTLCache[str, CurrentUser] = TTLCache(maxsize=10000, ttl=30)
+
+    user = _cache.get(key)
+    if user is None:
+        user = build_user()
+        _cache.set(key, user, ttl=remaining_seconds)
+"""
+
+import time
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded mapping whose entries expire after a time-to-live.
+
+    Attributes:
+        maxsize: Maximum number of entries held at once
+        ttl: Default time-to-live in seconds for new entries
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries held at once.
+            ttl: Default time-to-live in seconds for new entries.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[K, Tuple[V, float]] = {}
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """
+        Get a cached value if present and not expired.
+
+        Args:
+            key: Cache key.
+            default: Returned on a miss. Pass a sentinel when None is a
+                     legitimate cached value.
+
+        Returns:
+            Cached value, or default if missing or expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the oldest entry if the cache is full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Time-to-live in seconds (defaults to the cache ttl,
+                 and is never allowed to exceed it).
+        """
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+
+        # Re-inserting moves the key to the end of the eviction order
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._evict()
+        self._data[key] = (value, time.monotonic() + lifetime)
+
+    def pop(self, key: K) -> Optional[V]:
+        """
+        Remove an entry.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The removed value, or None if it was not cached.
+        """
+        entry = self._data.pop(key, None)
+        return entry[0] if entry else None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        """Drop expired entries from the front, then the oldest if still full."""
+        # Insertion order tracks expiry order closely enough (lifetimes
+        # never exceed the cache ttl), so stop at the first live entry
+        # rather than scanning the whole mapping.
+        now = time.monotonic()
+        while self._data:
+            key, (_, expires_at) = next(iter(self._data.items()))
+            if expires_at > now:
+                break
+            del self._data[key]
+
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
@@ -21,9 +21,11 @@ Usage:
 
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
 from src.config import get_config
 from src.utils.exceptions import AuthenticationError
@@ -32,6 +34,39 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+# Claims every access token must carry - checked after signature verification
+REQUIRED_CLAIMS = ("sub", "email", "exp")
+
+# Single verified decode: signature and expiry are checked in one pass, and
+# validators for claims we never issue (aud, iss, at_hash) are skipped.
+_DECODE_OPTIONS = {
+    "verify_signature": True,
+    "verify_exp": True,
+    "verify_aud": False,
+    "verify_iss": False,
+    "verify_at_hash": False,
+}
+
+
+@lru_cache(maxsize=16)
+def _verification_key(secret: str, algorithm: str) -> Key:
+    """
+    Build the signature verification key once per (secret, algorithm).
+
+    Passing a raw secret to jwt.decode makes python-jose try to parse it as
+    a JWK JSON document and construct a new key object on every call. A
+    rotated secret is simply a new cache entry.
+
+    Args:
+        secret: Signing secret from auth config
+        algorithm: JWT algorithm from auth config (e.g. HS256)
+
+    Returns:
+        Constructed jose Key
+    """
+    return jwk.construct(secret, algorithm)
+
+
 # =============================================================================
 # JWT TOKEN CREATION
 # =============================================================================
@@ -120,7 +155,8 @@ def decode_access_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate a JWT access token.
 
-    Verifies signature and expiry. Raises AuthenticationError on failure.
+    Verifies signature and expiry in a single decode pass.
+    Raises AuthenticationError on failure.
 
     Args:
         token: JWT string to decode
@@ -145,13 +181,13 @@ def decode_access_token(token: str) -> Dict[str, Any]:
     try:
         payload = jwt.decode(
             token,
-            auth_config.jwt_secret,
+            _verification_key(auth_config.jwt_secret, auth_config.jwt_algorithm),
             algorithms=[auth_config.jwt_algorithm],
+            options=_DECODE_OPTIONS,
         )
 
         # Validate required claims
-        required_claims = ["sub", "email", "exp"]
-        for claim in required_claims:
+        for claim in REQUIRED_CLAIMS:
             if claim not in payload:
                 raise AuthenticationError(f"Token missing required claim: {claim}")
 
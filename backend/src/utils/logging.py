@@ -12,13 +12,14 @@ Usage:
 
     # In any module
     logger = get_logger()
-    log = logger.bind(project_id=str(project_id))
+    log = logger.bind(project_id=project_id)
     log.info("operation_started", operation="create_item")
 """
 
 import logging
 import sys
 from typing import Optional
+from uuid import UUID
 
 import structlog
 from structlog.contextvars import merge_contextvars
@@ -36,6 +37,9 @@ from structlog.contextvars import merge_contextvars
 # | Service    | DEBUG         | External API calls, retries, timeouts    |
 # =============================================================================
 
+# Level passed to setup_logging (NOTSET - everything - until configured)
+_log_level = logging.NOTSET
+
 
 def setup_logging(
     environment: str = "development",
@@ -57,8 +61,11 @@ def setup_logging(
     # Determine output format
     use_json = json_output if json_output is not None else (environment == "production")
 
+    global _log_level
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    _log_level = numeric_level
 
     # Configure root logger
     logging.basicConfig(
@@ -86,6 +93,8 @@ def setup_logging(
         # Format stack traces
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
+        # Render UUID values as plain strings (only for emitted events)
+        _stringify_uuids,
     ]
 
     # Add environment context to all logs
@@ -125,6 +134,28 @@ def _add_environment_context(environment: str):
     return processor
 
 
+def _stringify_uuids(logger, method_name, event_dict):
+    """
+    Processor that renders UUID values as strings.
+
+    Route, service and repository call sites pass UUIDs as-is, so the
+    formatting cost is only paid for events that pass the level filter.
+    Subclasses count too: asyncpg returns its own UUID type for id columns.
+
+    Args:
+        logger: Wrapped logger (unused).
+        method_name: Log method name (unused).
+        event_dict: Event fields.
+
+    Returns:
+        Event fields with UUID values converted to str.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, UUID):
+            event_dict[key] = str(value)
+    return event_dict
+
+
 def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
     """
     Get a structured logger instance.
@@ -143,6 +174,26 @@ def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+def log_enabled(level: int) -> bool:
+    """
+    Check whether events at a level pass the configured log level.
+
+    Disabled log calls are already cheap no-ops; use this on hot paths to
+    skip building the event's fields as well.
+
+    Args:
+        level: stdlib logging level (e.g. logging.INFO)
+
+    Returns:
+        True if events at this level will be emitted.
+
+    Example:
+        if log_enabled(logging.INFO):
+            logger.info("request_started", query=str(request.query_params))
+    """
+    return level >= _log_level
+
+
 # =============================================================================
 # SENSITIVE DATA PROTECTION
 # =============================================================================
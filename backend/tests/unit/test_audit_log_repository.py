@@ -0,0 +1,285 @@
+"""
+Unit tests for AuditLogRepository.
+
+Tests project activity queries with mocked Aurora service.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.repositories.audit_log_repository import AuditLogRepository
+
+
+# =============================================================================
+# Project Activity SQL Tests
+# =============================================================================
+
+class TestProjectActivitySql:
+    """Tests for _project_activity_sql."""
+
+    def test_sql_is_shared_across_filter_sizes(self):
+        """Test that the SQL depends on which filters are set, not their size."""
+        repo = AuditLogRepository(MagicMock())
+        project_id = uuid4()
+
+        one = repo._project_activity_sql(project_id, 10, 0, 30, ["item"], None)
+        three = repo._project_activity_sql(
+            project_id, 10, 0, 30, ["item", "project", "workstream"], None
+        )
+
+        assert one[0] is three[0]
+        assert one[2] is three[2]
+        assert three[1][4:] == [["item", "project", "workstream"]]
+
+    def test_filters_follow_role_param(self):
+        """Test that count filters are numbered after the caller's user id."""
+        repo = AuditLogRepository(MagicMock())
+        project_id, user_id = uuid4(), uuid4()
+
+        query, params, count_query, count_params = repo._project_activity_sql(
+            project_id, 10, 5, 30, ["item"], "risk", user_id=user_id
+        )
+
+        assert params[1:] == [project_id, 10, 5, ["item"], "%risk%"]
+        assert "ANY($5::text[])" in query and "a.search_text ILIKE $6" in query
+        assert count_params[1:] == [project_id, user_id, ["item"], "%risk%"]
+        assert "ANY($4::text[])" in count_query and "ILIKE $5" in count_query
+        assert "caller_role" in count_query
+
+    def test_no_filters(self):
+        """Test that unfiltered feeds bind only the base parameters."""
+        repo = AuditLogRepository(MagicMock())
+
+        query, params, count_query, count_params = repo._project_activity_sql(
+            uuid4(), 10, 0, 30, None, None
+        )
+
+        assert len(params) == 4
+        assert len(count_params) == 2
+        assert "ANY(" not in query and "ILIKE" not in count_query
+
+    def test_scope_is_flat_project_filter(self):
+        """Test that project scope uses the denormalized column, not subqueries."""
+        repo = AuditLogRepository(MagicMock())
+
+        query, _, count_query, _ = repo._project_activity_sql(
+            uuid4(), 10, 0, 30, None, None
+        )
+
+        for sql in (query, count_query):
+            assert "a.project_id = $2" in sql
+            assert "FROM items" not in sql and "FROM workstreams" not in sql
+
+
+# =============================================================================
+# Create Entry Tests
+# =============================================================================
+
+class TestCreateEntry:
+    """Tests for create_entry."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_project_id(self):
+        """Test that the entry's project id is written with it."""
+        aurora = MagicMock()
+        aurora.execute_returning = AsyncMock(return_value={"id": uuid4()})
+        repo = AuditLogRepository(aurora)
+        project_id = uuid4()
+
+        await repo.create_entry(
+            None, "update", "item", uuid4(), project_id=project_id
+        )
+
+        args = aurora.execute_returning.call_args.args
+        assert "project_id" in args[0]
+        assert args[-1] == project_id
+
+    @pytest.mark.asyncio
+    async def test_missing_project_id_is_resolved_in_insert(self):
+        """Test that project, item and workstream entries resolve their project."""
+        aurora = MagicMock()
+        aurora.execute_returning = AsyncMock(return_value={"id": uuid4()})
+        repo = AuditLogRepository(aurora)
+
+        await repo.create_entry(None, "create", "project", uuid4())
+
+        query, *args = aurora.execute_returning.call_args.args
+        assert args[-1] is None
+        assert "COALESCE($8::uuid" in query
+        assert "WHEN 'project' THEN $4::uuid" in query
+        assert "(SELECT project_id FROM items WHERE id = $4)" in query
+        assert "(SELECT project_id FROM workstreams WHERE id = $4)" in query
+
+    @pytest.mark.asyncio
+    async def test_item_entry_without_project_id_reaches_feed(self):
+        """Test that an item entry written without project_id is read back."""
+        project_id, item_id = uuid4(), uuid4()
+        items = {item_id: project_id}
+        audit_log = []
+
+        async def execute_returning(query, *args):
+            # Stand-in for the INSERT's own project resolution
+            entity_type, entity_id, explicit = args[2], args[3], args[7]
+            resolved = explicit
+            if resolved is None and "FROM items WHERE id = $4" in query:
+                resolved = items.get(entity_id) if entity_type == "item" else None
+            row = TestGetProjectActivity._row(None)
+            row.update(entity_type=entity_type, entity_id=entity_id)
+            audit_log.append((resolved, row))
+            return {"id": row["id"]}
+
+        async def fetch_all(query, *args):
+            assert "a.project_id = $2" in query
+            rows = [row for pid, row in audit_log if pid == args[1]]
+            return [{**row, "total": len(rows)} for row in rows]
+
+        aurora = MagicMock()
+        aurora.execute_returning = execute_returning
+        aurora.fetch_all = fetch_all
+        repo = AuditLogRepository(aurora)
+
+        await repo.create_entry(None, "update", "item", item_id)
+        entries, total = await repo.get_project_activity(project_id)
+
+        assert total == 1
+        assert [e.entity_id for e in entries] == [item_id]
+
+
+# =============================================================================
+# Get Project Activity Tests
+# =============================================================================
+
+class TestGetProjectActivity:
+    """Tests for get_project_activity."""
+
+    @staticmethod
+    def _row(total):
+        from datetime import datetime
+
+        return {
+            "id": uuid4(),
+            "user_id": None,
+            "action": "update",
+            "entity_type": "item",
+            "entity_id": uuid4(),
+            "before_state": None,
+            "after_state": None,
+            "correlation_id": None,
+            "created_at": datetime(2024, 1, 1),
+            "user_name": None,
+            "user_email": None,
+            "total": total,
+        }
+
+    @pytest.mark.asyncio
+    async def test_total_comes_from_page_rows(self):
+        """Test that the page and its total arrive in a single query."""
+        aurora = MagicMock()
+        aurora.fetch_all = AsyncMock(return_value=[self._row(42), self._row(42)])
+        aurora.fetch_one = AsyncMock()
+        repo = AuditLogRepository(aurora)
+
+        entries, total = await repo.get_project_activity(uuid4(), limit=2)
+
+        assert len(entries) == 2
+        assert total == 42
+        assert "COUNT(*) OVER ()" in aurora.fetch_all.call_args.args[0]
+        aurora.fetch_one.assert_not_called()
+
+    def test_fields_line_up_with_entry(self):
+        """Test that positional construction fills every field by name."""
+        from dataclasses import fields
+
+        from src.repositories.audit_log_repository import AuditEntry
+
+        row = self._row(1)
+        entry = AuditLogRepository._row_to_entry(row)
+
+        for f in fields(AuditEntry):
+            assert getattr(entry, f.name) is row[f.name]
+
+    def test_low_cardinality_fields_are_interned(self):
+        """Test that action and entity_type share one string per value."""
+        first, second = self._row(1), self._row(1)
+        second["action"] = "".join(["upd", "ate"])
+
+        a = AuditLogRepository._row_to_entry(first)
+        b = AuditLogRepository._row_to_entry(second)
+
+        assert a.action is b.action
+        assert a.entity_type is b.entity_type
+
+    @pytest.mark.asyncio
+    async def test_page_past_end_still_counts(self):
+        """Test that an empty page beyond the first falls back to the count query."""
+        aurora = MagicMock()
+        aurora.fetch_all = AsyncMock(return_value=[])
+        aurora.fetch_one = AsyncMock(return_value={"total": 7})
+        repo = AuditLogRepository(aurora)
+
+        entries, total = await repo.get_project_activity(uuid4(), limit=10, offset=50)
+
+        assert entries == []
+        assert total == 7
+
+
+class TestGetProjectActivityForUser:
+    """Tests for get_project_activity_for_user."""
+
+    @pytest.mark.asyncio
+    async def test_page_is_read_before_returning(self):
+        """Test that the page is fetched in full, so errors raise here."""
+        aurora = MagicMock()
+        aurora.fetch_one = AsyncMock(return_value={"total": 7, "caller_role": "viewer"})
+        aurora.fetch_all = AsyncMock(side_effect=RuntimeError("cursor lost"))
+        repo = AuditLogRepository(aurora)
+
+        with pytest.raises(RuntimeError):
+            await repo.get_project_activity_for_user(uuid4(), uuid4(), limit=2)
+
+    @pytest.mark.asyncio
+    async def test_no_role_skips_page(self):
+        """Test that callers without a role never read the page."""
+        aurora = MagicMock()
+        aurora.fetch_one = AsyncMock(return_value={"total": 0, "caller_role": None})
+        aurora.fetch_all = AsyncMock()
+        repo = AuditLogRepository(aurora)
+
+        total, role, entries = await repo.get_project_activity_for_user(uuid4(), uuid4())
+
+        assert (total, role, entries) == (0, None, [])
+        aurora.fetch_all.assert_not_called()
+
+
+# =============================================================================
+# AuditEntry Encoding Tests
+# =============================================================================
+
+class TestAuditEntryJson:
+    """Tests for AuditEntry.to_json_bytes."""
+
+    def test_matches_to_dict_document(self):
+        """Test that direct encoding yields the same document as to_dict."""
+        import json
+        from datetime import datetime, timezone
+
+        import orjson
+
+        from src.repositories.audit_log_repository import AuditEntry
+
+        entry = AuditEntry(
+            id=uuid4(),
+            user_id=uuid4(),
+            action="update",
+            entity_type="item",
+            entity_id=uuid4(),
+            before_state=b'{"title": "a"}',
+            after_state=b'{"title": "b"}',
+            correlation_id="req-1",
+            created_at=datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+            user_name="Pat",
+            user_email="pat@example.com",
+        )
+
+        assert json.loads(entry.to_json_bytes()) == json.loads(orjson.dumps(entry.to_dict()))
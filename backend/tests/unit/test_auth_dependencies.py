@@ -8,22 +8,31 @@ Tests authentication dependencies:
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import timedelta
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
 
-from fastapi import HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
 
 from src.api.dependencies.auth import (
+    check_project_role,
     get_current_user,
     get_optional_user,
     require_org_role,
     require_org_owner,
     require_org_admin,
     require_org_member,
+    get_project_access,
+    get_project_role_checker,
+    require_project_admin,
+    require_project_viewer,
+    _project_role_cache,
 )
-from src.domain.auth import CurrentUser, OrgRole
+from src.domain.auth import CurrentUser, OrgRole, ProjectRole
+from src.utils.exceptions import AuthenticationError
 from src.utils.jwt import create_access_token
 
 
@@ -127,12 +136,8 @@ class TestGetOptionalUser:
             email="test@example.com",
             name="Test User",
         )
-        credentials = HTTPAuthorizationCredentials(
-            scheme="Bearer",
-            credentials=token,
-        )
 
-        user = await get_optional_user(credentials)
+        user = await get_optional_user(f"Bearer {token}")
 
         assert isinstance(user, CurrentUser)
         assert user.email == "test@example.com"
@@ -143,19 +148,39 @@ class TestGetOptionalUser:
         user = await get_optional_user(None)
         assert user is None
 
+    @pytest.mark.asyncio
+    async def test_returns_none_for_non_bearer_scheme(self):
+        """Non-bearer Authorization headers are treated as anonymous."""
+        assert await get_optional_user("Basic dXNlcjpwYXNz") is None
+        assert await get_optional_user("Bearer") is None
+
     @pytest.mark.asyncio
     async def test_raises_401_on_invalid_token(self):
         """Invalid token still raises 401."""
-        credentials = HTTPAuthorizationCredentials(
-            scheme="Bearer",
-            credentials="invalid-token",
-        )
-
         with pytest.raises(HTTPException) as exc_info:
-            await get_optional_user(credentials)
+            await get_optional_user("Bearer invalid-token")
 
         assert exc_info.value.status_code == 401
 
+    def test_reads_authorization_header(self):
+        """Wired as a dependency, the raw header is parsed."""
+        token = create_access_token(
+            user_id="550e8400-e29b-41d4-a716-446655440000",
+            email="test@example.com",
+            name="Test User",
+        )
+        app = FastAPI()
+
+        @app.get("/whoami")
+        async def whoami(user=Depends(get_optional_user)):
+            return {"email": user.email if user else None}
+
+        client = TestClient(app)
+
+        assert client.get("/whoami").json() == {"email": None}
+        response = client.get("/whoami", headers={"Authorization": f"bearer {token}"})
+        assert response.json() == {"email": "test@example.com"}
+
 
 class TestRequireOrgRole:
     """Tests for role-based access control."""
@@ -214,6 +239,81 @@ class TestRequireOrgRole:
         assert "No organization context" in exc_info.value.detail
 
 
+    @pytest.mark.asyncio
+    async def test_repeated_rejections_do_not_accumulate_tracebacks(self):
+        """Shared rejection instances start each raise with a fresh traceback."""
+        user = CurrentUser(
+            id=UUID("550e8400-e29b-41d4-a716-446655440000"),
+            email="test@example.com",
+            name="Test User",
+            org_id=UUID("660e8400-e29b-41d4-a716-446655440000"),
+            org_role=OrgRole.MEMBER,
+        )
+        check_role = require_org_role([OrgRole.OWNER])
+
+        def depth(tb):
+            n = 0
+            while tb is not None:
+                n, tb = n + 1, tb.tb_next
+            return n
+
+        depths = []
+        for _ in range(3):
+            with pytest.raises(HTTPException) as exc_info:
+                await check_role(user)
+            depths.append(depth(exc_info.value.__traceback__))
+
+        assert depths[0] == depths[1] == depths[2]
+
+
+class TestRoleCheckerFactories:
+    """Tests for memoized role checker factories."""
+
+    def test_same_org_roles_return_same_checker(self):
+        """Identical role lists share one dependency callable."""
+        first = require_org_role([OrgRole.OWNER, OrgRole.ADMIN])
+        second = require_org_role([OrgRole.OWNER, OrgRole.ADMIN])
+
+        assert first is second
+        assert first is require_org_admin
+
+    def test_same_project_roles_return_same_checker(self):
+        """Identical project role lists share one dependency callable."""
+        checker = get_project_role_checker([ProjectRole.ADMIN])
+
+        assert checker is require_project_admin
+        assert get_project_role_checker([ProjectRole.VIEWER]) is not checker
+
+    def test_role_order_does_not_matter(self):
+        """Role lists are compared as sets, so order is irrelevant."""
+        assert require_org_role([OrgRole.ADMIN, OrgRole.OWNER]) is require_org_admin
+
+
+class TestCheckProjectRole:
+    """Tests for the inline project role check used by routes."""
+
+    def test_accepts_allowed_role(self):
+        """An allowed role is returned unchanged."""
+        assert check_project_role(ProjectRole.ADMIN, {ProjectRole.ADMIN}) is ProjectRole.ADMIN
+        assert check_project_role(ProjectRole.VIEWER) is ProjectRole.VIEWER
+
+    def test_rejects_missing_role(self):
+        """No role on the project is a 403 no-access rejection."""
+        with pytest.raises(HTTPException) as exc_info:
+            check_project_role(None, {ProjectRole.ADMIN})
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.detail == "No access to this project"
+
+    def test_rejects_disallowed_role(self):
+        """A role outside the allowed set is a 403 permissions rejection."""
+        with pytest.raises(HTTPException) as exc_info:
+            check_project_role(ProjectRole.VIEWER, {ProjectRole.ADMIN})
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.detail == "Insufficient project permissions"
+
+
 class TestConvenienceRoleCheckers:
     """Tests for pre-defined role checkers."""
 
@@ -282,3 +382,161 @@ class TestConvenienceRoleCheckers:
                 org_role=role,
             )
             await require_org_member(user)  # Should not raise
+
+
+class TestTokenCache:
+    """Tests for resolved-user caching in auth dependencies."""
+
+    @pytest.mark.asyncio
+    async def test_replayed_token_skips_decode(self):
+        """Second request with the same token is served from cache."""
+        token = create_access_token(
+            user_id="550e8400-e29b-41d4-a716-446655440000",
+            email="test@example.com",
+            name="Test User",
+        )
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer",
+            credentials=token,
+        )
+
+        first = await get_current_user(credentials)
+        with patch("src.api.dependencies.auth.decode_access_token") as mock_decode:
+            second = await get_optional_user(f"Bearer {token}")
+
+        mock_decode.assert_not_called()
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_is_not_cached(self):
+        """Failed validations are re-checked on every request."""
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer",
+            credentials="invalid-token",
+        )
+
+        with patch(
+            "src.api.dependencies.auth.decode_access_token",
+            side_effect=AuthenticationError("Invalid token"),
+        ) as mock_decode:
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await get_current_user(credentials)
+
+        assert mock_decode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_user_is_shared_and_immutable(self):
+        """Cache hits return the same frozen CurrentUser instance."""
+        token = create_access_token(
+            user_id="550e8400-e29b-41d4-a716-446655440000",
+            email="test@example.com",
+            name="Test User",
+        )
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer",
+            credentials=token,
+        )
+
+        first = await get_current_user(credentials)
+        second = await get_current_user(credentials)
+
+        assert second is first
+        with pytest.raises(FrozenInstanceError):
+            first.name = "Changed"
+
+
+class TestProjectRoleResolution:
+    """Tests for per-request project role resolution."""
+
+    @pytest.fixture(autouse=True)
+    def clear_role_cache(self):
+        """Start each test with an empty role cache."""
+        _project_role_cache.clear()
+        yield
+        _project_role_cache.clear()
+
+    @pytest.fixture
+    def app(self):
+        """App with a route stacking several project checkers."""
+        app = FastAPI()
+
+        @app.get("/projects/{project_id}")
+        async def route(
+            project_id: UUID,
+            role: ProjectRole = Depends(get_project_access),
+            _viewer: ProjectRole = Depends(require_project_viewer),
+            _admin: ProjectRole = Depends(require_project_admin),
+        ):
+            return {"role": role.value}
+
+        app.dependency_overrides[get_current_user] = lambda: CurrentUser(
+            id=UUID("550e8400-e29b-41d4-a716-446655440000"),
+            email="test@example.com",
+            name="Test User",
+        )
+        return app
+
+    def test_stacked_checkers_query_role_once(self, app):
+        """Several project checkers on one route share one role lookup."""
+        repo = MagicMock()
+        repo.get_user_role = AsyncMock(return_value=ProjectRole.ADMIN)
+
+        with patch("src.api.dependencies.auth.services"), patch(
+            "src.api.dependencies.auth.UserProjectRoleRepository",
+            return_value=repo,
+        ):
+            response = TestClient(app).get(
+                "/projects/660e8400-e29b-41d4-a716-446655440000"
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {"role": "admin"}
+        repo.get_user_role.assert_awaited_once()
+
+    def test_insufficient_role_is_rejected(self, app):
+        """Role below the strictest checker gets 403."""
+        repo = MagicMock()
+        repo.get_user_role = AsyncMock(return_value=ProjectRole.VIEWER)
+
+        with patch("src.api.dependencies.auth.services"), patch(
+            "src.api.dependencies.auth.UserProjectRoleRepository",
+            return_value=repo,
+        ):
+            response = TestClient(app).get(
+                "/projects/660e8400-e29b-41d4-a716-446655440000"
+            )
+
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Insufficient project permissions"
+
+    def test_role_is_cached_across_requests(self, app):
+        """Repeat requests within the TTL reuse the cached role."""
+        repo = MagicMock()
+        repo.get_user_role = AsyncMock(return_value=ProjectRole.ADMIN)
+
+        with patch("src.api.dependencies.auth.services"), patch(
+            "src.api.dependencies.auth.UserProjectRoleRepository",
+            return_value=repo,
+        ):
+            client = TestClient(app)
+            for _ in range(3):
+                client.get("/projects/660e8400-e29b-41d4-a716-446655440000")
+
+        repo.get_user_role.assert_awaited_once()
+
+    def test_missing_role_is_cached(self, app):
+        """A "no role" result is cached too and still returns 403."""
+        repo = MagicMock()
+        repo.get_user_role = AsyncMock(return_value=None)
+
+        with patch("src.api.dependencies.auth.services"), patch(
+            "src.api.dependencies.auth.UserProjectRoleRepository",
+            return_value=repo,
+        ):
+            client = TestClient(app)
+            for _ in range(2):
+                response = client.get("/projects/660e8400-e29b-41d4-a716-446655440000")
+                assert response.status_code == 403
+
+        repo.get_user_role.assert_awaited_once()
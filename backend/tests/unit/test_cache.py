@@ -0,0 +1,98 @@
+"""
+Unit tests for src/utils/cache.py
+
+Tests the in-process TTL cache:
+- Get/set round trip
+- Expiry handling
+- Size-bounded eviction
+"""
+
+from unittest.mock import patch
+
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_returns_stored_value(self):
+        """Stored values are returned until they expire."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert len(cache) == 1
+
+    def test_returns_none_for_missing_key(self):
+        """Missing keys return None."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        assert cache.get("missing") is None
+
+    def test_default_distinguishes_cached_none(self):
+        """A sentinel default separates a miss from a cached None."""
+        sentinel = object()
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("none", None)
+
+        assert cache.get("none", sentinel) is None
+        assert cache.get("missing", sentinel) is sentinel
+
+    def test_expired_entries_are_dropped(self):
+        """Entries are not returned after their TTL elapses."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("src.utils.cache.time.monotonic", return_value=131.0):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_entry_ttl_is_capped_at_cache_ttl(self):
+        """Per-entry TTL never exceeds the cache default."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value", ttl=3600)
+        with patch("src.utils.cache.time.monotonic", return_value=131.0):
+            assert cache.get("key") is None
+
+    def test_non_positive_ttl_is_not_stored(self):
+        """Entries that would already be expired are skipped."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("key", "value", ttl=0)
+        assert cache.get("key") is None
+
+    def test_evicts_oldest_when_full(self):
+        """Oldest entry is evicted once maxsize is reached."""
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_eviction_drops_expired_prefix_only(self):
+        """A full cache drops expired entries from the front first."""
+        cache = TTLCache(maxsize=3, ttl=30)
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2)
+        with patch("src.utils.cache.time.monotonic", return_value=120.0):
+            cache.set("c", 3)
+        with patch("src.utils.cache.time.monotonic", return_value=131.0):
+            cache.set("d", 4)
+
+            assert len(cache) == 2
+            assert cache.get("c") == 3
+            assert cache.get("d") == 4
+
+    def test_pop_and_clear(self):
+        """pop removes one entry, clear removes all."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
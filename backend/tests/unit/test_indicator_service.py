@@ -10,10 +10,11 @@ from uuid import uuid4
 
 import pytest
 
-from src.domain.core import Item, ItemType, Indicator
+from src.domain.core import Item, ItemColumnBatch, ItemType, Indicator
 from src.services.indicator_service import (
     calculate_indicator,
     calculate_indicators_batch,
+    calculate_indicators_columns,
     get_indicator_severity,
     SOON_THRESHOLD_DAYS,
     COMPLETED_RECENTLY_DAYS,
@@ -413,6 +414,54 @@ class TestBatchCalculation:
         assert results[2] == (items[2], Indicator.IN_PROGRESS)
 
 
+class TestColumnCalculation:
+    """Tests for column-wise indicator calculation."""
+
+    @staticmethod
+    def _batch(items: list[Item]) -> ItemColumnBatch:
+        return ItemColumnBatch(
+            ids=tuple(i.id for i in items),
+            draft=tuple(i.draft for i in items),
+            percent_complete=tuple(i.percent_complete for i in items),
+            start_date=tuple(i.start_date for i in items),
+            finish_date=tuple(i.finish_date for i in items),
+            deadline=tuple(i.deadline for i in items),
+            updated_at=tuple(i.updated_at for i in items),
+            indicator=tuple(i.indicator for i in items),
+        )
+
+    def test_matches_per_item_calculation(self):
+        """Column results equal calculate_indicator across rule boundaries."""
+        today = date(2025, 6, 15)
+        offsets = [None, -30, -15, -14, -1, 0, 1, 14, 15, 30]
+        items = [
+            make_item(
+                draft=draft,
+                percent_complete=pct,
+                start_date=None if s is None else today + timedelta(days=s),
+                finish_date=None if f is None else today + timedelta(days=f),
+                deadline=None if d is None else today + timedelta(days=d),
+                updated_at=None if u is None else datetime.combine(
+                    today + timedelta(days=u), datetime.min.time()
+                ),
+            )
+            for draft in (False, True)
+            for pct in (0, 10, 60, 100)
+            for s in offsets
+            for f in offsets
+            for d in (None, -1, 5)
+            for u in (None, -15, -14)
+        ]
+
+        results = calculate_indicators_columns(self._batch(items), today)
+
+        assert results == [calculate_indicator(item, today) for item in items]
+
+    def test_empty_batch(self):
+        """An empty batch yields no indicators."""
+        assert calculate_indicators_columns(ItemColumnBatch()) == []
+
+
 class TestIndicatorSeverity:
     """Tests for indicator severity ordering."""
 
@@ -0,0 +1,273 @@
+"""
+Unit tests for ItemDependencyRepository.
+
+Tests dependency writes with mocked Aurora service.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.domain.core import ItemDependency
+from src.repositories.item_dependency_repository import (
+    MAX_CHAIN_DEPTH,
+    ItemDependencyRepository,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def mock_aurora():
+    """Mock Aurora service."""
+    aurora = MagicMock()
+    aurora.fetch_one = AsyncMock(
+        return_value={"already_exists": False, "creates_cycle": False}
+    )
+    aurora.execute = AsyncMock()
+    return aurora
+
+
+@pytest.fixture
+def dep_repo(mock_aurora):
+    """Item dependency repository with mocked aurora."""
+    return ItemDependencyRepository(mock_aurora)
+
+
+# =============================================================================
+# Add Tests
+# =============================================================================
+
+class TestAdd:
+    """Tests for add method."""
+
+    @pytest.mark.asyncio
+    async def test_adds_in_single_round_trip(self, dep_repo, mock_aurora):
+        """Test that checks and insert are one statement."""
+        item_id, depends_on_id = uuid4(), uuid4()
+
+        result = await dep_repo.add(item_id, depends_on_id)
+
+        assert result == ItemDependency(item_id=item_id, depends_on_id=depends_on_id)
+        mock_aurora.fetch_one.assert_called_once()
+        mock_aurora.execute.assert_not_called()
+        query, *params = mock_aurora.fetch_one.call_args.args
+        assert "INSERT INTO item_dependencies" in query
+        assert params[:2] == [item_id, depends_on_id]
+
+    @pytest.mark.asyncio
+    async def test_rejects_duplicate(self, dep_repo, mock_aurora):
+        """Test that an existing dependency raises."""
+        mock_aurora.fetch_one.return_value = {
+            "already_exists": True,
+            "creates_cycle": False,
+        }
+
+        with pytest.raises(ValueError, match="already exists"):
+            await dep_repo.add(uuid4(), uuid4())
+
+    @pytest.mark.asyncio
+    async def test_rejects_cycle(self, dep_repo, mock_aurora):
+        """Test that a cyclic dependency raises."""
+        mock_aurora.fetch_one.return_value = {
+            "already_exists": False,
+            "creates_cycle": True,
+        }
+
+        with pytest.raises(ValueError, match="cycle"):
+            await dep_repo.add(uuid4(), uuid4())
+
+
+# =============================================================================
+# Exists Tests
+# =============================================================================
+
+class TestExists:
+    """Tests for exists method."""
+
+    @pytest.mark.asyncio
+    async def test_probe_returns_single_value(self, dep_repo, mock_aurora):
+        """Test that exists reads one value from a LIMIT 1 probe on the writer."""
+        mock_aurora.fetch_val = AsyncMock(side_effect=[True, None])
+        mock_aurora.fetch_val_ro = AsyncMock()
+
+        assert await dep_repo.exists(uuid4(), uuid4()) is True
+        assert await dep_repo.exists(uuid4(), uuid4()) is False
+        assert "LIMIT 1" in mock_aurora.fetch_val.call_args.args[0]
+        mock_aurora.fetch_val_ro.assert_not_called()
+
+
+# =============================================================================
+# Cycle Check Tests
+# =============================================================================
+
+class TestWouldCreateCycle:
+    """Tests for would_create_cycle method."""
+
+    @pytest.mark.asyncio
+    async def test_walk_is_bounded_and_stops_at_first_hit(self, dep_repo, mock_aurora):
+        """Test that the chain walk is depth-limited and short-circuits."""
+        item_id, depends_on_id = uuid4(), uuid4()
+        mock_aurora.fetch_one.return_value = {"?column?": 1}
+
+        assert await dep_repo.would_create_cycle(item_id, depends_on_id) is True
+
+        query, *params = mock_aurora.fetch_one.call_args.args
+        assert "UNION ALL" in query and "LIMIT 1" in query
+        assert params == [depends_on_id, item_id, MAX_CHAIN_DEPTH]
+
+
+# =============================================================================
+# Bulk Read Tests
+# =============================================================================
+
+class TestBulkReads:
+    """Tests for get_dependencies_bulk and get_dependents_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_dependencies_grouped_by_item(self, dep_repo, mock_aurora):
+        """Test that one query serves every item, missing ones mapping to []."""
+        a, b, c, x, y = (uuid4() for _ in range(5))
+        mock_aurora.fetch_all_ro = AsyncMock(return_value=[
+            {"item_id": a, "depends_on_id": x},
+            {"item_id": a, "depends_on_id": y},
+            {"item_id": b, "depends_on_id": x},
+        ])
+
+        result = await dep_repo.get_dependencies_bulk([a, b, c])
+
+        mock_aurora.fetch_all_ro.assert_called_once()
+        assert "ANY($1::uuid[])" in mock_aurora.fetch_all_ro.call_args.args[0]
+        assert [d.depends_on_id for d in result[a]] == [x, y]
+        assert [d.depends_on_id for d in result[b]] == [x]
+        assert result[c] == []
+
+    @pytest.mark.asyncio
+    async def test_dependents_grouped_by_prerequisite(self, dep_repo, mock_aurora):
+        """Test that dependents are keyed by the prerequisite item."""
+        a, b, x = uuid4(), uuid4(), uuid4()
+        mock_aurora.fetch_all_ro = AsyncMock(return_value=[
+            {"item_id": a, "depends_on_id": x},
+            {"item_id": b, "depends_on_id": x},
+        ])
+
+        result = await dep_repo.get_dependents_bulk([x])
+
+        assert [d.item_id for d in result[x]] == [a, b]
+
+    @pytest.mark.asyncio
+    async def test_single_item_uses_bulk_query(self, dep_repo, mock_aurora):
+        """Test that get_dependencies goes through the bulk form."""
+        item_id = uuid4()
+        mock_aurora.fetch_all_ro = AsyncMock(return_value=[])
+
+        assert await dep_repo.get_dependencies(item_id) == []
+        assert mock_aurora.fetch_all_ro.call_args.args[1] == [item_id]
+
+
+# =============================================================================
+# Add Many Tests
+# =============================================================================
+
+class TestAddMany:
+    """Tests for add_many method."""
+
+    @pytest.mark.asyncio
+    async def test_binds_pairs_as_parallel_arrays(self, dep_repo, mock_aurora):
+        """Test that the batch is one statement over two UUID arrays."""
+        a, b, x, y = (uuid4() for _ in range(4))
+        mock_aurora.fetch_one.return_value = {"inserted": 2, "cycles": 0}
+
+        count = await dep_repo.add_many([(a, x), (b, y)])
+
+        assert count == 2
+        query, item_ids, depends_on_ids = mock_aurora.fetch_one.call_args.args
+        assert "UNNEST($1::uuid[], $2::uuid[])" in query
+        assert "ON CONFLICT DO NOTHING" in query
+        # Existing links are walked in place, never deduplicated wholesale
+        assert "edges AS" not in query
+        assert "UNION ALL" in query
+        assert item_ids == [a, b]
+        assert depends_on_ids == [x, y]
+
+    @pytest.mark.asyncio
+    async def test_rejects_batch_with_cycle(self, dep_repo, mock_aurora):
+        """Test that a cycle anywhere in the batch raises."""
+        mock_aurora.fetch_one.return_value = {"inserted": 0, "cycles": 1}
+
+        with pytest.raises(ValueError, match="cycle"):
+            await dep_repo.add_many([(uuid4(), uuid4())])
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_query(self, dep_repo, mock_aurora):
+        """Test that no pairs means no round trip."""
+        assert await dep_repo.add_many([]) == 0
+        mock_aurora.fetch_one.assert_not_called()
+
+
+# =============================================================================
+# Remove Tests
+# =============================================================================
+
+class TestRemove:
+    """Tests for remove and remove_all_for_item methods."""
+
+    @pytest.mark.asyncio
+    async def test_remove_reports_returned_row(self, dep_repo, mock_aurora):
+        """Test that a returned row means the link was deleted."""
+        mock_aurora.fetch_val = AsyncMock(return_value=True)
+
+        assert await dep_repo.remove(uuid4(), uuid4()) is True
+        assert "RETURNING" in mock_aurora.fetch_val.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_remove_missing_link(self, dep_repo, mock_aurora):
+        """Test that no returned row means nothing was deleted."""
+        mock_aurora.fetch_val = AsyncMock(return_value=None)
+
+        assert await dep_repo.remove(uuid4(), uuid4()) is False
+
+    @pytest.mark.asyncio
+    async def test_remove_all_returns_count(self, dep_repo, mock_aurora):
+        """Test that the deleted count comes back as a value."""
+        mock_aurora.fetch_val = AsyncMock(return_value=3)
+
+        assert await dep_repo.remove_all_for_item(uuid4()) == 3
+        query = mock_aurora.fetch_val.call_args.args[0]
+        assert "UNION ALL" in query and "OR depends_on_id" not in query
+
+
+# =============================================================================
+# Closure Prefetch Tests
+# =============================================================================
+
+class TestPrefetchClosure:
+    """Tests for prefetch_closure and its use by would_create_cycle."""
+
+    @pytest.mark.asyncio
+    async def test_cycle_checks_served_from_prefetch(self, dep_repo, mock_aurora):
+        """Test that a prefetched closure answers cycle checks without SQL."""
+        root, upstream, other = uuid4(), uuid4(), uuid4()
+        mock_aurora.fetch_all = AsyncMock(return_value=[{"depends_on_id": upstream}])
+
+        assert await dep_repo.prefetch_closure(root) == frozenset({upstream})
+
+        assert await dep_repo.would_create_cycle(upstream, root) is True
+        assert await dep_repo.would_create_cycle(other, root) is False
+        mock_aurora.fetch_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_drop_prefetched_closures(self, dep_repo, mock_aurora):
+        """Test that adding a link forces the next check back to SQL."""
+        root = uuid4()
+        mock_aurora.fetch_all = AsyncMock(return_value=[])
+        await dep_repo.prefetch_closure(root)
+
+        await dep_repo.add(uuid4(), uuid4())
+        mock_aurora.fetch_one.reset_mock()
+        mock_aurora.fetch_one.return_value = None
+
+        assert await dep_repo.would_create_cycle(uuid4(), root) is False
+        mock_aurora.fetch_one.assert_called_once()
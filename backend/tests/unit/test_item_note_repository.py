@@ -0,0 +1,169 @@
+"""
+Unit tests for ItemNoteRepository.
+
+Tests note updates with mocked Aurora service.
+"""
+
+import pytest
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.repositories.item_note_repository import ItemNoteRepository
+
+
+# =============================================================================
+# Projection Tests
+# =============================================================================
+
+class TestGetByItemIdProjection:
+    """Tests for get_by_item_id_projection method."""
+
+    @pytest.mark.asyncio
+    async def test_selects_only_requested_columns(self):
+        """Test that rows are returned as-is with just the chosen columns."""
+        item_id = uuid4()
+        rows = [{"note_date": date(2025, 1, 1), "content": "Hello"}]
+        aurora = MagicMock()
+        aurora.fetch_all_ro = AsyncMock(return_value=rows)
+        repo = ItemNoteRepository(aurora)
+
+        result = await repo.get_by_item_id_projection(
+            item_id, ("note_date", "content")
+        )
+
+        assert result is rows
+        query, arg = aurora.fetch_all_ro.call_args.args
+        assert "SELECT note_date, content" in query
+        assert arg == item_id
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fields", [(), ("content", "1; DROP TABLE x")])
+    async def test_rejects_bad_fields(self, fields):
+        """Test that empty or unknown field lists never reach the database."""
+        aurora = MagicMock()
+        aurora.fetch_all_ro = AsyncMock()
+        repo = ItemNoteRepository(aurora)
+
+        with pytest.raises(ValueError):
+            await repo.get_by_item_id_projection(uuid4(), fields)
+
+        aurora.fetch_all_ro.assert_not_called()
+
+
+# =============================================================================
+# Update Tests
+# =============================================================================
+
+class TestUpdate:
+    """Tests for update method."""
+
+    @staticmethod
+    def _row(note_id):
+        return {
+            "id": note_id,
+            "item_id": uuid4(),
+            "note_date": date(2025, 1, 1),
+            "content": "Updated",
+            "created_by": None,
+            "created_at": datetime.now(timezone.utc),
+        }
+
+    @pytest.mark.asyncio
+    async def test_statement_is_the_same_for_any_fields(self):
+        """Test that partial updates share one statement text."""
+        note_id = uuid4()
+        aurora = MagicMock()
+        aurora.fetch_one = AsyncMock(return_value=self._row(note_id))
+        repo = ItemNoteRepository(aurora)
+
+        await repo.update(note_id, content="Updated")
+        await repo.update(note_id, note_date=date(2025, 1, 1))
+
+        first, second = aurora.fetch_one.call_args_list
+        assert first.args[0] == second.args[0]
+        assert first.args[1:] == ("Updated", None, note_id)
+        assert second.args[1:] == (None, date(2025, 1, 1), note_id)
+
+    @pytest.mark.asyncio
+    async def test_no_fields_raises_without_query(self):
+        """Test that an empty update is rejected without touching the database."""
+        aurora = MagicMock()
+        aurora.fetch_one = AsyncMock()
+        repo = ItemNoteRepository(aurora)
+
+        with pytest.raises(ValueError, match="No fields to update"):
+            await repo.update(uuid4())
+
+        aurora.fetch_one.assert_not_called()
+
+
+# =============================================================================
+# Delete Tests
+# =============================================================================
+
+class TestDelete:
+    """Tests for delete method."""
+
+    @pytest.mark.asyncio
+    async def test_delete_checks_returned_row(self):
+        """Test that deletion is read from RETURNING, not the command tag."""
+        aurora = MagicMock()
+        aurora.fetch_val = AsyncMock(side_effect=[True, None])
+        repo = ItemNoteRepository(aurora)
+
+        assert await repo.delete(uuid4()) is True
+        assert await repo.delete(uuid4()) is False
+
+
+# =============================================================================
+# Stream Tests
+# =============================================================================
+
+class TestStreamByItemId:
+    """Tests for stream_by_item_id method."""
+
+    @pytest.mark.asyncio
+    async def test_yields_notes_from_cursor(self):
+        """Test that notes are read through the streaming cursor."""
+        item_id = uuid4()
+        rows = [TestUpdate._row(uuid4()), TestUpdate._row(uuid4())]
+        calls = []
+
+        async def stream(query, *args, prefetch):
+            calls.append((query, args, prefetch))
+            for row in rows:
+                yield row
+
+        aurora = MagicMock()
+        aurora.stream = stream
+        repo = ItemNoteRepository(aurora)
+
+        notes = [note async for note in repo.stream_by_item_id(item_id, prefetch=50)]
+
+        assert [n.id for n in notes] == [r["id"] for r in rows]
+        query, args, prefetch = calls[0]
+        assert "FROM item_notes" in query
+        assert args == (item_id,)
+        assert prefetch == 50
+
+
+# =============================================================================
+# Row Mapping Tests
+# =============================================================================
+
+class TestRowToNote:
+    """Tests for _row_to_note helper."""
+
+    def test_positional_fields_line_up(self):
+        """Test that every column lands on the ItemNote field of the same name."""
+        from dataclasses import fields
+
+        from src.domain.core import ItemNote
+
+        row = {f.name: object() for f in fields(ItemNote)}
+
+        note = ItemNoteRepository._row_to_note(row)
+
+        for f in fields(ItemNote):
+            assert getattr(note, f.name) is row[f.name], f.name
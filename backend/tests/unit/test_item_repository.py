@@ -5,13 +5,14 @@ Tests all CRUD operations with mocked Aurora service.
 """
 
 import pytest
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 from src.repositories.item_repository import ItemRepository
-from src.domain.core import ItemType, Indicator
+from src.domain.core import Item, ItemType, Indicator
 
 
 # =============================================================================
@@ -162,6 +163,82 @@ class TestGetByProjectId:
         assert result == []
 
 
+class TestSummaryColumns:
+    """Tests for summary (no long text) item listings."""
+
+    @pytest.mark.asyncio
+    async def test_summary_leaves_long_text_null(self, item_repo, mock_aurora, sample_item_row):
+        """Test that summary reads skip description and rpt_out."""
+        row = {**sample_item_row, "description": None, "rpt_out": None}
+        mock_aurora.fetch_all.return_value = [row]
+
+        items = await item_repo.get_by_project_id(uuid4(), summary=True)
+        await item_repo.list_with_filters(uuid4(), summary=True)
+
+        assert items[0].description is None
+        for call in mock_aurora.fetch_all.call_args_list:
+            query = call.args[0]
+            assert "NULL AS description" in query
+            assert "NULL AS rpt_out" in query
+
+    @pytest.mark.asyncio
+    async def test_full_listing_reads_long_text(self, item_repo, mock_aurora):
+        """Test that the default listing still selects every column."""
+        await item_repo.get_by_project_id(uuid4())
+
+        query = mock_aurora.fetch_all.call_args.args[0]
+        assert "NULL AS" not in query
+        assert "description" in query
+
+
+class TestGetManyByIds:
+    """Tests for get_many_by_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_ids_in_one_query(self, item_repo, mock_aurora, sample_item_row):
+        """Test that every ID is bound as one array parameter."""
+        mock_aurora.fetch_all.return_value = [sample_item_row]
+        ids = [sample_item_row["id"], uuid4()]
+
+        result = await item_repo.get_many_by_ids(ids)
+
+        assert [i.id for i in result] == [sample_item_row["id"]]
+        query, bound = mock_aurora.fetch_all.call_args.args
+        assert "ANY($1::uuid[])" in query
+        assert bound == ids
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_skip_query(self, item_repo, mock_aurora):
+        """Test that an empty ID list never reaches the database."""
+        assert await item_repo.get_many_by_ids([]) == []
+        mock_aurora.fetch_all.assert_not_called()
+
+
+class TestIterByProjectId:
+    """Tests for iter_by_project_id method."""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_from_cursor(self, item_repo, mock_aurora, sample_item_row):
+        """Test that items stream through the cursor with the listing query."""
+        calls = []
+
+        async def stream(query, *args, prefetch):
+            calls.append((query, args, prefetch))
+            yield sample_item_row
+
+        mock_aurora.stream = stream
+        project_id = sample_item_row["project_id"]
+
+        items = [item async for item in item_repo.iter_by_project_id(project_id)]
+        await item_repo.get_by_project_id(project_id)
+
+        assert [i.id for i in items] == [sample_item_row["id"]]
+        query, args, prefetch = calls[0]
+        assert query is mock_aurora.fetch_all.call_args.args[0]
+        assert args == (project_id,)
+        assert prefetch == 500
+
+
 # =============================================================================
 # List With Filters Tests
 # =============================================================================
@@ -221,6 +298,48 @@ class TestListWithFilters:
         call_args = mock_aurora.fetch_all.call_args
         assert "%migration%" in call_args[0]
 
+    @pytest.mark.asyncio
+    async def test_multi_word_search_uses_full_text(self, item_repo, mock_aurora):
+        """Test that several search words use the tsvector instead of ILIKE."""
+        await item_repo.list_with_filters(
+            project_id=uuid4(),
+            search="data migration",
+        )
+
+        query = mock_aurora.fetch_all.call_args.args[0]
+        assert "search_tsv @@ plainto_tsquery('english', $2)" in query
+        assert "ILIKE" not in query
+        assert mock_aurora.fetch_all.call_args.args[2] == "data migration"
+
+    @pytest.mark.asyncio
+    async def test_total_rides_along_with_page(self, item_repo, mock_aurora, sample_item_row):
+        """Test that the total is read from the window count on the page."""
+        mock_aurora.fetch_all.return_value = [{**sample_item_row, "total": 42}]
+
+        items, total = await item_repo.list_with_filters_and_total(
+            uuid4(), draft=False
+        )
+
+        assert len(items) == 1
+        assert total == 42
+        assert "COUNT(*) OVER ()" in mock_aurora.fetch_all.call_args.args[0]
+        mock_aurora.fetch_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_total_past_last_page_uses_count_query(self, item_repo, mock_aurora):
+        """Test that an empty page past the end still reports the total."""
+        mock_aurora.fetch_one.return_value = {"total": 3}
+        project_id = uuid4()
+
+        items, total = await item_repo.list_with_filters_and_total(
+            project_id, draft=True, offset=50
+        )
+
+        assert (items, total) == ([], 3)
+        query, *args = mock_aurora.fetch_one.call_args.args
+        assert "draft = $2" in query
+        assert args == [project_id, True]
+
     @pytest.mark.asyncio
     async def test_applies_limit_and_offset(self, item_repo, mock_aurora):
         """Test that limit and offset are applied."""
@@ -236,6 +355,22 @@ class TestListWithFilters:
         assert 10 in call_args[0]
         assert 20 in call_args[0]
 
+    @pytest.mark.asyncio
+    async def test_same_filter_shape_reuses_query_text(self, item_repo, mock_aurora):
+        """Test that calls with the same filters set share one statement."""
+        await item_repo.list_with_filters(
+            project_id=uuid4(), draft=False, search="a"
+        )
+        await item_repo.list_with_filters(
+            project_id=uuid4(), draft=True, search="b"
+        )
+
+        first, second = mock_aurora.fetch_all.call_args_list
+        assert first.args[0] is second.args[0]
+        assert first.args[2:] == (False, "%a%", 100, 0)
+        assert "draft = $2" in first.args[0]
+        assert "LIMIT $4 OFFSET $5" in first.args[0]
+
 
 # =============================================================================
 # Count Tests
@@ -278,7 +413,6 @@ class TestCreate:
 
         result = await item_repo.create(
             project_id=project_id,
-            item_num=1,
             item_type=ItemType.RISK,
             title="New Risk",
         )
@@ -287,6 +421,27 @@ class TestCreate:
         assert result.title == "Test Risk Item"  # from mock
         mock_aurora.fetch_one.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_numbers_item_in_same_statement(self, item_repo, mock_aurora, sample_item_row):
+        """Test that the project counter is bumped by the insert itself."""
+        mock_aurora.fetch_one.return_value = sample_item_row
+        project_id = sample_item_row["project_id"]
+
+        await item_repo.create(project_id, ItemType.RISK, "New Risk")
+
+        query, *args = mock_aurora.fetch_one.call_args.args
+        assert "UPDATE projects" in query
+        assert "next_item_num - 1 AS item_num" in query
+        assert args[:3] == [project_id, "Risk", "New Risk"]
+
+    @pytest.mark.asyncio
+    async def test_missing_project_raises(self, item_repo, mock_aurora):
+        """Test that create raises when the project does not exist."""
+        mock_aurora.fetch_one.return_value = None
+
+        with pytest.raises(ValueError, match="Project not found"):
+            await item_repo.create(uuid4(), ItemType.RISK, "New Risk")
+
     @pytest.mark.asyncio
     async def test_creates_item_with_all_fields(self, item_repo, mock_aurora, sample_item_row):
         """Test that create works with all fields."""
@@ -296,7 +451,6 @@ class TestCreate:
 
         result = await item_repo.create(
             project_id=project_id,
-            item_num=1,
             item_type=ItemType.BUDGET,
             title="Budget Item",
             description="Budget description",
@@ -318,6 +472,75 @@ class TestCreate:
         assert result is not None
 
 
+# =============================================================================
+# Bulk Create Tests
+# =============================================================================
+
+class TestBulkCreate:
+    """Tests for bulk_create method."""
+
+    @pytest.fixture
+    def conn(self, mock_aurora):
+        """Transaction connection handed out by the mocked Aurora service."""
+        conn = MagicMock()
+        conn.copy_records_to_table = AsyncMock()
+
+        @asynccontextmanager
+        async def transaction():
+            yield conn
+
+        mock_aurora.transaction = transaction
+        return conn
+
+    @pytest.mark.asyncio
+    async def test_copies_rows_with_reserved_numbers(self, item_repo, mock_aurora, conn, sample_item_row):
+        """Test that numbers are reserved once and rows go through COPY."""
+        mock_aurora.fetch_val = AsyncMock(return_value=7)
+        mock_aurora.fetch_all.return_value = [sample_item_row]
+        project_id = sample_item_row["project_id"]
+
+        result = await item_repo.bulk_create(project_id, [
+            {"item_type": ItemType.RISK, "title": "First"},
+            {"item_type": ItemType.ISSUE, "title": "Second", "draft": True,
+             "indicator": Indicator.COMPLETED, "rpt_out": ["EXEC"]},
+        ])
+
+        assert len(result) == 1
+        assert mock_aurora.fetch_val.call_args.args[1:] == (project_id, 2)
+        assert mock_aurora.fetch_val.call_args.kwargs["tx"] is conn
+
+        kwargs = conn.copy_records_to_table.call_args.kwargs
+        first, second = kwargs["records"]
+        columns = kwargs["columns"]
+        assert dict(zip(columns, first))["item_num"] == 7
+        assert dict(zip(columns, first))["draft"] is False
+        assert dict(zip(columns, second))["item_num"] == 8
+        assert dict(zip(columns, second))["indicator"] == Indicator.COMPLETED.value
+        assert dict(zip(columns, second))["rpt_out"] == ["EXEC"]
+
+        assert mock_aurora.fetch_all.call_args.args[1:] == (project_id, 7, 9)
+
+    @pytest.mark.asyncio
+    async def test_missing_project_raises(self, item_repo, mock_aurora, conn):
+        """Test that nothing is copied when the project does not exist."""
+        mock_aurora.fetch_val = AsyncMock(return_value=None)
+
+        with pytest.raises(ValueError, match="Project not found"):
+            await item_repo.bulk_create(
+                uuid4(), [{"item_type": ItemType.RISK, "title": "First"}]
+            )
+
+        conn.copy_records_to_table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_database(self, item_repo, mock_aurora):
+        """Test that an empty batch never opens a transaction."""
+        mock_aurora.transaction = MagicMock()
+
+        assert await item_repo.bulk_create(uuid4(), []) == []
+        mock_aurora.transaction.assert_not_called()
+
+
 # =============================================================================
 # Update Tests
 # =============================================================================
@@ -408,6 +631,39 @@ class TestUpdateIndicator:
         assert result is False
 
 
+# =============================================================================
+# Fetch Project Columns Tests
+# =============================================================================
+
+class TestFetchProjectColumns:
+    """Tests for fetch_project_columns method."""
+
+    @pytest.mark.asyncio
+    async def test_transposes_rows_into_columns(self, item_repo, mock_aurora, sample_item_row):
+        """Test that rows come back as one tuple per column."""
+        row2 = sample_item_row.copy()
+        row2["id"] = uuid4()
+        row2["indicator"] = None
+        mock_aurora.fetch_all.return_value = [sample_item_row, row2]
+
+        batch = await item_repo.fetch_project_columns(sample_item_row["project_id"])
+
+        assert len(batch) == 2
+        assert batch.ids == (sample_item_row["id"], row2["id"])
+        assert batch.percent_complete == (50, 50)
+        assert batch.indicator == (Indicator.IN_PROGRESS, None)
+        query = mock_aurora.fetch_all.call_args.args[0]
+        assert "title" not in query and "draft = false" not in query
+
+    @pytest.mark.asyncio
+    async def test_empty_project(self, item_repo, mock_aurora):
+        """Test that a project without items yields an empty batch."""
+        batch = await item_repo.fetch_project_columns(uuid4())
+
+        assert len(batch) == 0
+        assert batch.indicator == ()
+
+
 # =============================================================================
 # Batch Update Indicators Tests
 # =============================================================================
@@ -417,17 +673,27 @@ class TestBatchUpdateIndicators:
 
     @pytest.mark.asyncio
     async def test_updates_all_items(self, item_repo, mock_aurora):
-        """Test that batch_update_indicators updates all items."""
-        mock_aurora.execute.return_value = "UPDATE 1"
+        """Test that batch_update_indicators updates all items in one query."""
+        mock_aurora.fetch_val = AsyncMock(return_value=3)
+        ids = [uuid4(), uuid4(), uuid4()]
         updates = [
-            (uuid4(), Indicator.COMPLETED),
-            (uuid4(), Indicator.IN_PROGRESS),
-            (uuid4(), Indicator.NOT_STARTED),
+            (ids[0], Indicator.COMPLETED),
+            (ids[1], Indicator.IN_PROGRESS),
+            (ids[2], None),
         ]
 
         result = await item_repo.batch_update_indicators(updates)
 
         assert result == 3
+        mock_aurora.fetch_val.assert_called_once()
+        mock_aurora.execute.assert_not_called()
+        query, item_ids, indicators, project_id = mock_aurora.fetch_val.call_args.args
+        assert "UNNEST($1::uuid[], $2::indicator_enum[])" in query
+        assert project_id is None
+        assert item_ids == ids
+        assert indicators == [
+            Indicator.COMPLETED.value, Indicator.IN_PROGRESS.value, None
+        ]
 
     @pytest.mark.asyncio
     async def test_returns_zero_for_empty_list(self, item_repo, mock_aurora):
@@ -436,6 +702,22 @@ class TestBatchUpdateIndicators:
 
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_stamps_project_in_same_statement(self, item_repo, mock_aurora):
+        """Test that the project timestamp rides along, even with no changes."""
+        mock_aurora.fetch_val = AsyncMock(return_value=0)
+        project_id = uuid4()
+
+        result = await item_repo.batch_update_indicators([], project_id=project_id)
+
+        assert result == 0
+        query, item_ids, indicators, bound = mock_aurora.fetch_val.call_args.args
+        assert "indicators_updated = now()" in query
+        assert "WHERE id = $3::uuid" in query
+        # The stamp shares the statement, so the enum cast must hold here too
+        assert "$2::indicator_enum[]" in query
+        assert (item_ids, indicators, bound) == ([], [], project_id)
+
 
 # =============================================================================
 # Soft Delete Tests
@@ -462,6 +744,18 @@ class TestSoftDelete:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_scopes_delete_to_project(self, item_repo, mock_aurora):
+        """Test that a project_id is checked in the same UPDATE statement."""
+        mock_aurora.execute.return_value = "UPDATE 1"
+        item_id, project_id = uuid4(), uuid4()
+
+        await item_repo.soft_delete(item_id, project_id)
+
+        query, *params = mock_aurora.execute.call_args.args
+        assert "project_id = $2" in query
+        assert params == [item_id, project_id]
+
 
 # =============================================================================
 # Row To Item Conversion Tests
@@ -484,6 +778,50 @@ class TestRowToItem:
         assert result.indicator == Indicator.IN_PROGRESS
         assert result.budget_amount == Decimal("10000.00")
 
+    def test_positional_fields_line_up(self):
+        """Test that every column lands on the Item field of the same name."""
+        from dataclasses import fields
+
+        names = [f.name for f in fields(Item) if f.init]
+        row = {name: object() for name in names}
+        row["type"] = ItemType.RISK.value
+        row["indicator"] = Indicator.IN_PROGRESS.value
+        # Interned fields need strings; fresh ones intern to themselves
+        row["assigned_to"] = f"assignee-{id(row)}"
+        row["priority"] = f"priority-{id(row)}"
+        # Derived flags compare it; any large int is still its own object
+        row["percent_complete"] = 10**6
+
+        result = ItemRepository._row_to_item(row)
+
+        for name in names:
+            if name not in ("type", "indicator"):
+                assert getattr(result, name) is row[name], name
+
+    def test_repeated_strings_are_interned(self, sample_item_row):
+        """Test that assignee and priority share one string per value."""
+        other = dict(sample_item_row)
+        other["assigned_to"] = "".join(list(sample_item_row["assigned_to"]))
+        other["priority"] = "".join(list(sample_item_row["priority"]))
+
+        a = ItemRepository._row_to_item(sample_item_row)
+        b = ItemRepository._row_to_item(other)
+
+        assert a.assigned_to is b.assigned_to
+        assert a.priority is b.priority
+
+    def test_derived_flags_follow_row(self, sample_item_row):
+        """Test that derived flags are computed from the loaded row."""
+        sample_item_row["deleted_at"] = datetime.now(timezone.utc)
+        sample_item_row["deadline"] = None
+
+        result = ItemRepository._row_to_item(sample_item_row)
+
+        assert result.is_active is False
+        assert result.has_dates is True
+        assert result.has_deadline is False
+        assert result.is_complete is False
+
     def test_returns_none_for_none_row(self):
         """Test that _row_to_item returns None for None row."""
         result = ItemRepository._row_to_item(None)
@@ -0,0 +1,127 @@
+"""
+Unit tests for src/services/item_service.py
+
+Tests item service behavior with mocked repositories:
+- Update and delete scoped to a parent project
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.domain.core import Item, ItemColumnBatch, ItemType
+from src.services.item_service import ItemService
+
+
+class TestItemServiceUpdate:
+    """Tests for ItemService.update_item."""
+
+    @pytest.fixture
+    def item_service(self):
+        """Create ItemService with a mocked item repository."""
+        service = ItemService(MagicMock())
+        service._item_repo = MagicMock()
+        service._item_repo.get_by_id = AsyncMock()
+        service._item_repo.update = AsyncMock()
+        service._item_repo.update_indicator = AsyncMock()
+        return service
+
+    @pytest.fixture
+    def existing_item(self):
+        """Item stored in the repository."""
+        return Item(
+            id=uuid4(),
+            project_id=uuid4(),
+            item_num=1,
+            type=ItemType.RISK,
+            title="Existing",
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_in_other_project_is_not_found(self, item_service, existing_item):
+        """Items outside the given project are reported as not found."""
+        item_service._item_repo.get_by_id.return_value = existing_item
+
+        result = await item_service.update_item(
+            existing_item.id, title="New", project_id=uuid4()
+        )
+
+        assert result.success is False
+        assert result.error == "Item not found"
+        item_service._item_repo.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_in_same_project_reads_item_once(self, item_service, existing_item):
+        """A scoped update needs only the service's own existence read."""
+        item_service._item_repo.get_by_id.return_value = existing_item
+        item_service._item_repo.update.return_value = existing_item
+
+        result = await item_service.update_item(
+            existing_item.id, title="Existing", project_id=existing_item.project_id
+        )
+
+        assert result.success is True
+        assert result.item is existing_item
+        item_service._item_repo.get_by_id.assert_awaited_once_with(existing_item.id)
+
+
+class TestItemServiceDelete:
+    """Tests for ItemService.delete_item."""
+
+    @pytest.mark.asyncio
+    async def test_delete_in_other_project_is_not_found(self):
+        """A scoped delete that matches no row reports not found without a pre-read."""
+        service = ItemService(MagicMock())
+        service._item_repo = MagicMock()
+        service._item_repo.get_by_id = AsyncMock()
+        service._item_repo.soft_delete = AsyncMock(return_value=False)
+        item_id, project_id = uuid4(), uuid4()
+
+        result = await service.delete_item(item_id, project_id=project_id)
+
+        assert result.success is False
+        assert result.error == "Item not found"
+        service._item_repo.soft_delete.assert_awaited_once_with(item_id, project_id)
+        service._item_repo.get_by_id.assert_not_called()
+
+
+class TestItemServiceIndicators:
+    """Tests for ItemService.update_all_indicators."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_project_is_still_stamped(self):
+        """A recalculation with no changes still stamps the project in one call."""
+        service = ItemService(MagicMock())
+        service._item_repo = MagicMock()
+        service._item_repo.fetch_project_columns = AsyncMock(
+            return_value=ItemColumnBatch()
+        )
+        service._item_repo.batch_update_indicators = AsyncMock(return_value=0)
+        service._project_repo = MagicMock()
+        service._project_repo.update_indicators_timestamp = AsyncMock()
+        project_id = uuid4()
+
+        assert await service.update_all_indicators(project_id) == 0
+
+        service._item_repo.batch_update_indicators.assert_awaited_once_with(
+            [], project_id=project_id
+        )
+        service._project_repo.update_indicators_timestamp.assert_not_called()
+
+
+class TestItemServiceList:
+    """Tests for ItemService list methods."""
+
+    @pytest.mark.asyncio
+    async def test_list_items_with_total_returns_page_and_count(self):
+        """The page and the full match count come back as a pair."""
+        service = ItemService(MagicMock())
+        service._item_repo = MagicMock()
+        service._item_repo.list_with_filters_and_total = AsyncMock(return_value=([], 12))
+        project_id = uuid4()
+
+        items, total = await service.list_items_with_total(project_id, limit=5, offset=10)
+
+        assert (items, total) == ([], 12)
+        kwargs = service._item_repo.list_with_filters_and_total.call_args.kwargs
+        assert (kwargs["project_id"], kwargs["limit"], kwargs["offset"]) == (project_id, 5, 10)
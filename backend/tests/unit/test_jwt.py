@@ -11,7 +11,7 @@ Tests JWT token creation and validation:
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
-from jose import jwt
+from jose import jwk, jwt
 
 from src.utils.jwt import (
     create_access_token,
@@ -19,6 +19,7 @@ from src.utils.jwt import (
     get_token_expiry,
     is_token_expired,
     get_token_user_id,
+    _verification_key,
 )
 from src.utils.exceptions import AuthenticationError
 
@@ -159,6 +160,21 @@ class TestDecodeAccessToken:
         with pytest.raises(AuthenticationError):
             decode_access_token("not.a.valid.token")
 
+    def test_verification_key_is_built_once(self):
+        """Repeated decodes reuse the constructed verification key."""
+        token = create_access_token(
+            user_id="test-uuid",
+            email="test@example.com",
+            name="Test User",
+        )
+        _verification_key.cache_clear()
+
+        with patch("src.utils.jwt.jwk.construct", wraps=jwk.construct) as construct:
+            decode_access_token(token)
+            decode_access_token(token)
+
+        assert construct.call_count == 1
+
     def test_raises_on_missing_required_claims(self):
         """Token missing required claims raises AuthenticationError."""
         from src.config import get_config
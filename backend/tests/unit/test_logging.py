@@ -5,12 +5,15 @@ Tests the structured logging configuration:
 - setup_logging() configuration
 - get_logger() returns bound loggers
 - sanitize_for_logging() masks sensitive data
+- log_enabled() reflects the configured level
 """
 
+import logging
+
 import pytest
 import structlog
 
-from src.utils.logging import setup_logging, get_logger, sanitize_for_logging
+from src.utils.logging import setup_logging, get_logger, log_enabled, sanitize_for_logging
 
 
 class TestSetupLogging:
@@ -39,6 +42,63 @@ class TestSetupLogging:
         setup_logging(log_level="INVALID_LEVEL")
 
 
+class TestLogEnabled:
+    """Tests for log_enabled() function."""
+
+    def teardown_method(self):
+        """Restore verbose logging for other tests."""
+        setup_logging(environment="development", log_level="DEBUG")
+
+    def test_follows_configured_level(self):
+        """Levels below the configured level are disabled."""
+        setup_logging(log_level="WARNING")
+
+        assert log_enabled(logging.INFO) is False
+        assert log_enabled(logging.WARNING) is True
+        assert log_enabled(logging.ERROR) is True
+
+    def test_debug_enables_everything(self):
+        """DEBUG level lets every level through."""
+        setup_logging(log_level="DEBUG")
+
+        assert log_enabled(logging.DEBUG) is True
+
+
+class TestUUIDRendering:
+    """Tests for UUID values in log events."""
+
+    def teardown_method(self):
+        """Restore verbose logging for other tests."""
+        setup_logging(environment="development", log_level="DEBUG")
+
+    def test_uuid_fields_render_as_plain_strings(self, capsys):
+        """UUIDs passed as-is appear as their string form in JSON output."""
+        import json
+        from uuid import uuid4
+
+        project_id = uuid4()
+        setup_logging(log_level="INFO", json_output=True)
+
+        get_logger("test").info("uuid_event", project_id=project_id)
+
+        event = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert event["project_id"] == str(project_id)
+
+
+    def test_asyncpg_uuids_render_as_plain_strings(self, capsys):
+        """UUIDs read from asyncpg rows are rendered like stdlib UUIDs."""
+        import json
+
+        from asyncpg.pgproto import pgproto
+
+        item_id = pgproto.UUID("550e8400-e29b-41d4-a716-446655440000")
+        setup_logging(log_level="INFO", json_output=True)
+
+        get_logger("test").info("uuid_event", item_id=item_id)
+
+        event = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert event["item_id"] == "550e8400-e29b-41d4-a716-446655440000"
+
 class TestGetLogger:
     """Tests for get_logger() function."""
 
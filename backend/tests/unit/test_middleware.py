@@ -140,6 +140,19 @@ class TestRequestLoggingMiddleware:
             assert "request_started" in call_events
             assert "request_completed" in call_events
 
+    def test_skips_info_logs_when_level_is_warning(self, client):
+        """Successful requests log nothing when INFO is filtered out."""
+        from src.utils.logging import setup_logging
+
+        setup_logging(log_level="WARNING")
+        try:
+            with patch("src.api.middleware.request_logging.logger") as mock_logger:
+                response = client.get("/test")
+                assert response.status_code == 200
+                assert mock_logger.info.call_count == 0
+        finally:
+            setup_logging(log_level="DEBUG")
+
     def test_excludes_health_endpoints(self, client):
         """Health check paths are not logged."""
         with patch("src.api.middleware.request_logging.logger") as mock_logger:
@@ -9,6 +9,7 @@ from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+from src.domain.auth import ProjectRole
 from src.repositories.project_repository import ProjectRepository
 
 
@@ -90,6 +91,40 @@ class TestGetById:
         assert project_id in call_args[0]
 
 
+# =============================================================================
+# Get With User Role Tests
+# =============================================================================
+
+class TestGetWithUserRole:
+    """Tests for get_with_user_role method."""
+
+    @pytest.mark.asyncio
+    async def test_returns_project_and_role(self, project_repo, mock_aurora, sample_project_row):
+        """Test that the project and the caller's role come from one row."""
+        from src.domain.auth import ProjectRole
+
+        mock_aurora.fetch_one.return_value = {**sample_project_row, "caller_role": "admin"}
+
+        project, role = await project_repo.get_with_user_role(sample_project_row["id"], uuid4())
+
+        assert project.id == sample_project_row["id"]
+        assert role == ProjectRole.ADMIN
+        mock_aurora.fetch_one.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_project_keeps_role(self, project_repo, mock_aurora, sample_project_row):
+        """Test that a deleted project still reports the caller's role."""
+        from src.domain.auth import ProjectRole
+
+        row = {key: None for key in sample_project_row}
+        mock_aurora.fetch_one.return_value = {**row, "caller_role": "viewer"}
+
+        project, role = await project_repo.get_with_user_role(uuid4(), uuid4())
+
+        assert project is None
+        assert role == ProjectRole.VIEWER
+
+
 # =============================================================================
 # Get By Org ID Tests
 # =============================================================================
@@ -153,6 +188,19 @@ class TestListForUser:
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_keyset_page_binds_cursor_and_limit(self, project_repo, mock_aurora):
+        """Test that a page seeks past the cursor row instead of using OFFSET."""
+        user_id, org_id, cursor = uuid4(), uuid4(), uuid4()
+
+        await project_repo.list_for_user(user_id, org_id, limit=26, after=cursor)
+
+        query, *params = mock_aurora.fetch_all.call_args.args
+        assert "(p.name, p.id) >" in query
+        assert "LIMIT $4" in query
+        assert "OFFSET" not in query
+        assert params == [user_id, org_id, cursor, 26]
+
 
 # =============================================================================
 # Exists Tests
@@ -301,6 +349,48 @@ class TestSoftDelete:
         assert result is False
 
 
+# =============================================================================
+# Soft Delete With Role Tests
+# =============================================================================
+
+class TestSoftDeleteWithRole:
+    """Tests for soft_delete_with_role method."""
+
+    @pytest.mark.asyncio
+    async def test_admin_deletes_in_one_statement(self, project_repo, mock_aurora):
+        """Test that the role check and delete share a single query."""
+        project_id, user_id = uuid4(), uuid4()
+        mock_aurora.fetch_one.return_value = {"caller_role": "admin", "deleted": True}
+
+        result = await project_repo.soft_delete_with_role(
+            project_id, user_id, ProjectRole.ADMIN
+        )
+
+        assert result == (ProjectRole.ADMIN, True)
+        mock_aurora.fetch_one.assert_awaited_once()
+        query, *params = mock_aurora.fetch_one.call_args.args
+        assert "WITH caller AS" in query
+        assert params == [project_id, user_id, "admin"]
+
+    @pytest.mark.asyncio
+    async def test_other_role_is_reported_without_delete(self, project_repo, mock_aurora):
+        """Test that a lesser role comes back with nothing deleted."""
+        mock_aurora.fetch_one.return_value = {"caller_role": "viewer", "deleted": False}
+
+        result = await project_repo.soft_delete_with_role(uuid4(), uuid4(), ProjectRole.ADMIN)
+
+        assert result == (ProjectRole.VIEWER, False)
+
+    @pytest.mark.asyncio
+    async def test_no_role_returns_none(self, project_repo, mock_aurora):
+        """Test that a user without access gets no role back."""
+        mock_aurora.fetch_one.return_value = {"caller_role": None, "deleted": False}
+
+        result = await project_repo.soft_delete_with_role(uuid4(), uuid4(), ProjectRole.ADMIN)
+
+        assert result == (None, False)
+
+
 # =============================================================================
 # Increment Item Num Tests
 # =============================================================================
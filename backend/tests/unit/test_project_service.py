@@ -0,0 +1,147 @@
+"""
+Unit tests for src/services/project_service.py
+
+Tests project service behavior with mocked repositories:
+- Short-TTL caching of project reads and its invalidation
+- Project creation
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.domain.core import Project
+from src.services.project_service import ProjectService
+
+
+class TestProjectCache:
+    """Tests for ProjectService read caching."""
+
+    @pytest.fixture
+    def project(self):
+        """Project stored in the repository."""
+        return Project(id=uuid4(), organization_id=uuid4(), name="Website")
+
+    @pytest.fixture
+    def project_service(self, project):
+        """Create ProjectService with a mocked project repository."""
+        service = ProjectService(MagicMock())
+        service._project_repo = MagicMock()
+        service._project_repo.get_by_id = AsyncMock(return_value=project)
+        service._project_repo.list_for_user = AsyncMock(return_value=[project])
+        service._project_repo.update = AsyncMock(return_value=project)
+        service._project_repo.soft_delete = AsyncMock(return_value=True)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_get_project_is_cached(self, project_service, project):
+        """Repeated reads of a project hit the database once."""
+        assert await project_service.get_project(project.id) is project
+        assert await project_service.get_project(project.id) is project
+
+        project_service._project_repo.get_by_id.assert_awaited_once_with(project.id)
+
+    @pytest.mark.asyncio
+    async def test_missing_project_is_not_cached(self, project_service):
+        """A not-found result is looked up again on the next read."""
+        project_service._project_repo.get_by_id.return_value = None
+        project_id = uuid4()
+
+        await project_service.get_project(project_id)
+        await project_service.get_project(project_id)
+
+        assert project_service._project_repo.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_for_user_is_cached_until_update(self, project_service, project):
+        """Updating a project drops cached project lists."""
+        user_id, org_id = uuid4(), project.organization_id
+
+        await project_service.list_projects_for_user(user_id, org_id)
+        await project_service.list_projects_for_user(user_id, org_id)
+        assert project_service._project_repo.list_for_user.await_count == 1
+
+        await project_service.update_project(project.id, name="Renamed")
+        await project_service.list_projects_for_user(user_id, org_id)
+        assert project_service._project_repo.list_for_user.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts_project(self, project_service, project):
+        """A deleted project is no longer served from the cache."""
+        await project_service.get_project(project.id)
+        await project_service.delete_project(project.id)
+        project_service._project_repo.get_by_id.return_value = None
+
+        assert await project_service.get_project(project.id) is None
+
+
+class TestProjectServiceCreate:
+    """Tests for ProjectService.create_project."""
+
+    @staticmethod
+    def _service(project):
+        """ProjectService with mocked repositories and a recording transaction."""
+        aurora = MagicMock()
+        aurora.conn = object()
+        aurora.exits = []
+
+        @asynccontextmanager
+        async def transaction():
+            try:
+                yield aurora.conn
+            except BaseException as e:
+                aurora.exits.append(e)
+                raise
+            aurora.exits.append(None)
+
+        aurora.transaction = transaction
+        service = ProjectService(aurora)
+        service._project_repo = MagicMock()
+        service._project_repo.create = AsyncMock(return_value=project)
+        service._workstream_repo = MagicMock()
+        service._workstream_repo.create_many = AsyncMock(return_value=[])
+        service._role_repo = MagicMock()
+        service._role_repo.assign_role = AsyncMock()
+        return service, aurora
+
+    @pytest.mark.asyncio
+    async def test_creator_becomes_admin(self):
+        """The creating user is given the admin role in the same transaction."""
+        from src.domain.auth import ProjectRole
+
+        project = Project(id=uuid4(), organization_id=uuid4(), name="Website")
+        service, aurora = self._service(project)
+        user_id = uuid4()
+
+        result = await service.create_project(
+            org_id=project.organization_id,
+            name="Website",
+            workstreams=["Development"],
+            created_by=user_id,
+        )
+
+        assert result.success is True
+        assert service._project_repo.create.call_args.kwargs["tx"] is aurora.conn
+        service._workstream_repo.create_many.assert_awaited_once_with(
+            project.id, ["Development"], tx=aurora.conn
+        )
+        service._role_repo.assign_role.assert_awaited_once_with(
+            user_id, project.id, ProjectRole.ADMIN, tx=aurora.conn
+        )
+        assert aurora.exits == [None]
+
+    @pytest.mark.asyncio
+    async def test_failed_role_insert_rolls_back(self):
+        """A failing role insert aborts the transaction holding the project."""
+        project = Project(id=uuid4(), organization_id=uuid4(), name="Website")
+        service, aurora = self._service(project)
+        error = RuntimeError("insert failed")
+        service._role_repo.assign_role.side_effect = error
+
+        with pytest.raises(RuntimeError):
+            await service.create_project(
+                org_id=project.organization_id, name="Website", created_by=uuid4()
+            )
+
+        assert aurora.exits == [error]
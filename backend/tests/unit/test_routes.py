@@ -4,14 +4,27 @@ Unit tests for src/api/routes/
 Tests API endpoints:
 - Health check endpoint
 - Root endpoint
+- Chat WebSocket streaming
+- Item response construction
+- Activity feed streaming
+- UUID path parameter parsing
 """
 
+import asyncio
+import json
+from uuid import UUID
+
 import pytest
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
 
 from src.api.routes.health import router
+from src.api.dependencies.auth import _project_role_cache
+from src.api.routes import activity, chat, projects
+from src.api.routes.items import _item_response
+from src.api.schemas.items import ItemResponse
+from src.services.chat_service import get_chat_service
 
 
 class TestHealthRouter:
@@ -196,3 +209,778 @@ class TestHealthRouterResponses:
 
             response = client.get("/")
             assert "application/json" in response.headers.get("content-type", "")
+
+
+class FakeChatService:
+    """Chat service stub that streams a fixed list of chunks."""
+
+    def __init__(self, chunks, delay=0.0):
+        self.chunks = chunks
+        self.delay = delay
+
+    async def stream_message(self, user_message):
+        for chunk in self.chunks:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield chunk
+
+
+class TestChatWebSocket:
+    """Tests for chat.py WebSocket streaming."""
+
+    def _connect(self, service):
+        app = FastAPI()
+        app.include_router(chat.router, prefix="/api")
+        app.dependency_overrides[get_chat_service] = lambda: service
+        return TestClient(app).websocket_connect("/api/chat/ws")
+
+    def test_coalesces_small_chunks(self):
+        """Many tiny chunks arrive as fewer text frames."""
+        chunks = ["ab"] * 100
+        with self._connect(FakeChatService(chunks)) as ws:
+            ws.send_text(json.dumps({"type": "message", "content": "hi"}))
+
+            frames = []
+            while True:
+                frame = json.loads(ws.receive_text())
+                if frame["type"] != "stream":
+                    break
+                frames.append(frame)
+
+        assert len(frames) < len(chunks)
+        assert "".join(f["content"] for f in frames) == "ab" * 100
+        assert frame["type"] == "message"
+        assert frame["content"] == "ab" * 100
+        assert frame["id"].startswith("msg-")
+
+    def test_invalid_json_returns_error_frame(self):
+        """Malformed client frames get a text error frame back."""
+        with self._connect(FakeChatService([])) as ws:
+            ws.send_text("{not json")
+            frame = json.loads(ws.receive_text())
+
+        assert frame == {"type": "error", "message": "Invalid JSON format"}
+
+    @pytest.mark.asyncio
+    async def test_flushes_buffer_when_source_stalls(self):
+        """Buffered text is flushed after the interval even without new chunks."""
+
+        async def source():
+            yield "a"
+            await asyncio.sleep(0.2)
+            yield "b"
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        batches = []
+        async for batch in chat._coalesce_chunks(source(), flush_chars=64, flush_seconds=0.01):
+            batches.append((batch, loop.time() - started))
+
+        assert [b for b, _ in batches] == ["a", "b"]
+        assert batches[0][1] < 0.15
+
+
+class TestChatMessageEndpoint:
+    """Tests for chat.py POST /chat/message."""
+
+    def _post(self, service, body):
+        from src.api.dependencies.auth import get_optional_user
+
+        app = FastAPI()
+        app.include_router(chat.router, prefix="/api")
+        app.dependency_overrides[get_chat_service] = lambda: service
+        app.dependency_overrides[get_optional_user] = lambda: None
+        return TestClient(app).post("/api/chat/message", json=body)
+
+    def test_project_id_is_parsed_as_uuid(self):
+        """project_id reaches the service as a UUID."""
+        from unittest.mock import AsyncMock
+        from uuid import UUID
+
+        from src.services.chat_service import ChatMessage
+
+        service = Mock()
+        service.send_message = AsyncMock(
+            return_value=ChatMessage(role="assistant", content="ok", message_id="m1")
+        )
+        project_id = "550e8400-e29b-41d4-a716-446655440000"
+
+        response = self._post(service, {"message": "hi", "project_id": project_id})
+
+        assert response.status_code == 200
+        kwargs = service.send_message.await_args.kwargs
+        assert kwargs["project_id"] == UUID(project_id)
+
+    def test_invalid_project_id_is_rejected(self):
+        """Malformed project_id fails request validation."""
+        service = Mock()
+
+        response = self._post(service, {"message": "hi", "project_id": "nope"})
+
+        assert response.status_code == 422
+        service.send_message.assert_not_called()
+
+
+class TestItemResponseConstruction:
+    """Tests for items.py responses encoded with orjson."""
+
+    def test_matches_validated_response(self):
+        """Constructed responses serialize the same as validated ones."""
+        from datetime import date, datetime
+        from decimal import Decimal
+        from uuid import uuid4
+
+        from src.domain.core import Indicator, Item, ItemType
+
+        item = Item(
+            id=uuid4(),
+            project_id=uuid4(),
+            item_num=7,
+            type=ItemType.BUDGET,
+            title="Budget line",
+            start_date=date(2024, 1, 1),
+            indicator=Indicator.FINISHING_SOON,
+            rpt_out=["A"],
+            budget_amount=Decimal("12.50"),
+            created_at=datetime(2024, 1, 1, 12, 0),
+            deleted_at=datetime(2024, 2, 1),
+        )
+
+        response = _item_response(item)
+
+        assert json.loads(response.body) == (
+            ItemResponse.model_validate(item).model_dump(mode="json")
+        )
+
+    def test_decimal_stays_a_string(self):
+        """Budget amounts are sent as strings, as the validated model sends them."""
+        from decimal import Decimal
+        from uuid import uuid4
+
+        from src.domain.core import Item, ItemType
+
+        item = Item(
+            id=uuid4(),
+            project_id=uuid4(),
+            item_num=1,
+            type=ItemType.BUDGET,
+            title="Budget line",
+            budget_amount=Decimal("12.50"),
+        )
+
+        body = json.loads(_item_response(item).body)
+
+        assert body["budget_amount"] == "12.50"
+        assert body["id"] == str(item.id)
+
+
+class TestWorkstreamListEncoding:
+    """Tests for workstreams.py list responses encoded with orjson."""
+
+    def test_matches_validated_response(self):
+        """The orjson body equals the Pydantic-serialized response model."""
+        from uuid import uuid4
+
+        from src.api.dependencies.auth import get_project_access
+        from src.api.routes import workstreams
+        from src.api.schemas.workstreams import WorkstreamListResponse
+        from src.domain.auth import ProjectRole
+        from src.domain.core import Workstream
+
+        project_id = uuid4()
+        items = [
+            Workstream(id=uuid4(), project_id=project_id, name=name, sort_order=i)
+            for i, name in enumerate(["Development", "Testing"])
+        ]
+        service = Mock()
+
+        async def list_workstreams(pid):
+            return items
+
+        service.list_workstreams = list_workstreams
+        app = FastAPI()
+        app.include_router(workstreams.router, prefix="/api")
+        app.dependency_overrides[get_project_access] = lambda: ProjectRole.VIEWER
+        with patch.object(workstreams, "_get_workstream_service", return_value=service):
+            response = TestClient(app).get(f"/api/projects/{project_id}/workstreams")
+
+        assert response.status_code == 200
+        assert response.json() == WorkstreamListResponse.model_validate(
+            {"workstreams": items}, from_attributes=True
+        ).model_dump(mode="json")
+
+    def test_create_encodes_single_workstream(self):
+        """A created workstream is returned with 201 in the validated shape."""
+        from uuid import uuid4
+
+        from src.api.dependencies.auth import require_project_manager
+        from src.api.routes import workstreams
+        from src.api.schemas.workstreams import WorkstreamResponse
+        from src.domain.auth import ProjectRole
+        from src.domain.core import Workstream, WorkstreamResult
+
+        project_id = uuid4()
+        created = Workstream(id=uuid4(), project_id=project_id, name="QA", sort_order=3)
+        service = Mock()
+
+        async def create_workstream(project_id, name):
+            return WorkstreamResult(success=True, workstream=created)
+
+        service.create_workstream = create_workstream
+        app = FastAPI()
+        app.include_router(workstreams.router, prefix="/api")
+        app.dependency_overrides[require_project_manager] = lambda: ProjectRole.ADMIN
+        with patch.object(workstreams, "_get_workstream_service", return_value=service):
+            response = TestClient(app).post(
+                f"/api/projects/{project_id}/workstreams", json={"name": "QA"}
+            )
+
+        assert response.status_code == 201
+        assert response.json() == WorkstreamResponse.model_validate(created).model_dump(
+            mode="json"
+        )
+
+    def test_limit_returns_page_with_cursor(self):
+        """A limited request uses the keyset page and reports next_cursor."""
+        from uuid import uuid4
+
+        from src.api.dependencies.auth import get_project_access
+        from src.api.routes import workstreams
+        from src.domain.auth import ProjectRole
+        from src.domain.core import Workstream
+
+        project_id = uuid4()
+        page = [Workstream(id=uuid4(), project_id=project_id, name="Development")]
+        service = Mock()
+        calls = []
+
+        async def list_workstreams_page(pid, limit, after):
+            calls.append((pid, limit, after))
+            return page, page[-1].id
+
+        service.list_workstreams_page = list_workstreams_page
+        app = FastAPI()
+        app.include_router(workstreams.router, prefix="/api")
+        app.dependency_overrides[get_project_access] = lambda: ProjectRole.VIEWER
+        with patch.object(workstreams, "_get_workstream_service", return_value=service):
+            response = TestClient(app).get(
+                f"/api/projects/{project_id}/workstreams", params={"limit": 1}
+            )
+
+        assert response.status_code == 200
+        assert calls == [(project_id, 1, None)]
+        assert response.json()["next_cursor"] == str(page[-1].id)
+
+
+class FakeAuditRepo:
+    """Audit repository stub that returns a fixed list of entries."""
+
+    def __init__(self, entries, total, role=None, error=None):
+        from src.domain.auth import ProjectRole
+
+        self.entries = entries
+        self.total = total
+        self.role = role or ProjectRole.VIEWER
+        self.error = error
+        self.calls = 0
+
+    async def get_project_activity_for_user(self, **kwargs):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.total, self.role, self.entries
+
+
+class TestActivityFeedStreaming:
+    """Tests for activity.py streamed feed."""
+
+    USER_ID = UUID("660e8400-e29b-41d4-a716-446655440000")
+    PROJECT_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+
+    @pytest.fixture(autouse=True)
+    def clear_role_cache(self):
+        _project_role_cache.clear()
+        yield
+        _project_role_cache.clear()
+
+    def _get(self, repo, raise_server_exceptions=True):
+        from src.api.dependencies.auth import get_current_user
+        from src.domain.auth import CurrentUser
+
+        user = CurrentUser(id=self.USER_ID, email="u@example.com", name="U")
+        app = FastAPI()
+        app.include_router(activity.router, prefix="/api")
+        app.dependency_overrides[get_current_user] = lambda: user
+        app.dependency_overrides[activity._get_audit_repo] = lambda: repo
+        client = TestClient(app, raise_server_exceptions=raise_server_exceptions)
+        return client.get(
+            f"/api/projects/{self.PROJECT_ID}/activity",
+            params={"limit": 2, "offset": 4},
+        )
+
+    def test_streams_entries_as_json_document(self):
+        """Streamed feed matches the buffered response shape."""
+        from datetime import datetime
+        from uuid import uuid4
+
+        from src.repositories.audit_log_repository import AuditEntry
+
+        entries = [
+            AuditEntry(
+                id=uuid4(),
+                user_id=None,
+                action=action,
+                entity_type="item",
+                entity_id=uuid4(),
+                before_state=None,
+                after_state=b'{"title": "x"}',
+                correlation_id=None,
+                created_at=datetime(2024, 1, 1),
+            )
+            for action in ("create", "update")
+        ]
+
+        response = self._get(FakeAuditRepo(entries, total=9))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "activity": [
+                {
+                    **e.to_dict(),
+                    "id": str(e.id),
+                    "entity_id": str(e.entity_id),
+                    "created_at": e.created_at.isoformat(),
+                }
+                for e in entries
+            ],
+            "total": 9,
+            "limit": 2,
+            "offset": 4,
+        }
+
+    def test_page_query_error_fails_before_response(self):
+        """A failing page fetch is a 500, never a truncated 200 body."""
+        from src.utils.exceptions import DatabaseError
+
+        repo = FakeAuditRepo([], total=0, error=DatabaseError("Query execution failed"))
+
+        response = self._get(repo, raise_server_exceptions=False)
+
+        assert response.status_code == 500
+        assert not response.content.startswith(b'{"activity":')
+
+    def test_item_history_is_encoded_per_entry(self):
+        """Item history returns every entry plus the item id."""
+        from datetime import datetime
+        from uuid import uuid4
+
+        from src.api.dependencies.auth import require_project_viewer
+        from src.domain.auth import ProjectRole
+        from src.repositories.audit_log_repository import AuditEntry
+
+        item_id = uuid4()
+        entries = [
+            AuditEntry(
+                id=uuid4(),
+                user_id=None,
+                action=action,
+                entity_type="item",
+                entity_id=item_id,
+                before_state=None,
+                after_state=b'{"title": "x"}',
+                correlation_id=None,
+                created_at=datetime(2024, 1, 1),
+            )
+            for action in ("create", "update")
+        ]
+        repo = Mock()
+
+        async def get_item_history(item_id, limit):
+            return entries
+
+        repo.get_item_history = get_item_history
+        app = FastAPI()
+        app.include_router(activity.router, prefix="/api")
+        app.dependency_overrides[require_project_viewer] = lambda: ProjectRole.VIEWER
+        app.dependency_overrides[activity._get_audit_repo] = lambda: repo
+        response = TestClient(app).get(
+            f"/api/projects/{self.PROJECT_ID}/items/{item_id}/history"
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["item_id"] == str(item_id)
+        assert [e["action"] for e in body["history"]] == ["create", "update"]
+        assert body["history"][0]["created_at"] == "2024-01-01T00:00:00"
+
+    def test_empty_feed_is_valid_json(self):
+        """No entries still yields a well-formed document."""
+        response = self._get(FakeAuditRepo([], total=0))
+
+        assert response.json() == {"activity": [], "total": 0, "limit": 2, "offset": 4}
+
+    def test_role_from_feed_query_is_checked_and_cached(self):
+        """A non-member gets 403 from the fused query, then from the cache."""
+        repo = FakeAuditRepo([], total=0)
+        repo.role = None
+
+        assert self._get(repo).status_code == 403
+        assert self._get(repo).status_code == 403
+        assert repo.calls == 1
+        assert _project_role_cache.get((self.USER_ID, self.PROJECT_ID), "miss") is None
+
+
+class FakeProjectService:
+    """Project service stub returning a fixed (project, role) pair."""
+
+    def __init__(self, project, role):
+        self.project = project
+        self.role = role
+        self.calls = 0
+
+    async def get_project_for_user(self, project_id, user_id):
+        self.calls += 1
+        return self.project, self.role
+
+
+class TestGetProjectRoute:
+    """Tests for projects.py get_project role handling."""
+
+    USER_ID = UUID("660e8400-e29b-41d4-a716-446655440000")
+    PROJECT_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+
+    @pytest.fixture(autouse=True)
+    def clear_role_cache(self):
+        _project_role_cache.clear()
+        yield
+        _project_role_cache.clear()
+
+    def _get(self, service):
+        from src.api.dependencies.auth import get_current_user
+        from src.domain.auth import CurrentUser
+
+        user = CurrentUser(id=self.USER_ID, email="u@example.com", name="U")
+        app = FastAPI()
+        app.include_router(projects.router, prefix="/api")
+        app.dependency_overrides[get_current_user] = lambda: user
+        with patch.object(projects, "_get_project_service", return_value=service):
+            return TestClient(app).get(f"/api/projects/{self.PROJECT_ID}")
+
+    def test_project_and_role_fetched_together(self):
+        """A member gets the project from a single service call."""
+        from src.domain.auth import ProjectRole
+        from src.domain.core import Project
+
+        project = Project(
+            id=self.PROJECT_ID,
+            organization_id=self.USER_ID,
+            name="Website",
+            next_item_num=1,
+        )
+        service = FakeProjectService(project, ProjectRole.VIEWER)
+
+        response = self._get(service)
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Website"
+        assert service.calls == 1
+        assert _project_role_cache.get((self.USER_ID, self.PROJECT_ID)) == ProjectRole.VIEWER
+
+    def test_response_matches_validated_model(self):
+        """The constructed response serializes like a validated one."""
+        from datetime import date, datetime
+
+        from src.api.schemas.projects import ProjectResponse
+        from src.domain.auth import ProjectRole
+        from src.domain.core import Project
+
+        project = Project(
+            id=self.PROJECT_ID,
+            organization_id=self.USER_ID,
+            name="Website",
+            project_start=date(2024, 1, 1),
+            created_at=datetime(2024, 1, 1, 12, 0),
+        )
+
+        response = self._get(FakeProjectService(project, ProjectRole.ADMIN))
+
+        assert response.json() == ProjectResponse.model_validate(project).model_dump(mode="json")
+
+    def test_non_member_is_forbidden_then_cached(self):
+        """A non-member gets 403, and the second request skips the query."""
+        service = FakeProjectService(None, None)
+
+        assert self._get(service).status_code == 403
+        assert self._get(service).status_code == 403
+        assert service.calls == 1
+
+    def test_member_of_deleted_project_gets_404(self):
+        """A member still gets 404 once the project is deleted."""
+        from src.domain.auth import ProjectRole
+
+        response = self._get(FakeProjectService(None, ProjectRole.ADMIN))
+
+        assert response.status_code == 404
+
+    def _delete(self, service):
+        from src.api.dependencies.auth import get_current_user
+        from src.domain.auth import CurrentUser
+
+        user = CurrentUser(id=self.USER_ID, email="u@example.com", name="U")
+        app = FastAPI()
+        app.include_router(projects.router, prefix="/api")
+        app.dependency_overrides[get_current_user] = lambda: user
+        with patch.object(projects, "_get_project_service", return_value=service):
+            return TestClient(app).delete(f"/api/projects/{self.PROJECT_ID}")
+
+    def _delete_service(self, role, deleted):
+        service = Mock()
+        service.calls = 0
+
+        async def delete_project_for_user(project_id, user_id):
+            service.calls += 1
+            return role, deleted
+
+        service.delete_project_for_user = delete_project_for_user
+        return service
+
+    def test_delete_checks_role_in_the_delete(self):
+        """An uncached admin deletes with one service call and the role is cached."""
+        from src.domain.auth import ProjectRole
+
+        service = self._delete_service(ProjectRole.ADMIN, True)
+
+        assert self._delete(service).status_code == 204
+        assert service.calls == 1
+        assert _project_role_cache.get((self.USER_ID, self.PROJECT_ID)) == ProjectRole.ADMIN
+
+    def test_delete_by_non_admin_is_forbidden_then_cached(self):
+        """A non-admin gets 403, and the retry is rejected without a query."""
+        from src.domain.auth import ProjectRole
+
+        service = self._delete_service(ProjectRole.VIEWER, False)
+
+        assert self._delete(service).status_code == 403
+        assert self._delete(service).status_code == 403
+        assert service.calls == 1
+
+    def test_delete_missing_project_is_404(self):
+        """An admin role with nothing deleted means the project is gone."""
+        from src.domain.auth import ProjectRole
+
+        response = self._delete(self._delete_service(ProjectRole.ADMIN, False))
+
+        assert response.status_code == 404
+
+    def test_create_seeds_creator_role(self):
+        """Creating a project caches the creator's admin role for later requests."""
+        from src.api.dependencies.auth import get_current_user
+        from src.domain.auth import CurrentUser, ProjectRole
+        from src.domain.core import Project, ProjectResult
+
+        user = CurrentUser(
+            id=self.USER_ID, email="u@example.com", name="U", org_id=self.USER_ID
+        )
+        project = Project(id=self.PROJECT_ID, organization_id=self.USER_ID, name="Website")
+        service = Mock()
+
+        async def create_project(**kwargs):
+            return ProjectResult(success=True, project=project)
+
+        service.create_project = create_project
+        app = FastAPI()
+        app.include_router(projects.router, prefix="/api")
+        app.dependency_overrides[get_current_user] = lambda: user
+        with patch.object(projects, "_get_project_service", return_value=service):
+            response = TestClient(app).post("/api/projects", json={"name": "Website"})
+
+        assert response.status_code == 201
+        assert _project_role_cache.get((self.USER_ID, self.PROJECT_ID)) == ProjectRole.ADMIN
+
+
+class TestCallableKindCache:
+    """Tests for the dependency solver's memoized callable-kind checks."""
+
+    def test_predicates_are_memoized_per_callable(self):
+        """Each callable is inspected once, and answers are unchanged."""
+        import fastapi.dependencies.utils as fastapi_utils
+
+        from src.api.dependencies.solver import install_callable_kind_cache
+
+        install_callable_kind_cache()
+        install_callable_kind_cache()
+
+        predicate = fastapi_utils.is_coroutine_callable
+        original = predicate.__wrapped__
+        assert not hasattr(original, "__wrapped__")
+
+        async def dependency():
+            return None
+
+        with patch("inspect.iscoroutinefunction", wraps=__import__("inspect").iscoroutinefunction) as spy:
+            assert predicate(dependency) is True
+            assert predicate(dependency) is True
+        assert spy.call_count == 1
+        assert fastapi_utils.is_gen_callable(dependency) is False
+
+    def test_patched_predicates_exist_in_fastapi(self):
+        """The installed FastAPI still defines and calls every patched helper."""
+        import fastapi.dependencies.utils as fastapi_utils
+
+        from src.api.dependencies.solver import _PREDICATES
+
+        solver_names = fastapi_utils.solve_dependencies.__code__.co_names
+        for name in _PREDICATES:
+            assert callable(getattr(fastapi_utils, name, None)), name
+            assert name in solver_names, name
+
+    def test_missing_predicate_is_skipped(self):
+        """A helper missing from FastAPI is skipped, not an import error."""
+        import fastapi.dependencies.utils as fastapi_utils
+
+        from src.api.dependencies import solver
+
+        with patch.object(solver, "_PREDICATES", ("is_removed_callable",)):
+            solver.install_callable_kind_cache()
+
+        assert not hasattr(fastapi_utils, "is_removed_callable")
+
+    def test_unhashable_callables_fall_through(self):
+        """Callables that cannot be weakly referenced are still answered."""
+        import fastapi.dependencies.utils as fastapi_utils
+
+        from src.api.dependencies.solver import install_callable_kind_cache
+
+        class Slotted:
+            __slots__ = ()
+
+            async def __call__(self):
+                return None
+
+        install_callable_kind_cache()
+        assert fastapi_utils.is_coroutine_callable(Slotted()) is True
+
+
+class TestUpdateIndicatorsRoute:
+    """Tests for projects.py indicator recalculation."""
+
+    PROJECT_ID = UUID("550e8400-e29b-41d4-a716-446655440000")
+
+    def _post(self, project, item_service):
+        from src.api.dependencies.auth import get_project_access
+        from src.domain.auth import ProjectRole
+
+        project_service = Mock()
+
+        async def get_project(project_id):
+            return project
+
+        project_service.get_project = get_project
+        app = FastAPI()
+        app.include_router(projects.router, prefix="/api")
+        app.dependency_overrides[get_project_access] = lambda: ProjectRole.VIEWER
+        with patch.object(projects, "_get_project_service", return_value=project_service), \
+                patch.object(projects, "_get_item_service", return_value=item_service):
+            return TestClient(app).post(f"/api/projects/{self.PROJECT_ID}/update-indicators")
+
+    def test_recalculation_completes_before_response(self):
+        """The 204 is only sent once the recalculation has run."""
+        calls = []
+
+        class ItemServiceStub:
+            async def update_all_indicators(self, project_id):
+                calls.append(project_id)
+                return 3
+
+        response = self._post(object(), ItemServiceStub())
+
+        assert response.status_code == 204
+        assert calls == [self.PROJECT_ID]
+
+    def test_recalculation_failure_fails_request(self):
+        """Errors in the recalculation reach the client, not just the log."""
+
+        class FailingItemService:
+            async def update_all_indicators(self, project_id):
+                raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            self._post(object(), FailingItemService())
+
+    def test_missing_project_is_not_recalculated(self):
+        """A missing project is reported without recalculating."""
+
+        class UnusedItemService:
+            async def update_all_indicators(self, project_id):
+                raise AssertionError("should not run")
+
+        response = self._post(None, UnusedItemService())
+
+        assert response.status_code == 404
+
+
+class TestSharedRouteServices:
+    """Tests for per-process service instances in project and workstream routes."""
+
+    def test_services_are_reused_per_aurora(self):
+        """Repeated lookups return the same service while Aurora is unchanged."""
+        from src.api.routes import workstreams
+
+        aurora = Mock()
+
+        assert projects._project_service_for(aurora) is projects._project_service_for(aurora)
+        assert projects._item_service_for(aurora) is projects._item_service_for(aurora)
+        assert (
+            workstreams._workstream_service_for(aurora)
+            is workstreams._workstream_service_for(aurora)
+        )
+        assert projects._project_service_for(Mock()) is not projects._project_service_for(aurora)
+
+
+class TestUUIDPathParams:
+    """Tests for UUID path parameters parsed by dependencies.params."""
+
+    @pytest.fixture
+    def client(self):
+        from src.api.dependencies.params import ItemIdPath, ProjectIdPath
+
+        app = FastAPI()
+
+        @app.get("/projects/{project_id}/items/{item_id}")
+        async def endpoint(project_id: ProjectIdPath, item_id: ItemIdPath):
+            return {"types": [type(project_id).__name__, type(item_id).__name__]}
+
+        return TestClient(app)
+
+    def test_parses_uuids(self, client):
+        """Valid path segments arrive as UUID objects."""
+        response = client.get(
+            "/projects/550e8400-e29b-41d4-a716-446655440000"
+            "/items/660e8400-e29b-41d4-a716-446655440000"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"types": ["UUID", "UUID"]}
+
+    def test_invalid_uuid_is_422(self, client):
+        """A malformed id is rejected like a Pydantic UUID field would be."""
+        response = client.get(
+            "/projects/550e8400-e29b-41d4-a716-446655440000/items/not-a-uuid"
+        )
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["loc"] == ["path", "item_id"]
+        assert error["type"] == "uuid_parsing"
+
+    def test_openapi_keeps_uuid_format(self, client):
+        """The schema still documents the parameters as UUIDs."""
+        params = client.get("/openapi.json").json()["paths"][
+            "/projects/{project_id}/items/{item_id}"
+        ]["get"]["parameters"]
+
+        assert {p["name"]: p["schema"].get("format") for p in params} == {
+            "project_id": "uuid",
+            "item_id": "uuid",
+        }
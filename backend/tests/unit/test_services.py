@@ -237,9 +237,11 @@ class TestAuroraConfig:
         assert config.name == "braidmgr_dev"
         assert config.user == "postgres"
         assert config.password == "postgres"
-        assert config.min_connections == 2
-        assert config.max_connections == 10
+        assert config.min_connections == 10
+        assert config.max_connections == 25
         assert config.connection_timeout == 30
+        assert config.max_inactive_connection_lifetime == 300.0
+        assert config.statement_cache_size == 256
 
     def test_custom_values(self):
         """AuroraConfig accepts custom values."""
@@ -299,6 +301,37 @@ class TestAuroraService:
         assert service.config.host == "testhost"
 
 
+class TestJsonbCodec:
+    """Tests for the jsonb codec registered on pool connections."""
+
+    def test_round_trip_keeps_raw_json(self):
+        """Written objects read back as their JSON bytes."""
+        from src.services.aurora_service import _decode_jsonb, _encode_jsonb
+
+        wire = _encode_jsonb({"title": "a"})
+
+        assert wire[:1] == b"\x01"
+        assert _decode_jsonb(wire) == b'{"title":"a"}'
+
+    def test_raw_bytes_pass_through(self):
+        """Raw JSON bytes are written without re-encoding."""
+        from src.services.aurora_service import _encode_jsonb
+
+        assert _encode_jsonb(b'{"a": 1}') == b'\x01{"a": 1}'
+
+    @pytest.mark.asyncio
+    async def test_init_registers_binary_codec(self):
+        """Each new connection gets the jsonb codec."""
+        from src.services.aurora_service import _init_connection
+
+        conn = AsyncMock()
+        await _init_connection(conn)
+
+        args, kwargs = conn.set_type_codec.call_args
+        assert args == ("jsonb",)
+        assert kwargs["format"] == "binary"
+
+
 class TestAuroraServiceAsync:
     """Async tests for AuroraService (mocked)."""
 
@@ -329,3 +362,66 @@ class TestAuroraServiceAsync:
 
         mock_pool.close.assert_called_once()
         assert aurora_service._pool is None
+
+    @pytest.mark.asyncio
+    async def test_connect_creates_pool_with_config(self, aurora_service):
+        """connect() opens the pool eagerly with the configured bounds."""
+        mock_pool = Mock()
+        with patch(
+            "src.services.aurora_service.asyncpg.create_pool",
+            AsyncMock(return_value=mock_pool),
+        ) as create_pool:
+            await aurora_service.connect()
+
+        assert aurora_service._pool is mock_pool
+        kwargs = create_pool.call_args.kwargs
+        assert kwargs["min_size"] == 10
+        assert kwargs["max_size"] == 25
+        assert kwargs["max_inactive_connection_lifetime"] == 300.0
+        assert kwargs["statement_cache_size"] == 256
+
+    def test_pool_stats(self, aurora_service):
+        """pool_stats() reports bounds, and live counts once the pool exists."""
+        assert aurora_service.pool_stats() == {
+            "min_size": 10, "max_size": 25, "size": 0, "idle": 0,
+        }
+
+        mock_pool = Mock()
+        mock_pool.get_size.return_value = 12
+        mock_pool.get_idle_size.return_value = 7
+        aurora_service._pool = mock_pool
+
+        assert aurora_service.pool_stats()["size"] == 12
+        assert aurora_service.pool_stats()["idle"] == 7
+
+    @pytest.mark.asyncio
+    async def test_readonly_queries_use_writer_without_reader(self, aurora_service):
+        """Read-only queries fall back to the writer pool with no reader_host."""
+        mock_pool = Mock()
+        mock_pool.fetchval = AsyncMock(return_value=1)
+        aurora_service._pool = mock_pool
+
+        assert await aurora_service.fetch_val_ro("SELECT 1") == 1
+        assert aurora_service._reader_pool is None
+
+    @pytest.mark.asyncio
+    async def test_readonly_queries_use_reader_pool(self):
+        """Read-only queries go to the reader; writes stay on the writer."""
+        service = AuroraService(AuroraConfig(host="writer", reader_host="reader"))
+        writer, reader = Mock(), Mock()
+        writer.execute = AsyncMock(return_value="DELETE 1")
+        reader.fetch = AsyncMock(return_value=[{"id": 1}])
+
+        async def create_pool(dsn, **kwargs):
+            return reader if "@reader:" in dsn else writer
+
+        with patch(
+            "src.services.aurora_service.asyncpg.create_pool", create_pool
+        ):
+            assert await service.fetch_all_ro("SELECT id FROM t") == [{"id": 1}]
+            await service.execute("DELETE FROM t")
+
+        reader.fetch.assert_called_once()
+        writer.execute.assert_called_once()
+        assert service._reader_pool is reader
+        assert service._pool is writer
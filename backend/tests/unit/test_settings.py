@@ -103,9 +103,11 @@ class TestDataclassDefaults:
     def test_database_pool_defaults(self):
         """DatabasePoolConfig has sensible defaults."""
         config = DatabasePoolConfig()
-        assert config.min_connections == 2
-        assert config.max_connections == 10
+        assert config.min_connections == 10
+        assert config.max_connections == 25
         assert config.connection_timeout == 30
+        assert config.max_inactive_connection_lifetime == 300.0
+        assert config.statement_cache_size == 256
 
     def test_database_config_defaults(self):
         """DatabaseConfig has sensible defaults."""
@@ -0,0 +1,172 @@
+"""
+Unit tests for WorkstreamRepository.
+
+Tests batched and single-statement operations with mocked Aurora service.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.repositories.workstream_repository import WorkstreamRepository
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def mock_aurora():
+    """Mock Aurora service."""
+    aurora = MagicMock()
+    aurora.fetch_one = AsyncMock(return_value=None)
+    aurora.fetch_all = AsyncMock(return_value=[])
+    aurora.execute = AsyncMock(return_value="DELETE 0")
+    return aurora
+
+
+@pytest.fixture
+def workstream_repo(mock_aurora):
+    """Workstream repository with mocked aurora."""
+    return WorkstreamRepository(mock_aurora)
+
+
+# =============================================================================
+# Create Many Tests
+# =============================================================================
+
+class TestCreateMany:
+    """Tests for create_many method."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_all_names_in_one_query(self, workstream_repo, mock_aurora):
+        """Test that every workstream is created by a single statement."""
+        project_id = uuid4()
+        names = ["Development", "Testing", "Deployment"]
+        mock_aurora.fetch_all.return_value = [
+            {"id": uuid4(), "project_id": project_id, "name": name, "sort_order": i}
+            for i, name in reversed(list(enumerate(names)))
+        ]
+
+        result = await workstream_repo.create_many(project_id, names)
+
+        mock_aurora.fetch_all.assert_awaited_once()
+        query, *params = mock_aurora.fetch_all.call_args.args
+        assert "unnest" in query
+        assert params == [project_id, names]
+        assert [w.name for w in result] == names
+        assert [w.sort_order for w in result] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_empty_list_skips_query(self, workstream_repo, mock_aurora):
+        """Test that no names means no database call."""
+        result = await workstream_repo.create_many(uuid4(), [])
+
+        assert result == []
+        mock_aurora.fetch_all.assert_not_called()
+
+
+# =============================================================================
+# Get By Project Id Tests
+# =============================================================================
+
+class TestGetByProjectId:
+    """Tests for get_by_project_id method."""
+
+    @pytest.mark.asyncio
+    async def test_unpaged_lists_whole_project(self, workstream_repo, mock_aurora):
+        """Test that no limit or cursor reads every workstream."""
+        project_id = uuid4()
+
+        await workstream_repo.get_by_project_id(project_id)
+
+        query, *params = mock_aurora.fetch_all.call_args.args
+        assert "LIMIT" not in query
+        assert params == [project_id]
+
+    @pytest.mark.asyncio
+    async def test_keyset_page_binds_cursor_and_limit(self, workstream_repo, mock_aurora):
+        """Test that a page seeks past the cursor row in sort order."""
+        project_id, cursor = uuid4(), uuid4()
+
+        await workstream_repo.get_by_project_id(project_id, limit=11, after=cursor)
+
+        query, *params = mock_aurora.fetch_all.call_args.args
+        assert "(sort_order, name, id) >" in query
+        assert "LIMIT $3" in query
+        assert params == [project_id, cursor, 11]
+
+
+# =============================================================================
+# Rename In Project Tests
+# =============================================================================
+
+class TestRenameInProject:
+    """Tests for rename_in_project method."""
+
+    @pytest.mark.asyncio
+    async def test_renames_in_one_statement(self, workstream_repo, mock_aurora):
+        """Test that a free name is applied and the workstream returned."""
+        workstream_id, project_id = uuid4(), uuid4()
+        mock_aurora.fetch_one.return_value = {
+            "name_taken": False,
+            "id": workstream_id,
+            "project_id": project_id,
+            "name": "QA",
+            "sort_order": 2,
+        }
+
+        taken, workstream = await workstream_repo.rename_in_project(
+            workstream_id, project_id, "QA"
+        )
+
+        assert taken is False
+        assert workstream.name == "QA"
+        mock_aurora.fetch_one.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reports_taken_name(self, workstream_repo, mock_aurora):
+        """Test that a duplicate name is reported without a workstream."""
+        mock_aurora.fetch_one.return_value = {
+            "name_taken": True,
+            "id": None,
+            "project_id": None,
+            "name": None,
+            "sort_order": None,
+        }
+
+        assert await workstream_repo.rename_in_project(uuid4(), uuid4(), "Dev") == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_reports_not_found(self, workstream_repo, mock_aurora):
+        """Test that no matching workstream in the project returns None."""
+        mock_aurora.fetch_one.return_value = {
+            "name_taken": False,
+            "id": None,
+            "project_id": None,
+            "name": None,
+            "sort_order": None,
+        }
+
+        assert await workstream_repo.rename_in_project(uuid4(), uuid4(), "Dev") == (False, None)
+
+
+# =============================================================================
+# Reorder Tests
+# =============================================================================
+
+class TestReorder:
+    """Tests for reorder method."""
+
+    @pytest.mark.asyncio
+    async def test_reorders_in_one_statement(self, workstream_repo, mock_aurora):
+        """Test that all sort orders are set by a single UPDATE."""
+        project_id = uuid4()
+        ids = [uuid4() for _ in range(5)]
+
+        assert await workstream_repo.reorder(project_id, ids) is True
+
+        mock_aurora.execute.assert_awaited_once()
+        query, *params = mock_aurora.execute.call_args.args
+        assert "WITH ORDINALITY" in query
+        assert params == [project_id, ids]
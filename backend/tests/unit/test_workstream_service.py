@@ -0,0 +1,156 @@
+"""
+Unit tests for src/services/workstream_service.py
+
+Tests workstream service behavior with mocked repositories:
+- Short-TTL caching of workstream lists and its invalidation
+- Keyset paging of workstream lists
+- Renames scoped to a parent project
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.domain.core import Workstream
+from src.services.workstream_service import WorkstreamService
+
+
+class TestWorkstreamListCache:
+    """Tests for WorkstreamService.list_workstreams caching."""
+
+    @pytest.fixture
+    def project_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def workstream_service(self, project_id):
+        """Create WorkstreamService with a mocked workstream repository."""
+        service = WorkstreamService(MagicMock())
+        service._workstream_repo = MagicMock()
+        service._workstream_repo.get_by_project_id = AsyncMock(
+            return_value=[Workstream(id=uuid4(), project_id=project_id, name="Dev")]
+        )
+        service._workstream_repo.reorder = AsyncMock()
+        service._workstream_repo.delete = AsyncMock(return_value=True)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_list_is_cached_per_project(self, workstream_service, project_id):
+        """Repeated listings of a project hit the database once."""
+        await workstream_service.list_workstreams(project_id)
+        await workstream_service.list_workstreams(project_id)
+
+        workstream_service._workstream_repo.get_by_project_id.assert_awaited_once_with(project_id)
+
+    @pytest.mark.asyncio
+    async def test_reorder_returns_fresh_list(self, workstream_service, project_id):
+        """Reordering invalidates the cached list before re-reading it."""
+        await workstream_service.list_workstreams(project_id)
+
+        await workstream_service.reorder_workstreams(project_id, [uuid4()])
+
+        assert workstream_service._workstream_repo.get_by_project_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_project(self, workstream_service, project_id):
+        """Deleting a workstream drops the project's cached list."""
+        await workstream_service.list_workstreams(project_id)
+        await workstream_service.delete_workstream(uuid4(), project_id=project_id)
+        await workstream_service.list_workstreams(project_id)
+
+        assert workstream_service._workstream_repo.get_by_project_id.await_count == 2
+
+
+class TestWorkstreamListPage:
+    """Tests for WorkstreamService.list_workstreams_page."""
+
+    @pytest.fixture
+    def project_id(self):
+        return uuid4()
+
+    def _service(self, project_id, count):
+        service = WorkstreamService(MagicMock())
+        service._workstream_repo = MagicMock()
+        service._workstream_repo.get_by_project_id = AsyncMock(
+            return_value=[
+                Workstream(id=uuid4(), project_id=project_id, name=f"W{i}", sort_order=i)
+                for i in range(count)
+            ]
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_extra_row_yields_next_cursor(self, project_id):
+        """One row past the limit means another page, starting after the last row shown."""
+        service = self._service(project_id, 3)
+
+        page, next_cursor = await service.list_workstreams_page(project_id, limit=2)
+
+        service._workstream_repo.get_by_project_id.assert_awaited_once_with(
+            project_id, limit=3, after=None
+        )
+        assert [w.name for w in page] == ["W0", "W1"]
+        assert next_cursor == page[-1].id
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self, project_id):
+        """A short page is the last one."""
+        service = self._service(project_id, 2)
+
+        page, next_cursor = await service.list_workstreams_page(project_id, limit=2)
+
+        assert len(page) == 2
+        assert next_cursor is None
+
+
+class TestWorkstreamServiceUpdate:
+    """Tests for WorkstreamService.update_workstream scoped to a project."""
+
+    @pytest.fixture
+    def workstream_service(self):
+        """Create WorkstreamService with a mocked workstream repository."""
+        service = WorkstreamService(MagicMock())
+        service._workstream_repo = MagicMock()
+        service._workstream_repo.rename_in_project = AsyncMock()
+        service._workstream_repo.exists_by_name = AsyncMock()
+        service._workstream_repo.get_by_id = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_scoped_rename_is_one_repository_call(self, workstream_service):
+        """A rename within a known project needs no separate reads."""
+        project_id = uuid4()
+        renamed = Workstream(id=uuid4(), project_id=project_id, name="QA")
+        workstream_service._workstream_repo.rename_in_project.return_value = (False, renamed)
+
+        result = await workstream_service.update_workstream(
+            renamed.id, name="QA", project_id=project_id
+        )
+
+        assert result.success is True
+        assert result.workstream is renamed
+        workstream_service._workstream_repo.exists_by_name.assert_not_called()
+        workstream_service._workstream_repo.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_name_is_rejected(self, workstream_service):
+        """A name already used in the project is reported as a duplicate."""
+        workstream_service._workstream_repo.rename_in_project.return_value = (True, None)
+
+        result = await workstream_service.update_workstream(
+            uuid4(), name="Dev", project_id=uuid4()
+        )
+
+        assert result.success is False
+        assert result.error == "Workstream 'Dev' already exists in this project"
+
+    @pytest.mark.asyncio
+    async def test_missing_workstream_is_not_found(self, workstream_service):
+        """A workstream outside the project is reported as not found."""
+        workstream_service._workstream_repo.rename_in_project.return_value = (False, None)
+
+        result = await workstream_service.update_workstream(
+            uuid4(), name="Dev", project_id=uuid4()
+        )
+
+        assert result.error == "Workstream not found"
@@ -38,4 +38,5 @@ export interface ProjectUpdate {
 export interface ProjectListResponse {
   projects: Project[]
   total: number
+  next_cursor: string | null
 }
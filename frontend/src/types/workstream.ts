@@ -29,4 +29,5 @@ export interface WorkstreamReorder {
 // Response from listing workstreams
 export interface WorkstreamListResponse {
   workstreams: Workstream[]
+  next_cursor: string | null
 }